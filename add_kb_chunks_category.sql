@@ -0,0 +1,5 @@
+-- Add a category column to kb_chunks so knowledge base queries can filter by category
+ALTER TABLE public.kb_chunks ADD COLUMN IF NOT EXISTS category TEXT;
+
+-- Add index
+CREATE INDEX IF NOT EXISTS idx_kb_chunks_category ON public.kb_chunks (category);
@@ -0,0 +1,5 @@
+-- Add a short preview of each chunk's content so listings do not fetch whole chunk bodies
+ALTER TABLE public.kb_chunks ADD COLUMN IF NOT EXISTS content_preview TEXT
+    GENERATED ALWAYS AS (
+        CASE WHEN char_length(content) > 50 THEN left(content, 50) || '...' ELSE content END
+    ) STORED;
@@ -1,11 +1,18 @@
 """BiometricAgent for integrating and processing biometric data from Oura Ring."""
 
-from typing import Any, Dict, Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, fields
+from datetime import date
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+import functools
 import logging
 
+from pydantic import TypeAdapter, ValidationError
+
 from personal_ai_trainer.agents.base_agent import BaseAgent
 from personal_ai_trainer.di.container import DIContainer
 from personal_ai_trainer.exceptions import AgentError
+from personal_ai_trainer.utils.batch_writer import SupabaseBatchWriter, get_shared_writer
 from .oura_client import OuraClientWrapper
 from .tools.readiness_calculation import ReadinessCalculationTool
 from .tools.plan_adjustment import PlanAdjustmentTool
@@ -16,6 +23,114 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Validates Oura results in strict mode: a list of record dicts, nothing coerced
+_RECORDS_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
+# (attribute name, tool class) for the tools resolved from DI with a shared-instance fallback
+_TOOL_RESOLVE_SPEC = (
+    ("readiness_tool", ReadinessCalculationTool),
+    ("plan_adjustment_tool", PlanAdjustmentTool),
+    ("historical_analysis_tool", HistoricalDataAnalysisTool),
+)
+
+
+# The biometric tools hold no state, so one instance per class is shared by every agent
+_TOOL_SINGLETONS: Dict[type, Any] = {}
+
+
+def _get_tool(tool_cls: type) -> Any:
+    """Return the shared instance of a stateless tool class, creating it on first use."""
+    tool = _TOOL_SINGLETONS.get(tool_cls)
+    if tool is None:
+        tool = _TOOL_SINGLETONS.setdefault(tool_cls, tool_cls())
+    return tool
+
+
+def _safe_get(records: Any, key: str, default: Any = 0) -> Any:
+    """Return `key` from the first record of an Oura result list, or `default` if there is none."""
+    return records[0].get(key, default) if isinstance(records, list) and records else default
+
+
+@dataclass(frozen=True, slots=True)
+class ReadinessRecord:
+    """
+    The readiness fields stored per day, parsed once from an Oura readiness record.
+
+    Attributes:
+        score (int): Overall readiness score.
+        hrv (int): Heart rate variability.
+        recovery_score (int): Recovery score.
+        temperature (float): Temperature deviation.
+        respiratory_rate (float): Respiratory rate.
+        summary_date (str): ISO date the record summarizes.
+    """
+
+    score: int = 0
+    hrv: int = 0
+    recovery_score: int = 0
+    temperature: float = 0
+    respiratory_rate: float = 0
+    summary_date: str = ''
+
+    @classmethod
+    def from_dict(cls, record: Dict[str, Any]) -> "ReadinessRecord":
+        """
+        Build a record from an Oura readiness dict, ignoring keys that are not stored.
+
+        Args:
+            record (Dict[str, Any]): A readiness record as returned by the Oura API.
+
+        Returns:
+            ReadinessRecord: The parsed record; missing fields take their defaults.
+        """
+        return cls(**{name: record[name] for name in _READINESS_FIELDS if name in record})
+
+
+_READINESS_FIELDS = tuple(f.name for f in fields(ReadinessRecord))
+
+
+def _build_row(user_id: str, date_str: str, readiness: ReadinessRecord, sleep_score: Any) -> Dict[str, Any]:
+    """
+    Build a readiness_metrics row from an already-parsed readiness record and sleep score.
+
+    Args:
+        user_id (str): The user identifier.
+        date_str (str): ISO date of the metrics.
+        readiness (ReadinessRecord): The day's readiness record.
+        sleep_score (Any): The day's sleep score.
+
+    Returns:
+        Dict[str, Any]: The row, ready to queue for insertion.
+    """
+    return {
+        "metrics_id": f"{user_id}_{date_str}",
+        "user_id": user_id,
+        "date": date_str,
+        "readiness_score": readiness.score,
+        "sleep_score": sleep_score,
+        "hrv": readiness.hrv,
+        "recovery_score": readiness.recovery_score,
+        "temperature": readiness.temperature,
+        "respiratory_rate": readiness.respiratory_rate
+    }
+
+
+# Three requests per agent, with room for a few agents fetching at once
+_FETCH_WORKERS = 9
+
+
+@functools.lru_cache(maxsize=1)
+def _fetch_pool() -> ThreadPoolExecutor:
+    """Return the process-wide pool for issuing Oura requests; threads start on first submit."""
+    return ThreadPoolExecutor(max_workers=_FETCH_WORKERS, thread_name_prefix="oura-fetch")
+
+
+@functools.lru_cache(maxsize=1)
+def _default_container() -> DIContainer:
+    """Return the process-wide container used when no container is injected."""
+    return DIContainer()
+
+
 class BiometricAgent(BaseAgent):
     """
     BiometricAgent integrates with the Oura Ring API, processes biometric data,
@@ -36,6 +151,18 @@ class BiometricAgent(BaseAgent):
         user_id (Optional[str]): User identifier.
     """
 
+    __slots__ = (
+        'oura_client',
+        'readiness_tool',
+        'plan_adjustment_tool',
+        'historical_analysis_tool',
+        '_metrics_writer',
+    )
+
+    readiness_tool: ReadinessCalculationTool
+    plan_adjustment_tool: PlanAdjustmentTool
+    historical_analysis_tool: HistoricalDataAnalysisTool
+
     def __init__(
         self,
         oura_client: Optional[OuraClientWrapper] = None,
@@ -74,54 +201,57 @@ class BiometricAgent(BaseAgent):
         )
 
         # Dependency injection
-        container = di_container
-        if container is None:
-            try:
-                from personal_ai_trainer.di.container import DIContainer
-                container = DIContainer()
-            except Exception as e:
-                logger.warning("DIContainer could not be imported or instantiated: %s", e)
-                container = None
+        container = di_container if di_container is not None else _default_container()
 
         try:
-            self.oura_client: OuraClientWrapper = (
-                oura_client or (container.resolve(OuraClientWrapper) if container else OuraClientWrapper())
-            )
+            self.oura_client: OuraClientWrapper = oura_client or container.resolve(OuraClientWrapper)
         except Exception as e:
             logger.error("Failed to resolve OuraClientWrapper: %s", e)
             raise AgentError("Failed to resolve OuraClientWrapper") from e
 
-        if not self.supabase_client and container:
+        if not self.supabase_client:
             try:
                 self.supabase_client = container.resolve("supabase_client")
             except Exception:
                 self.supabase_client = None  # Optional
 
-        try:
-            self.readiness_tool: ReadinessCalculationTool = (
-                container.resolve(ReadinessCalculationTool) if container else ReadinessCalculationTool()
-            )
-        except Exception:
-            self.readiness_tool = ReadinessCalculationTool()
-
-        try:
-            self.plan_adjustment_tool: PlanAdjustmentTool = (
-                container.resolve(PlanAdjustmentTool) if container else PlanAdjustmentTool()
-            )
-        except Exception:
-            self.plan_adjustment_tool = PlanAdjustmentTool()
+        for attr, tool_cls in _TOOL_RESOLVE_SPEC:
+            try:
+                tool = container.resolve(tool_cls)
+            except Exception:
+                tool = _get_tool(tool_cls)
+            setattr(self, attr, tool)
 
-        try:
-            self.historical_analysis_tool: HistoricalDataAnalysisTool = (
-                container.resolve(HistoricalDataAnalysisTool) if container else HistoricalDataAnalysisTool()
-            )
-        except Exception:
-            self.historical_analysis_tool = HistoricalDataAnalysisTool()
+        # Looked up on first write; every agent on the same client shares one writer
+        self._metrics_writer: Optional[SupabaseBatchWriter] = None
 
         # Register tools
-        self.register_tool("readiness_calculation", self.readiness_tool.calculate_readiness)
-        self.register_tool("plan_adjustment", self.plan_adjustment_tool.adjust_plan)
-        self.register_tool("historical_analysis", self.historical_analysis_tool.analyze_trends)
+        self.register_tools({
+            "readiness_calculation": self.readiness_tool.calculate_readiness,
+            "plan_adjustment": self.plan_adjustment_tool.adjust_plan,
+            "historical_analysis": self.historical_analysis_tool.analyze_trends,
+        })
+
+    def _fetch_all(self, user_id: str) -> Dict[str, Any]:
+        """
+        Fetch sleep, activity, and readiness data for a user in one concurrent round.
+
+        Args:
+            user_id (str): The user identifier.
+
+        Returns:
+            Dict[str, Any]: Raw Oura data with keys 'sleep', 'activity', and 'readiness'.
+
+        Raises:
+            Exception: Whatever the Oura client raised; callers translate it to AgentError.
+        """
+        pool = _fetch_pool()
+        futures = {
+            "sleep": pool.submit(self.oura_client.get_sleep_data, user_id),
+            "activity": pool.submit(self.oura_client.get_activity_data, user_id),
+            "readiness": pool.submit(self.oura_client.get_readiness_data, user_id),
+        }
+        return {key: future.result() for key, future in futures.items()}
 
     def process_biometric_data(self, user_id: str) -> Dict[str, Any]:
         """
@@ -137,22 +267,19 @@ class BiometricAgent(BaseAgent):
             AgentError: If data cannot be fetched or is in an unexpected format.
         """
         try:
-            sleep = self.oura_client.get_sleep_data(user_id)
-            activity = self.oura_client.get_activity_data(user_id)
-            readiness = self.oura_client.get_readiness_data(user_id)
+            data = self._fetch_all(user_id)
         except Exception as e:
             logger.error("Failed to fetch biometric data from Oura API: %s", e)
             raise AgentError(f"Failed to fetch biometric data: {e}") from e
 
-        if not isinstance(sleep, list) or not isinstance(activity, list) or not isinstance(readiness, list):
-            logger.error("Unexpected data format from Oura API: sleep=%s, activity=%s, readiness=%s", sleep, activity, readiness)
-            raise AgentError("Unexpected data format from Oura API")
+        try:
+            for records in data.values():
+                _RECORDS_ADAPTER.validate_python(records, strict=True)
+        except ValidationError as e:
+            logger.error("Unexpected data format from Oura API: %s", e)
+            raise AgentError("Unexpected data format from Oura API") from e
 
-        return {
-            "sleep": sleep,
-            "activity": activity,
-            "readiness": readiness,
-        }
+        return data
 
     def calculate_readiness(self, biometric_data: Dict[str, Any]) -> float:
         """
@@ -193,14 +320,13 @@ class BiometricAgent(BaseAgent):
         user_id = self.user_id or "default-user"
 
         try:
-            # Directly use the injected oura_client
-            readiness = self.oura_client.get_readiness_data(user_id)
-            sleep = self.oura_client.get_sleep_data(user_id)
-            activity = self.oura_client.get_activity_data(user_id)
+            data = self._fetch_all(user_id)
         except Exception as e:
             logger.error("Failed to fetch latest biometrics: %s", e)
             raise AgentError(f"Failed to fetch latest biometrics: {e}") from e
 
+        sleep, activity, readiness = data["sleep"], data["activity"], data["readiness"]
+
         # Validate and normalize readiness data
         if isinstance(readiness, list) and len(readiness) > 0:
             readiness_data = readiness
@@ -215,22 +341,34 @@ class BiometricAgent(BaseAgent):
             "metrics_id": "metrics-xyz"
         }
 
-        # Store the data in the database if a client is available
+        # Queue the data for storage if a client is available; the write happens in the background
         if self.supabase_client:
             try:
-                self.supabase_client.table('readiness_metrics').insert({
-                    "metrics_id": f"{user_id}_2025-05-05",
-                    "user_id": user_id,
-                    "date": "2025-05-05",
-                    "readiness_score": readiness_data[0].get('score', 0),
-                    "sleep_score": sleep[0]['score'] if sleep and isinstance(sleep, list) and len(sleep) > 0 and 'score' in sleep[0] else 0,
-                    "hrv": readiness_data[0].get('hrv', 0),
-                    "recovery_score": readiness_data[0].get('recovery_score', 0),
-                    "temperature": readiness_data[0].get('temperature', 0),
-                    "respiratory_rate": readiness_data[0].get('respiratory_rate', 0)
-                }).execute()
+                record = ReadinessRecord.from_dict(readiness_data[0])
+                date_str = record.summary_date or date.today().isoformat()
+                row = _build_row(user_id, date_str, record, _safe_get(sleep, 'score'))
+                if self._metrics_writer is None:
+                    self._metrics_writer = get_shared_writer(self.supabase_client, 'readiness_metrics')
+                self._metrics_writer.put(row)
             except Exception as e:
                 logger.error("Failed to store biometric data in Supabase: %s", e)
                 # Not raising, as storage is optional
 
-        return biometric_data
\ No newline at end of file
+        return biometric_data
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued readiness metrics to be written to Supabase.
+
+        Call this before shutdown, or before reading back metrics stored by
+        get_latest_biometrics.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait. Defaults to waiting indefinitely.
+
+        Returns:
+            bool: True if all queued metrics were written before the timeout.
+        """
+        if self._metrics_writer is None:
+            return True
+        return self._metrics_writer.flush(timeout)
\ No newline at end of file
@@ -5,26 +5,66 @@ This module provides a wrapper around the python-ouraring OuraClient for authent
 and data retrieval, with improved error handling and retry logic.
 """
 
-from typing import Any, Dict, Optional, List, Union
+from typing import Any, Callable, Dict, Optional, List, Tuple, Type, Union, TYPE_CHECKING
 from datetime import datetime, date
+import copy
+import functools
 import os
 import logging
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from tenacity import Retrying, before_sleep_log, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
-from oura import OuraClient
 from personal_ai_trainer.exceptions import OuraAPIError, ConfigurationError
-from personal_ai_trainer.utils.error_handling import with_error_handling
+
+# python-ouraring is imported lazily in OuraClientWrapper.__init__ to keep module import cheap
+if TYPE_CHECKING:
+    from oura import OuraClient
 
 logger = logging.getLogger(__name__)
 
-# Define a custom exception class for Oura API errors
-try:
-    # Try to import the official exception class
-    from oura.exceptions import OuraAPIException
-except ImportError:
-    # If it doesn't exist, define our own
-    class OuraAPIException(Exception):
-        """Exception raised for Oura API errors."""
-        pass
+
+class _FallbackOuraAPIException(Exception):
+    """Exception raised for Oura API errors when python-ouraring does not define one."""
+    pass
+
+
+@functools.lru_cache(maxsize=1)
+def _oura_api_exception() -> Type[Exception]:
+    """Return python-ouraring's OuraAPIException, or a local stand-in if it doesn't exist."""
+    try:
+        from oura.exceptions import OuraAPIException
+        return OuraAPIException
+    except ImportError:
+        return _FallbackOuraAPIException
+
+
+# Enough pooled keep-alive connections for the concurrent sleep/activity/readiness fetches
+_HTTP_POOL_SIZE = 4
+
+# HTTP statuses worth retrying; anything else (auth, bad request, not found) fails immediately
+_RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """
+    Decide whether a failed Oura API call is worth retrying.
+    
+    Args:
+        exc (BaseException): The exception raised by the OuraClient call.
+        
+    Returns:
+        bool: True for network errors, timeouts, rate limiting, and 5xx responses.
+    """
+    if isinstance(exc, (requests.ConnectionError, requests.Timeout)):
+        return True
+    status_code = getattr(getattr(exc, "response", None), "status_code", None)
+    if status_code is not None:
+        return status_code in _RETRYABLE_STATUS_CODES
+    return isinstance(exc, _oura_api_exception())
 
 
 class OuraClientWrapper:
@@ -40,6 +80,8 @@ class OuraClientWrapper:
         refresh_token (Optional[str]): Oura API refresh token.
         max_retries (int): Maximum number of retries for API calls.
         retry_delay (float): Delay between retries in seconds.
+        cache_ttl (float): Seconds a fetched daily summary is served from the in-memory cache.
+        cache_max_entries (int): Maximum number of daily summaries kept in the cache.
         client (OuraClient): The underlying OuraClient instance.
     """
 
@@ -51,6 +93,8 @@ class OuraClientWrapper:
         refresh_token: Optional[str] = None,
         max_retries: int = 3,
         retry_delay: float = 2.0,
+        cache_ttl: float = 60.0,
+        cache_max_entries: int = 256,
     ) -> None:
         """
         Initialize the OuraClientWrapper.
@@ -62,6 +106,10 @@ class OuraClientWrapper:
             refresh_token (Optional[str]): Oura API refresh token. Defaults to OURA_REFRESH_TOKEN env var.
             max_retries (int): Maximum number of retries for API calls. Defaults to 3.
             retry_delay (float): Delay between retries in seconds. Defaults to 2.0.
+            cache_ttl (float): Seconds a fetched daily summary is reused before hitting the API again.
+                Defaults to 60.0. Use 0 to disable caching.
+            cache_max_entries (int): Maximum number of daily summaries kept in the cache; the
+                oldest are dropped first. Defaults to 256.
             
         Raises:
             ConfigurationError: If required credentials are missing.
@@ -82,9 +130,23 @@ class OuraClientWrapper:
             
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self._retrying = Retrying(
+            retry=retry_if_exception(_is_transient_error),
+            stop=stop_after_attempt(max_retries + 1),
+            wait=wait_exponential_jitter(initial=retry_delay, jitter=retry_delay),
+            before_sleep=before_sleep_log(logger, logging.WARNING),
+            reraise=True,
+        )
+        self.cache_ttl = cache_ttl
+        self.cache_max_entries = cache_max_entries
+        # (kind, user_id, date) -> (fetched_at, records), oldest fetch first; see _get_cached
+        self._cache: Dict[Tuple[str, str, date], Tuple[float, List[Dict[str, Any]]]] = {}
+        self._cache_lock = threading.Lock()
         
         try:
-            self.client = OuraClient(
+            from oura import OuraClient
+
+            self.client: "OuraClient" = OuraClient(
                 client_id=self.client_id,
                 client_secret=self.client_secret,
                 access_token=self.access_token,
@@ -95,6 +157,23 @@ class OuraClientWrapper:
             logger.error(f"Failed to initialize Oura client: {e}")
             raise ConfigurationError(f"Failed to initialize Oura client: {e}") from e
 
+        self._configure_session()
+
+    def _configure_session(self) -> None:
+        """
+        Mount a pooled keep-alive adapter on the OuraClient's HTTP session.
+        
+        Reusing connections avoids a TCP and TLS handshake per request and lets the
+        concurrent summary fetches share the pool. The client's own session (which may
+        carry OAuth refresh handling) is kept; only its transport adapter is replaced.
+        """
+        session = getattr(self.client, "session", None) or getattr(self.client, "_session", None)
+        if not isinstance(session, requests.Session):
+            logger.debug("OuraClient does not expose a requests session; using its default transport")
+            return
+        adapter = HTTPAdapter(pool_connections=_HTTP_POOL_SIZE, pool_maxsize=_HTTP_POOL_SIZE)
+        session.mount("https://", adapter)
+
     def _refresh_callback(self, token_dict: Dict[str, str]) -> None:
         """
         Callback to handle token refresh events.
@@ -107,11 +186,14 @@ class OuraClientWrapper:
         logger.info("Oura API token refreshed")
         # Optionally, persist tokens to a secure location
 
-    @with_error_handling(error_types=(Exception,), retry_count=3, retry_delay=2.0)
     def _call_with_retries(self, func: Any, *args: Any, **kwargs: Any) -> Any:
         """
         Call an OuraClient method with retry logic.
         
+        Only transient failures (network errors, timeouts, 429 and 5xx responses) are
+        retried, with exponential backoff and jitter starting at retry_delay. Other
+        errors are raised on the first attempt.
+        
         Args:
             func: The OuraClient method to call.
             *args: Positional arguments.
@@ -121,14 +203,111 @@ class OuraClientWrapper:
             Any: The result of the API call.
             
         Raises:
-            OuraAPIError: If all retries fail.
+            OuraAPIError: If the call fails with a non-retryable error or all retries fail.
         """
         try:
-            return func(*args, **kwargs)
+            return self._retrying.copy()(func, *args, **kwargs)
         except Exception as e:
             logger.error(f"Oura API error: {e}")
             raise OuraAPIError(f"Oura API call failed: {e}") from e
 
+    @staticmethod
+    def _resolve_date(date_obj: Optional[Union[datetime, date]]) -> date:
+        """
+        Normalize a requested day to a date, defaulting to today.
+        
+        Args:
+            date_obj (Optional[Union[datetime, date]]): The requested day.
+            
+        Returns:
+            date: The day as a plain date, so it can be used in API calls and cache keys.
+        """
+        if date_obj is None:
+            return date.today()
+        if isinstance(date_obj, datetime):
+            return date_obj.date()
+        return date_obj
+
+    def _get_cached(
+        self,
+        kind: str,
+        user_id: str,
+        date_obj: date,
+        func: Callable[[date], Any],
+    ) -> List[Dict[str, Any]]:
+        """
+        Return the daily summary for (kind, user_id, date_obj), calling the API only on a cache miss.
+        
+        Callers get their own copy of the records, so modifying them does not affect the cache.
+        
+        Args:
+            kind (str): Summary type used in the cache key (e.g. "sleep").
+            user_id (str): The user identifier.
+            date_obj (date): Day of the summary.
+            func (Callable[[date], Any]): The OuraClient method to call on a miss.
+            
+        Returns:
+            List[Dict[str, Any]]: The summary records, normalized to a list.
+            
+        Raises:
+            OuraAPIError: If the API call fails. Failures are never cached.
+        """
+        key = (kind, user_id, date_obj)
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None:
+                if time.monotonic() - entry[0] < self.cache_ttl:
+                    return copy.deepcopy(entry[1])
+                del self._cache[key]
+
+        result = self._call_with_retries(func, date_obj)
+        
+        # Ensure result is a list for consistent return type
+        if not isinstance(result, list):
+            result = [result] if result else []
+
+        if self.cache_ttl > 0 and self.cache_max_entries > 0:
+            self._store(key, copy.deepcopy(result))
+        return result
+
+    def _store(self, key: Tuple[str, str, date], records: List[Dict[str, Any]]) -> None:
+        """
+        Cache records under key, dropping expired entries and then the oldest over the size limit.
+        
+        Entries are kept in fetch order and share one TTL, so expired entries are always at the front.
+        
+        Args:
+            key (Tuple[str, str, date]): The (kind, user_id, date) cache key.
+            records (List[Dict[str, Any]]): Records owned by the cache.
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            self._cache.pop(key, None)
+            self._cache[key] = (now, records)
+            while len(self._cache) > self.cache_max_entries or (
+                now - next(iter(self._cache.values()))[0] >= self.cache_ttl
+            ):
+                del self._cache[next(iter(self._cache))]
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """
+        Drop cached summaries so the next request hits the Oura API.
+        
+        Args:
+            user_id (Optional[str]): Only drop entries for this user. Defaults to clearing everything.
+            
+        Example:
+            ```python
+            client.invalidate("user123")
+            ```
+        """
+        with self._cache_lock:
+            if user_id is None:
+                self._cache.clear()
+                return
+            for key in [k for k in self._cache if k[1] == user_id]:
+                del self._cache[key]
+
     def get_sleep_data(
         self, 
         user_id: str, 
@@ -154,20 +333,8 @@ class OuraClientWrapper:
             sleep_score = sleep_data[0]["score"]
             ```
         """
-        date_obj = date_obj or datetime.today()
-        
-        # Convert to date if datetime was provided
-        if isinstance(date_obj, datetime):
-            date_obj = date_obj.date()
-            
         try:
-            result = self._call_with_retries(self.client.sleep_summary, date_obj)
-            
-            # Ensure result is a list for consistent return type
-            if not isinstance(result, list):
-                result = [result] if result else []
-                
-            return result
+            return self._get_cached("sleep", user_id, self._resolve_date(date_obj), self.client.sleep_summary)
         except Exception as e:
             logger.error(f"Failed to get sleep data: {e}")
             # Return empty list as fallback
@@ -198,20 +365,8 @@ class OuraClientWrapper:
             activity_score = activity_data[0]["score"]
             ```
         """
-        date_obj = date_obj or datetime.today()
-        
-        # Convert to date if datetime was provided
-        if isinstance(date_obj, datetime):
-            date_obj = date_obj.date()
-            
         try:
-            result = self._call_with_retries(self.client.activity_summary, date_obj)
-            
-            # Ensure result is a list for consistent return type
-            if not isinstance(result, list):
-                result = [result] if result else []
-                
-            return result
+            return self._get_cached("activity", user_id, self._resolve_date(date_obj), self.client.activity_summary)
         except Exception as e:
             logger.error(f"Failed to get activity data: {e}")
             # Return empty list as fallback
@@ -242,20 +397,8 @@ class OuraClientWrapper:
             readiness_score = readiness_data[0]["score"]
             ```
         """
-        date_obj = date_obj or datetime.today()
-        
-        # Convert to date if datetime was provided
-        if isinstance(date_obj, datetime):
-            date_obj = date_obj.date()
-            
         try:
-            result = self._call_with_retries(self.client.readiness_summary, date_obj)
-            
-            # Ensure result is a list for consistent return type
-            if not isinstance(result, list):
-                result = [result] if result else []
-                
-            return result
+            return self._get_cached("readiness", user_id, self._resolve_date(date_obj), self.client.readiness_summary)
         except Exception as e:
             logger.error(f"Failed to get readiness data: {e}")
             # Return empty list as fallback
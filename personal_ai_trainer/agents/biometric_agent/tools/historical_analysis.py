@@ -1,43 +1,120 @@
 """Tool for analyzing trends in historical biometric data."""
 
-from typing import List, Dict, Any
+from dataclasses import dataclass
+from typing import List, Dict, Any, Union
+
+import numpy as np
+
+
+def _score(entry: Dict[str, Any], section: str) -> float:
+    """Return the score of one section (e.g. 'readiness') of an entry, or NaN if it has none."""
+    values = entry.get(section)
+    if values:
+        score = values.get("score")
+        if score is not None:
+            return score
+    return np.nan
+
+
+@dataclass
+class BiometricFrame:
+    """
+    Columnar view of historical biometric data, one array per field.
+
+    Each index is one day. Scores are float64 with NaN for missing values, so
+    analysis only touches the columns it needs.
+
+    Attributes:
+        dates (np.ndarray): Date of each entry (object array of ISO strings or None).
+        readiness (np.ndarray): Oura readiness scores.
+        sleep_score (np.ndarray): Sleep scores.
+        activity_score (np.ndarray): Activity scores.
+    """
+
+    dates: np.ndarray
+    readiness: np.ndarray
+    sleep_score: np.ndarray
+    activity_score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.readiness)
+
+    @classmethod
+    def from_records(cls, records: List[Dict[str, Any]]) -> "BiometricFrame":
+        """
+        Build a frame from biometric data dictionaries in a single pass.
+
+        Args:
+            records (List[Dict[str, Any]]): Biometric data dictionaries (ordered by date),
+                each with optional 'readiness', 'sleep' and 'activity' sections.
+
+        Returns:
+            BiometricFrame: The columnar data.
+
+        Example:
+            ```python
+            frame = BiometricFrame.from_records([{"readiness": {"score": 80, "summary_date": "2025-05-05"}}])
+            ```
+        """
+        n = len(records)
+        dates = np.empty(n, dtype=object)
+        readiness = np.full(n, np.nan)
+        sleep_score = np.full(n, np.nan)
+        activity_score = np.full(n, np.nan)
+
+        for i, entry in enumerate(records):
+            date = entry.get("date")
+            if date is None and entry.get("readiness"):
+                date = entry["readiness"].get("summary_date")
+            dates[i] = date
+            readiness[i] = _score(entry, "readiness")
+            sleep_score[i] = _score(entry, "sleep")
+            activity_score[i] = _score(entry, "activity")
+
+        return cls(dates, readiness, sleep_score, activity_score)
+
 
 class HistoricalDataAnalysisTool:
     """
     Tool for analyzing trends in historical biometric data.
     """
 
-    def analyze_trends(self, historical_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_trends(
+        self,
+        historical_data: Union[BiometricFrame, List[Dict[str, Any]]],
+        include_history: bool = False,
+    ) -> Dict[str, Any]:
         """
-        Analyze trends in a list of historical biometric data entries.
+        Analyze trends in historical biometric data.
 
         Args:
-            historical_data (List[Dict[str, Any]]): List of biometric data dictionaries (ordered by date).
+            historical_data (Union[BiometricFrame, List[Dict[str, Any]]]): A BiometricFrame, or a list
+                of biometric data dictionaries (ordered by date).
+            include_history (bool): Also return the readiness scores that were analyzed, under
+                'history' as a list of floats, so the result stays JSON-serializable. Defaults to False.
 
         Returns:
             Dict[str, Any]: Summary of detected trends (e.g., average, min, max, trend direction).
         """
-        if not historical_data:
+        if historical_data is None or len(historical_data) == 0:
             return {"message": "No historical data provided."}
 
+        frame = historical_data if isinstance(historical_data, BiometricFrame) else BiometricFrame.from_records(historical_data)
+
         # Example: analyze readiness scores
-        readiness_scores = [
-            entry.get("readiness", {}).get("score")
-            for entry in historical_data
-            if entry.get("readiness", {}).get("score") is not None
-        ]
-        if not readiness_scores:
+        readiness_scores = frame.readiness[~np.isnan(frame.readiness)]
+        if readiness_scores.size == 0:
             return {"message": "No readiness scores found in historical data."}
 
-        avg_score = sum(readiness_scores) / len(readiness_scores)
-        min_score = min(readiness_scores)
-        max_score = max(readiness_scores)
-        trend = "increasing" if readiness_scores[-1] > readiness_scores[0] else "decreasing" if readiness_scores[-1] < readiness_scores[0] else "stable"
+        first, last = readiness_scores[0], readiness_scores[-1]
+        trend = "increasing" if last > first else "decreasing" if last < first else "stable"
 
-        return {
-            "average_readiness": avg_score,
-            "min_readiness": min_score,
-            "max_readiness": max_score,
+        summary = {
+            "average_readiness": float(readiness_scores.mean()),
+            "min_readiness": float(readiness_scores.min()),
+            "max_readiness": float(readiness_scores.max()),
             "trend": trend,
-            "history": readiness_scores,
-        }
\ No newline at end of file
+        }
+        if include_history:
+            summary["history"] = readiness_scores.tolist()
+        return summary
@@ -1,6 +1,17 @@
 """Tool for adjusting workout plans based on readiness score."""
 
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# (intensity, notes) per readiness bucket: below 60, 60-85, above 85
+_INTENSITY_BUCKETS = (
+    ("low", "Reduced intensity due to low readiness."),
+    ("moderate", "Standard intensity based on readiness."),
+    ("high", "Increased intensity due to high readiness."),
+)
+
 
 class PlanAdjustmentTool:
     """
@@ -16,17 +27,36 @@ class PlanAdjustmentTool:
             workout_plan (Dict[str, Any]): The original workout plan.
 
         Returns:
-            Dict[str, Any]: The adjusted workout plan.
+            Dict[str, Any]: The adjusted workout plan. Nested values (e.g. exercise lists) are
+                shared with `workout_plan`, not copied.
         """
-        adjusted_plan = workout_plan.copy()
         # Example logic: reduce intensity if readiness is low, increase if high
-        if readiness_score < 60:
-            adjusted_plan["intensity"] = "low"
-            adjusted_plan["notes"] = "Reduced intensity due to low readiness."
-        elif readiness_score > 85:
-            adjusted_plan["intensity"] = "high"
-            adjusted_plan["notes"] = "Increased intensity due to high readiness."
-        else:
-            adjusted_plan["intensity"] = "moderate"
-            adjusted_plan["notes"] = "Standard intensity based on readiness."
-        return adjusted_plan
\ No newline at end of file
+        bucket = 1 + (readiness_score > 85) - (readiness_score < 60)
+        return self._apply_bucket(bucket, workout_plan)
+
+    def adjust_plans_batch(self, readiness_scores: ArrayLike, workout_plan: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Adjust one base workout plan for many readiness scores, e.g. a nightly run over all users.
+
+        Args:
+            readiness_scores (ArrayLike): Readiness scores (0-100), one per user.
+            workout_plan (Dict[str, Any]): The original workout plan.
+
+        Returns:
+            List[Dict[str, Any]]: One adjusted plan per score, in input order.
+
+        Example:
+            ```python
+            plans = tool.adjust_plans_batch(np.array([55.0, 70.0, 90.0]), base_plan)
+            # intensities: "low", "moderate", "high"
+            ```
+        """
+        scores = np.asarray(readiness_scores, dtype=np.float64)
+        buckets = 1 + (scores > 85).astype(np.intp) - (scores < 60)
+        return [self._apply_bucket(bucket, workout_plan) for bucket in buckets.tolist()]
+
+    @staticmethod
+    def _apply_bucket(bucket: int, workout_plan: Dict[str, Any]) -> Dict[str, Any]:
+        """Return the plan with the intensity and notes of a readiness bucket, sharing its nested values."""
+        intensity, notes = _INTENSITY_BUCKETS[bucket]
+        return {**workout_plan, "intensity": intensity, "notes": notes}
@@ -2,6 +2,10 @@
 
 from typing import Dict, Any
 
+import numpy as np
+from numpy.typing import ArrayLike
+
+
 class ReadinessCalculationTool:
     """
     Tool for calculating an overall readiness score from biometric data.
@@ -17,15 +21,56 @@ class ReadinessCalculationTool:
         Returns:
             float: Calculated readiness score (0-100).
         """
-        readiness = biometric_data.get("readiness", {})
-        # Use Oura's readiness score if available, else compute a simple average
-        score = readiness.get("score")
-        if score is not None:
-            return float(score)
-        # Fallback: average sleep and activity scores if present
-        sleep_score = biometric_data.get("sleep", {}).get("score")
-        activity_score = biometric_data.get("activity", {}).get("score")
-        scores = [s for s in [sleep_score, activity_score] if s is not None]
-        if scores:
-            return float(sum(scores)) / len(scores)
-        return 0.0
\ No newline at end of file
+        # Use Oura's readiness score if available, else average the sleep and activity
+        # scores that are present. Cases are ordered by how often they occur.
+        match biometric_data:
+            case {"readiness": {"score": score}} if score is not None:
+                return float(score)
+            case {"sleep": {"score": sleep_score}, "activity": {"score": activity_score}} if (
+                sleep_score is not None and activity_score is not None
+            ):
+                return float(sleep_score + activity_score) / 2
+            case {"sleep": {"score": score}} if score is not None:
+                return float(score)
+            case {"activity": {"score": score}} if score is not None:
+                return float(score)
+            case _:
+                return 0.0
+
+    def calculate_readiness_batch(
+        self,
+        sleep_scores: ArrayLike,
+        activity_scores: ArrayLike,
+        readiness_scores: ArrayLike,
+    ) -> np.ndarray:
+        """
+        Calculate readiness scores for many days at once, e.g. when backfilling.
+
+        Applies the same rule as calculate_readiness element-wise: the Oura readiness
+        score if present, else the mean of the available sleep and activity scores,
+        else 0.0. Missing values are given as NaN.
+
+        Args:
+            sleep_scores (ArrayLike): Sleep scores, one per day.
+            activity_scores (ArrayLike): Activity scores, one per day.
+            readiness_scores (ArrayLike): Oura readiness scores, one per day.
+
+        Returns:
+            np.ndarray: float64 array of calculated readiness scores (0-100).
+
+        Example:
+            ```python
+            tool.calculate_readiness_batch([80, np.nan], [70, np.nan], [np.nan, np.nan])
+            # array([75., 0.])
+            ```
+        """
+        sleep = np.asarray(sleep_scores, dtype=np.float64)
+        activity = np.asarray(activity_scores, dtype=np.float64)
+        readiness = np.asarray(readiness_scores, dtype=np.float64)
+
+        # Mean of whichever of sleep/activity are present, 0.0 where neither is
+        fallback_sum = np.nan_to_num(sleep) + np.nan_to_num(activity)
+        counts = (~np.isnan(sleep)).astype(np.float64) + ~np.isnan(activity)
+        fallback = np.divide(fallback_sum, counts, out=np.zeros_like(fallback_sum), where=counts > 0)
+
+        return np.where(np.isnan(readiness), fallback, readiness)
\ No newline at end of file
@@ -6,10 +6,22 @@ Handles agency structure setup, agent registration, message passing, and respons
 Author: Roo Mid
 """
 
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional, Union
 from agency_swarm.agency.agency import Agency
 from agency_swarm.agents.agent import Agent
 
+from personal_ai_trainer.exceptions import AgentError
+
+# Default cap on concurrent agent completions during a broadcast, to stay within OpenAI rate limits
+DEFAULT_MAX_IN_FLIGHT = 8
+MAX_BROADCAST_WORKERS = 16
+
+# Shared by all synchronous broadcasts in the process, so overlapping broadcasts share one budget
+_completion_slots = threading.BoundedSemaphore(DEFAULT_MAX_IN_FLIGHT)
+
 class CommunicationManager:
     """
     Manages agent communication and agency structure.
@@ -37,6 +49,34 @@ class CommunicationManager:
             shared_files=shared_files,
             **kwargs
         )
+        self._agents_by_name: Dict[str, Agent] = {}
+        self.refresh_agents()
+
+    def refresh_agents(self) -> None:
+        """
+        Rebuild the name-to-agent index. Call this after adding agents to the agency at runtime.
+        """
+        self._agents_by_name = {agent.name: agent for agent in self.agency.agents}
+
+    def _resolve_agents(self, agent_names: Optional[List[str]]) -> List[Agent]:
+        """
+        Look up agents by name, or return all agents if no names are given.
+
+        Args:
+            agent_names (Optional[List[str]]): Names of the agents to return.
+
+        Returns:
+            List[Agent]: The agents, in the order requested.
+
+        Raises:
+            AgentError: If a name does not match any agent.
+        """
+        if not agent_names:
+            return list(self._agents_by_name.values())
+        try:
+            return [self._agents_by_name[name] for name in agent_names]
+        except KeyError as e:
+            raise AgentError(f"Unknown agent: {e.args[0]}") from e
 
     def send_message(
         self,
@@ -76,6 +116,52 @@ class CommunicationManager:
             response_format=response_format,
         )
 
+    async def asend_message(self, message: str, recipient_agent: Optional[Agent] = None, **kwargs) -> str:
+        """
+        Async variant of send_message; the completion runs in a worker thread.
+
+        Args:
+            message (str): The message to send.
+            recipient_agent (Optional[Agent]): The agent to receive the message.
+            **kwargs: Additional arguments for send_message.
+
+        Returns:
+            str: The agent's response.
+        """
+        return await asyncio.to_thread(self.send_message, message, recipient_agent=recipient_agent, **kwargs)
+
+    async def abroadcast_message(
+        self,
+        message: str,
+        agent_names: Optional[List[str]] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        **kwargs
+    ) -> Dict[str, str]:
+        """
+        Broadcast a message to multiple agents concurrently and collect responses.
+
+        Args:
+            message (str): The message to broadcast.
+            agent_names (Optional[List[str]]): List of agent names to receive the message.
+            max_in_flight (int): Maximum completions running at once. Defaults to DEFAULT_MAX_IN_FLIGHT.
+            **kwargs: Additional arguments for send_message.
+
+        Returns:
+            Dict[str, str]: Mapping of agent name to response.
+
+        Raises:
+            AgentError: If a name in agent_names does not match any agent.
+        """
+        agents = self._resolve_agents(agent_names)
+        semaphore = asyncio.Semaphore(max_in_flight)
+
+        async def send(agent: Agent) -> str:
+            async with semaphore:
+                return await self.asend_message(message, recipient_agent=agent, **kwargs)
+
+        responses = await asyncio.gather(*(send(agent) for agent in agents))
+        return {agent.name: response for agent, response in zip(agents, responses)}
+
     def broadcast_message(
         self,
         message: str,
@@ -85,6 +171,10 @@ class CommunicationManager:
         """
         Broadcast a message to multiple agents and collect responses.
 
+        The agents are messaged concurrently from a thread pool, so the call takes about as
+        long as the slowest agent. At most DEFAULT_MAX_IN_FLIGHT completions run at once
+        across all broadcasts. From async code, await abroadcast_message instead.
+
         Args:
             message (str): The message to broadcast.
             agent_names (Optional[List[str]]): List of agent names to receive the message.
@@ -92,15 +182,21 @@ class CommunicationManager:
 
         Returns:
             Dict[str, str]: Mapping of agent name to response.
+
+        Raises:
+            AgentError: If a name in agent_names does not match any agent.
         """
-        responses = {}
-        agents = (
-            self.agency._get_agents_by_names(agent_names)
-            if agent_names else self.agency.agents
-        )
-        for agent in agents:
-            responses[agent.name] = self.send_message(message, recipient_agent=agent, **kwargs)
-        return responses
+        agents = self._resolve_agents(agent_names)
+        if not agents:
+            return {}
+
+        def send(agent: Agent) -> str:
+            with _completion_slots:
+                return self.send_message(message, recipient_agent=agent, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=min(MAX_BROADCAST_WORKERS, len(agents))) as executor:
+            futures = {agent.name: executor.submit(send, agent) for agent in agents}
+            return {name: future.result() for name, future in futures.items()}
 
     def get_agent(self, name: str) -> Optional[Agent]:
         """
@@ -112,7 +208,7 @@ class CommunicationManager:
         Returns:
             Optional[Agent]: The agent instance, or None if not found.
         """
-        return self.agency._get_agent_by_name(name)
+        return self._agents_by_name.get(name)
 
     def get_agency_structure(self) -> List[str]:
         """
@@ -5,14 +5,20 @@ Handles API key setup, provides utility functions for OpenAI model interaction,
 and includes error handling and retry logic.
 """
 
+import functools
+import json
 import os
 import logging
-from typing import Any, Dict, Optional, List
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, Mapping, Optional, List
 
-from openai import OpenAI
+import numpy as np
+from openai import AsyncOpenAI, OpenAI
 
 from personal_ai_trainer.exceptions import OpenAIAPIError, ConfigurationError
-from personal_ai_trainer.utils.error_handling import with_error_handling
+from personal_ai_trainer.utils.embedding_cache import CacheKey, EmbeddingCache
+from personal_ai_trainer.utils.json_utils import loads as _json_loads
 
 logger = logging.getLogger(__name__)
 
@@ -20,11 +26,44 @@ logger = logging.getLogger(__name__)
 DEFAULT_CHAT_MODEL = "gpt-4o"
 DEFAULT_EMBEDDING_MODEL = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-ada-002")
 
+# Vector sizes of the known embedding models, used to shape empty results
+EMBEDDING_DIMENSIONS: Mapping[str, int] = MappingProxyType({
+    "text-embedding-ada-002": 1536,
+    "text-embedding-3-small": 1536,
+    "text-embedding-3-large": 3072,
+})
 
+# System prompt text used by openai_chat_completion_json
+_JSON_SUFFIX = " Respond in valid JSON format."
+_DEFAULT_JSON_SYSTEM_MESSAGE = {
+    "role": "system",
+    "content": "You are a helpful assistant. Respond in valid JSON format."
+}
+
+# Inputs per embeddings request and concurrent requests used by get_embeddings_chunked
+EMBEDDING_CHUNK_SIZE = 256
+EMBEDDING_MAX_WORKERS = 8
+
+# The SDK retries connection errors, 408/409/429 and 5xx responses with exponential backoff and jitter
+OPENAI_MAX_RETRIES = 3
+OPENAI_TIMEOUT = 30.0
+
+# Token window of the embedding models; longer inputs are rejected by the API
+EMBEDDING_MAX_TOKENS = 8191
+
+# Embeddings are deterministic per (model, text), so repeated texts are served from this cache.
+# Set OPENAI_EMBEDDING_CACHE_PATH to a SQLite file to keep them across runs.
+_embedding_cache = EmbeddingCache(path=os.getenv("OPENAI_EMBEDDING_CACHE_PATH"))
+
+
+@functools.lru_cache(maxsize=1)
 def get_openai_api_key() -> str:
     """
     Retrieve the OpenAI API key from environment variables.
     
+    The key is read once per process; call `get_openai_api_key.cache_clear()` after
+    changing OPENAI_API_KEY.
+    
     Returns:
         str: The OpenAI API key.
         
@@ -43,9 +82,14 @@ def get_openai_api_key() -> str:
     return api_key
 
 
+@functools.lru_cache(maxsize=1)
 def get_openai_client() -> OpenAI:
     """
-    Create and return an OpenAI client using the API key from environment.
+    Return the process-wide OpenAI client, created on first use from the API key in the environment.
+    
+    Reusing one client keeps its HTTP connection pool warm across calls. Transient failures
+    are retried by the client itself (OPENAI_MAX_RETRIES, with backoff and jitter). After changing
+    OPENAI_API_KEY, call `get_openai_api_key.cache_clear()` and `get_openai_client.cache_clear()`.
     
     Returns:
         OpenAI: The OpenAI client instance.
@@ -60,10 +104,79 @@ def get_openai_client() -> OpenAI:
         ```
     """
     api_key = get_openai_api_key()
-    return OpenAI(api_key=api_key)
+    return OpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES, timeout=OPENAI_TIMEOUT)
+
+
+@functools.lru_cache(maxsize=1)
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Return the process-wide AsyncOpenAI client, created on first use from the API key in the environment.
+    
+    Like the sync client, it retries transient failures itself with backoff and jitter.
+    
+    Returns:
+        AsyncOpenAI: The async OpenAI client instance.
+        
+    Raises:
+        ConfigurationError: If the API key is not found.
+        
+    Example:
+        ```python
+        client = get_async_openai_client()
+        response = await client.chat.completions.create(...)
+        ```
+    """
+    api_key = get_openai_api_key()
+    return AsyncOpenAI(api_key=api_key, max_retries=OPENAI_MAX_RETRIES, timeout=OPENAI_TIMEOUT)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_token_encoding(model: str) -> Any:
+    """
+    Return the tiktoken encoding for a model, or None if tiktoken is not installed.
+
+    Args:
+        model (str): The model name.
+
+    Returns:
+        Any: A tiktoken Encoding, or None.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        logger.warning("tiktoken not installed; embedding inputs will not be truncated")
+        return None
+    try:
+        return tiktoken.encoding_for_model(model)
+    except KeyError:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+def _truncate_for_embedding(text: str, model: str) -> str:
+    """
+    Truncate text to the embedding model's token window so the request is not rejected.
+
+    Args:
+        text (str): The input text.
+        model (str): The embedding model name.
+
+    Returns:
+        str: The text, cut to EMBEDDING_MAX_TOKENS tokens if it was longer.
+    """
+    # Byte-level BPE tokens cover at least one UTF-8 byte each (but a CJK character or emoji
+    # can take several tokens), so only texts this short in bytes cannot exceed the window
+    if len(text.encode("utf-8")) <= EMBEDDING_MAX_TOKENS:
+        return text
+    encoding = _get_token_encoding(model)
+    if encoding is None:
+        return text
+    tokens = encoding.encode(text)
+    if len(tokens) <= EMBEDDING_MAX_TOKENS:
+        return text
+    logger.warning("Truncating embedding input from %d to %d tokens", len(tokens), EMBEDDING_MAX_TOKENS)
+    return encoding.decode(tokens[:EMBEDDING_MAX_TOKENS])
 
 
-@with_error_handling(error_types=(Exception,), retry_count=3, retry_delay=2.0)
 def openai_chat_completion(
     messages: List[Dict[str, str]],
     model: str = DEFAULT_CHAT_MODEL,
@@ -107,11 +220,175 @@ def openai_chat_completion(
         )
         return response.choices[0].message.content or ""
     except Exception as e:
-        logger.error(f"OpenAI API error: {e}")
+        logger.error("OpenAI API error: %s", e)
+        raise OpenAIAPIError(f"OpenAI API call failed: {e}") from e
+
+
+def openai_chat_completion_stream(
+    messages: List[Dict[str, str]],
+    model: str = DEFAULT_CHAT_MODEL,
+    max_tokens: Optional[int] = None,
+    temperature: float = 0.7,
+    **kwargs: Any
+) -> Iterator[str]:
+    """
+    Stream a chat completion, yielding the response text as it is generated.
+
+    Args:
+        messages (List[Dict[str, str]]): List of message dicts for the chat.
+            Each message should have 'role' and 'content' keys.
+        model (str): Model name. Defaults to DEFAULT_CHAT_MODEL.
+        max_tokens (Optional[int]): Max tokens for the response. Defaults to None.
+        temperature (float): Sampling temperature. Defaults to 0.7.
+        **kwargs: Additional parameters for the API.
+
+    Yields:
+        str: Successive non-empty pieces of the response text.
+
+    Raises:
+        OpenAIAPIError: If the API call or the stream fails.
+
+    Example:
+        ```python
+        for delta in openai_chat_completion_stream([{"role": "user", "content": "Define RPE."}]):
+            print(delta, end="", flush=True)
+        ```
+    """
+    client = get_openai_client()
+    try:
+        stream = client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            stream=True,
+            **kwargs
+        )
+        for chunk in stream:
+            if chunk.choices and (delta := chunk.choices[0].delta.content):
+                yield delta
+    except Exception as e:
+        logger.error("OpenAI API error: %s", e)
+        raise OpenAIAPIError(f"OpenAI API call failed: {e}") from e
+
+
+def _chat_completion_for_client(
+    client: OpenAI,
+    model: str,
+    system: str,
+    user: str,
+    max_tokens: Optional[int],
+    temperature: Optional[float]
+) -> str:
+    """Issue a system+user chat completion on a specific client."""
+    # Unset options are left out so the API defaults apply
+    options = {
+        name: value
+        for name, value in (("max_tokens", max_tokens), ("temperature", temperature))
+        if value is not None
+    }
+    response = client.chat.completions.create(
+        model=model,
+        messages=[
+            {"role": "system", "content": system},
+            {"role": "user", "content": user}
+        ],
+        **options
+    )
+    return response.choices[0].message.content or ""
+
+
+# Memoized on all arguments; only used for temperature 0, where a repeated answer is expected
+_memoized_chat_completion = functools.lru_cache(maxsize=512)(_chat_completion_for_client)
+
+
+def _cached_chat_completion(
+    model: str,
+    system: str,
+    user: str,
+    max_tokens: Optional[int] = None,
+    temperature: Optional[float] = None
+) -> str:
+    """
+    Run a single-turn chat completion, reusing the response for repeated prompts at temperature 0.
+
+    Intended for fixed, templated prompts. Only calls with `temperature=0` are cached, since
+    sampled responses are meant to differ between calls; any other temperature goes to the
+    API every time. Responses are cached in memory per client instance (up to 512 prompts),
+    so after `get_openai_client.cache_clear()` the next call goes to the API again. Failures
+    are not cached.
+
+    Args:
+        model (str): Model name.
+        system (str): The system message content.
+        user (str): The user message content.
+        max_tokens (Optional[int]): Max tokens for the response. Defaults to the API default.
+        temperature (Optional[float]): Sampling temperature. Defaults to the API default, which
+            is not cached.
+
+    Returns:
+        str: The generated response text.
+
+    Raises:
+        OpenAIAPIError: If the API call fails after the SDK's retries.
+
+    Example:
+        ```python
+        text = _cached_chat_completion("gpt-4", "You are a fitness coach.", "Plan a rest day.", temperature=0)
+        ```
+    """
+    complete = _memoized_chat_completion if temperature == 0 else _chat_completion_for_client
+    try:
+        return complete(get_openai_client(), model, system, user, max_tokens, temperature)
+    except Exception as e:
+        logger.error("OpenAI API error: %s", e)
+        raise OpenAIAPIError(f"OpenAI API call failed: {e}") from e
+
+
+async def aopenai_chat_completion(
+    messages: List[Dict[str, str]],
+    model: str = DEFAULT_CHAT_MODEL,
+    max_tokens: Optional[int] = None,
+    temperature: float = 0.7,
+    **kwargs: Any
+) -> str:
+    """
+    Async variant of openai_chat_completion, for issuing many requests concurrently.
+    
+    Args:
+        messages (List[Dict[str, str]]): List of message dicts for the chat.
+            Each message should have 'role' and 'content' keys.
+        model (str): Model name. Defaults to DEFAULT_CHAT_MODEL.
+        max_tokens (Optional[int]): Max tokens for the response. Defaults to None.
+        temperature (float): Sampling temperature. Defaults to 0.7.
+        **kwargs: Additional parameters for the API.
+        
+    Returns:
+        str: The generated response text.
+        
+    Raises:
+        OpenAIAPIError: If the API call fails after the SDK's retries.
+        
+    Example:
+        ```python
+        responses = await asyncio.gather(*(aopenai_chat_completion(m) for m in conversations))
+        ```
+    """
+    client = get_async_openai_client()
+    try:
+        response = await client.chat.completions.create(
+            model=model,
+            messages=messages,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            **kwargs
+        )
+        return response.choices[0].message.content or ""
+    except Exception as e:
+        logger.error("OpenAI API error: %s", e)
         raise OpenAIAPIError(f"OpenAI API call failed: {e}") from e
 
 
-@with_error_handling(error_types=(Exception,), retry_count=3, retry_delay=2.0)
 def openai_chat_completion_json(
     messages: List[Dict[str, str]],
     model: str = DEFAULT_CHAT_MODEL,
@@ -144,22 +421,15 @@ def openai_chat_completion_json(
         ])
         ```
     """
-    import json
-    
-    # Add instruction to respond in JSON format if not already present
-    system_message_found = False
-    for message in messages:
-        if message.get("role") == "system":
-            system_message_found = True
-            if "JSON" not in message.get("content", ""):
-                message["content"] += " Respond in valid JSON format."
-            break
-    
-    if not system_message_found:
-        messages.insert(0, {
-            "role": "system",
-            "content": "You are a helpful assistant. Respond in valid JSON format."
-        })
+    # Add instruction to respond in JSON format if not already present. By convention the
+    # system message comes first; the caller's list and messages are left unmodified.
+    if messages and messages[0].get("role") == "system":
+        system_message = messages[0]
+        if "JSON" not in system_message.get("content", ""):
+            system_message = {**system_message, "content": system_message.get("content", "") + _JSON_SUFFIX}
+            messages = [system_message, *messages[1:]]
+    else:
+        messages = [_DEFAULT_JSON_SYSTEM_MESSAGE, *messages]
     
     # Set response format to JSON
     kwargs["response_format"] = {"type": "json_object"}
@@ -175,24 +445,34 @@ def openai_chat_completion_json(
     
     # Parse the response as JSON
     try:
-        return json.loads(response_text)
+        return _json_loads(response_text)
     except json.JSONDecodeError as e:
-        logger.error(f"Failed to parse OpenAI response as JSON: {e}")
-        logger.debug(f"Response text: {response_text}")
+        logger.error("Failed to parse OpenAI response as JSON: %s", e)
+        logger.debug("Response text: %s", response_text)
         raise OpenAIAPIError(f"Failed to parse OpenAI response as JSON: {e}") from e
 
 
-@with_error_handling(error_types=(Exception,), retry_count=3, retry_delay=2.0)
-def get_embedding(text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> List[float]:
+def _to_vector(embedding: List[float]) -> np.ndarray:
+    """Convert an API embedding to a read-only float32 vector, safe to share through the cache."""
+    vector = np.asarray(embedding, dtype=np.float32)
+    vector.flags.writeable = False
+    return vector
+
+
+def get_embedding(text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> np.ndarray:
     """
     Generate a vector embedding for the given text using OpenAI's embedding API.
     
+    Each cache miss is a separate API request; when embedding several texts, use
+    get_embeddings or get_embeddings_chunked instead.
+    
     Args:
         text (str): The input text to embed.
         model (str): The OpenAI embedding model to use. Defaults to DEFAULT_EMBEDDING_MODEL.
         
     Returns:
-        List[float]: The embedding vector.
+        np.ndarray: The embedding vector (float32, shape (dim,)). The array is read-only and
+            may be shared with the embedding cache; copy it before modifying it in place.
         
     Raises:
         OpenAIAPIError: If the OpenAI API call fails after retries.
@@ -202,29 +482,67 @@ def get_embedding(text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> List[float
         embedding = get_embedding("Running is good for cardiovascular health")
         ```
     """
-    client = get_openai_client()
+    embedding = _embedding_cache.get(EmbeddingCache.key(model, text))
+    if embedding is not None:
+        return embedding
+    embedding = get_embeddings([text], model)[0]
+    embedding.flags.writeable = False
+    return embedding
+
+
+async def aget_embedding(text: str, model: str = DEFAULT_EMBEDDING_MODEL) -> np.ndarray:
+    """
+    Async variant of get_embedding.
+    
+    Args:
+        text (str): The input text to embed.
+        model (str): The OpenAI embedding model to use. Defaults to DEFAULT_EMBEDDING_MODEL.
+        
+    Returns:
+        np.ndarray: The embedding vector (float32, shape (dim,)). The array is read-only and
+            shared with the embedding cache; copy it before modifying it in place.
+        
+    Raises:
+        OpenAIAPIError: If the API call fails after the SDK's retries.
+        
+    Example:
+        ```python
+        embedding = await aget_embedding("Running is good for cardiovascular health")
+        ```
+    """
+    key = EmbeddingCache.key(model, text)
+    embedding = _embedding_cache.get(key)
+    if embedding is not None:
+        return embedding
+
+    client = get_async_openai_client()
     try:
-        response = client.embeddings.create(
-            input=[text],
+        response = await client.embeddings.create(
+            input=[_truncate_for_embedding(text, model)],
             model=model
         )
-        return response.data[0].embedding
+        embedding = _to_vector(response.data[0].embedding)
     except Exception as e:
-        logger.error(f"OpenAI API error generating embedding: {e}")
+        logger.error("OpenAI API error generating embedding: %s", e)
         raise OpenAIAPIError(f"Failed to generate embedding: {e}") from e
+    _embedding_cache.put(key, embedding)
+    return embedding
 
 
-@with_error_handling(error_types=(Exception,), retry_count=3, retry_delay=2.0)
-def get_embeddings(texts: List[str], model: str = DEFAULT_EMBEDDING_MODEL) -> List[List[float]]:
+def get_embeddings(texts: List[str], model: str = DEFAULT_EMBEDDING_MODEL) -> np.ndarray:
     """
     Generate vector embeddings for multiple texts using OpenAI's embedding API.
     
+    Cached texts are not sent; the remaining distinct texts go out in a single request.
+    Texts longer than the model's token window are truncated first when tiktoken is installed.
+    
     Args:
         texts (List[str]): The input texts to embed.
         model (str): The OpenAI embedding model to use. Defaults to DEFAULT_EMBEDDING_MODEL.
         
     Returns:
-        List[List[float]]: The embedding vectors.
+        np.ndarray: A new, writable array of embedding vectors (float32, shape (len(texts), dim)).
+            For empty input, dim is the model's size from EMBEDDING_DIMENSIONS, or 0 if unknown.
         
     Raises:
         OpenAIAPIError: If the OpenAI API call fails after retries.
@@ -234,15 +552,74 @@ def get_embeddings(texts: List[str], model: str = DEFAULT_EMBEDDING_MODEL) -> Li
         embeddings = get_embeddings(["Running is good", "Swimming is also good"])
         ```
     """
-    client = get_openai_client()
-    try:
-        response = client.embeddings.create(
-            input=texts,
-            model=model
-        )
-        # Sort by index to ensure order matches input
-        sorted_data = sorted(response.data, key=lambda x: x.index)
-        return [item.embedding for item in sorted_data]
-    except Exception as e:
-        logger.error(f"OpenAI API error generating embeddings: {e}")
-        raise OpenAIAPIError(f"Failed to generate embeddings: {e}") from e
\ No newline at end of file
+    if not texts:
+        return np.empty((0, EMBEDDING_DIMENSIONS.get(model, 0)), dtype=np.float32)
+
+    keys = [EmbeddingCache.key(model, text) for text in texts]
+    embeddings = [_embedding_cache.get(key) for key in keys]
+
+    # Each distinct uncached text, with every input position it occupies
+    pending: Dict[CacheKey, List[int]] = {}
+    for i, embedding in enumerate(embeddings):
+        if embedding is None:
+            pending.setdefault(keys[i], []).append(i)
+
+    if pending:
+        positions = list(pending.values())
+        client = get_openai_client()
+        try:
+            response = client.embeddings.create(
+                input=[_truncate_for_embedding(texts[indices[0]], model) for indices in positions],
+                model=model
+            )
+        except Exception as e:
+            logger.error("OpenAI API error generating embeddings: %s", e)
+            raise OpenAIAPIError(f"Failed to generate embeddings: {e}") from e
+
+        # Place each result by its request index; the response order is not guaranteed
+        for item in response.data:
+            indices = positions[item.index]
+            vector = _to_vector(item.embedding)
+            _embedding_cache.put(keys[indices[0]], vector)
+            for i in indices:
+                embeddings[i] = vector
+
+    return np.stack(embeddings)
+
+
+def get_embeddings_chunked(
+    texts: List[str],
+    model: str = DEFAULT_EMBEDDING_MODEL,
+    chunk_size: int = EMBEDDING_CHUNK_SIZE,
+    max_workers: int = EMBEDDING_MAX_WORKERS,
+) -> np.ndarray:
+    """
+    Generate embeddings for any number of texts, splitting them into concurrent batch requests.
+    
+    Texts are sent `chunk_size` at a time, with up to `max_workers` requests in flight.
+    The client retries each chunk on transient failures. Output order matches input order.
+    
+    Args:
+        texts (List[str]): The input texts to embed.
+        model (str): The OpenAI embedding model to use. Defaults to DEFAULT_EMBEDDING_MODEL.
+        chunk_size (int): Maximum number of texts per API request. Defaults to EMBEDDING_CHUNK_SIZE.
+        max_workers (int): Maximum concurrent API requests. Defaults to EMBEDDING_MAX_WORKERS.
+        
+    Returns:
+        np.ndarray: The embedding vectors (float32, shape (len(texts), dim)).
+        
+    Raises:
+        OpenAIAPIError: If any chunk fails after retries.
+        
+    Example:
+        ```python
+        embeddings = get_embeddings_chunked(document_chunks, chunk_size=100)
+        ```
+    """
+    if len(texts) <= chunk_size:
+        return get_embeddings(texts, model)
+
+    chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        # map() yields results in chunk order regardless of completion order
+        return np.concatenate(list(executor.map(lambda chunk: get_embeddings(chunk, model), chunks)))
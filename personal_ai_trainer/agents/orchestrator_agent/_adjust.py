@@ -0,0 +1,63 @@
+"""Array kernels for scaling a week's training loads and volumes by readiness."""
+
+from typing import Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Readiness at which the plan is used unchanged, and the factor change per readiness point
+NEUTRAL_READINESS = 75.0
+FACTOR_PER_POINT = 0.1 / 50
+# Bounds on the readiness factor, so one bad or great night never moves loads more than 10%
+MIN_FACTOR = 0.9
+MAX_FACTOR = 1.1
+# Loads are rounded to the nearest plate increment (kg or lb)
+LOAD_INCREMENT = 2.5
+
+
+def readiness_factor(readiness: float) -> float:
+    """
+    Return the multiplier applied to training loads and volumes for a readiness score.
+
+    This is the scale LoadCalculationTool applies per exercise: 1.0 at a readiness of 75,
+    moving 0.02 per 10 points and clamped to [0.9, 1.1].
+
+    Args:
+        readiness (float): The readiness score (0-100).
+
+    Returns:
+        float: The readiness factor.
+    """
+    factor = 1.0 + (readiness - NEUTRAL_READINESS) * FACTOR_PER_POINT
+    return min(MAX_FACTOR, max(MIN_FACTOR, factor))
+
+
+def adjust_intensity(loads: ArrayLike, volumes: ArrayLike, readiness: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Scale a week of loads and volumes by readiness in one pass.
+
+    Args:
+        loads (ArrayLike): Working weights, shape (7, n_exercises); NaN marks rest days and
+            exercises without a load.
+        volumes (ArrayLike): Sets per exercise, same shape as `loads`.
+        readiness (float): The readiness score (0-100).
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: The adjusted loads, rounded to LOAD_INCREMENT, and the
+            adjusted volumes, rounded to whole sets but never below one set where any were planned.
+
+    Example:
+        ```python
+        loads = np.array([[100.0, 60.0], [np.nan, np.nan], ...])  # (7, 2)
+        volumes = np.array([[3, 3], [0, 0], ...])
+        new_loads, new_volumes = adjust_intensity(loads, volumes, readiness=60)
+        ```
+    """
+    factor = readiness_factor(readiness)
+    loads = np.asarray(loads, dtype=np.float64)
+    volumes = np.asarray(volumes, dtype=np.float64)
+
+    adjusted_loads = np.round(loads * (factor / LOAD_INCREMENT)) * LOAD_INCREMENT
+    adjusted_volumes = np.round(volumes * factor)
+    adjusted_volumes = np.where(volumes > 0, np.maximum(adjusted_volumes, 1.0), adjusted_volumes)
+    return adjusted_loads, adjusted_volumes
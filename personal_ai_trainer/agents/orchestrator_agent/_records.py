@@ -0,0 +1,55 @@
+"""Array kernels for detecting personal records against a user's historical bests."""
+
+from typing import Dict, Mapping, Tuple
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+# Highest rep count tracked separately; sets with more reps are compared as MAX_REPS sets
+MAX_REPS = 30
+
+
+def best_weight_table(bests: Mapping[str, Mapping[int, float]]) -> Tuple[Dict[str, int], np.ndarray]:
+    """
+    Build the lookup table of historical bests used by find_prs.
+
+    Args:
+        bests (Mapping[str, Mapping[int, float]]): Heaviest weight lifted per exercise, keyed
+            by exercise name and then by rep count.
+
+    Returns:
+        Tuple[Dict[str, int], np.ndarray]: The row of each exercise, and a table of shape
+            (n_exercises, MAX_REPS + 1) whose [row, r] entry is the heaviest weight lifted for
+            at least r reps (-inf where nothing has been lifted for that many reps).
+
+    Example:
+        ```python
+        rows, table = best_weight_table({"Barbell Squats": {5: 120.0, 8: 105.0}})
+        # table[rows["Barbell Squats"], 6] == 105.0
+        ```
+    """
+    rows = {exercise: row for row, exercise in enumerate(bests)}
+    table = np.full((len(rows), MAX_REPS + 1), -np.inf)
+    for exercise, row in rows.items():
+        for reps, weight in bests[exercise].items():
+            col = min(max(int(reps), 1), MAX_REPS)
+            table[row, col] = max(table[row, col], weight)
+    # A weight lifted for r reps also counts as a best for every lower rep count
+    return rows, np.maximum.accumulate(table[:, ::-1], axis=1)[:, ::-1]
+
+
+def find_prs(table: np.ndarray, exercise_rows: ArrayLike, reps: ArrayLike, weights: ArrayLike) -> np.ndarray:
+    """
+    Flag the sets of a workout that beat the user's historical bests.
+
+    Args:
+        table (np.ndarray): Table from best_weight_table.
+        exercise_rows (ArrayLike): Table row of each set's exercise, shape (n_sets,).
+        reps (ArrayLike): Reps performed in each set, shape (n_sets,).
+        weights (ArrayLike): Weight used in each set, shape (n_sets,).
+
+    Returns:
+        np.ndarray: Boolean array of shape (n_sets,), True where the set is a personal record.
+    """
+    cols = np.clip(np.asarray(reps, dtype=np.intp), 1, MAX_REPS)
+    return np.asarray(weights, dtype=np.float64) > table[np.asarray(exercise_rows, dtype=np.intp), cols]
@@ -1,17 +1,29 @@
 """OrchestratorAgent for managing the Personal AI Training system."""
 
-from typing import Any, Dict, List, Optional, Type, TYPE_CHECKING
+from collections import ChainMap
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import date, timedelta
+from types import MappingProxyType
+from typing import Any, ClassVar, Dict, List, Mapping, Optional, Tuple, Type, TYPE_CHECKING
+import asyncio
+import functools
 import logging
+import os
+import threading
+import weakref
 
 from agency_swarm.tools import BaseTool
 
 from personal_ai_trainer.agents.base_agent import BaseAgent
+from personal_ai_trainer.agents.openai_integration import _cached_chat_completion
 from personal_ai_trainer.agents.research_agent.agent import ResearchAgent
 # Import BiometricAgent only for type checking to avoid circular import
 if TYPE_CHECKING:
     from personal_ai_trainer.agents.biometric_agent.agent import BiometricAgent
 from personal_ai_trainer.di.container import DIContainer
 from personal_ai_trainer.exceptions import AgentError
+from personal_ai_trainer.utils.batch_writer import SupabaseBatchWriter, get_shared_writer
+from personal_ai_trainer.utils.json_utils import dumps as _to_json
 # Tool imports
 from .tools.workout_generation import WorkoutGenerationTool
 from .tools.load_calculation import LoadCalculationTool
@@ -20,6 +32,60 @@ from .tools.plan_delivery import PlanDeliveryTool
 
 logger = logging.getLogger(__name__)
 
+# The OpenAI drafts requested during plan and report generation are not used yet, so they
+# cost a GPT-4 round-trip for nothing. Set PT_ENABLE_LLM_PLANNING=1 to request them anyway.
+ENABLE_LLM_PLANNING = os.getenv("PT_ENABLE_LLM_PLANNING", "0") == "1"
+
+# Weekly schedule returned by generate_workout_plan. The day entries are shared between
+# calls and must not be modified.
+_STATIC_WEEKLY_TEMPLATE: Tuple[Dict[str, str], ...] = (
+    {"day": "Monday", "activity": "Rest", "notes": "Based on high readiness and KB."},
+    {"day": "Tuesday", "activity": "Interval Run 4x800m", "notes": "Focus on speed."},
+    {"day": "Wednesday", "activity": "Strength Training", "notes": "Focus on lower body."},
+    {"day": "Thursday", "activity": "Easy Run 5k", "notes": "Recovery pace."},
+    {"day": "Friday", "activity": "Rest", "notes": "Active recovery."},
+    {"day": "Saturday", "activity": "Long Run 10k", "notes": "Endurance building."},
+    {"day": "Sunday", "activity": "Cross Training", "notes": "Low impact activity."},
+)
+# The formatted plan when there is no original plan to attach
+_STATIC_PLAN_JSON = _to_json({"plan": list(_STATIC_WEEKLY_TEMPLATE)})
+
+# Mock report returned by generate_progress_report; its values are immutable, so a shallow copy is safe
+_DEFAULT_PROGRESS_REPORT: Mapping[str, Any] = MappingProxyType({
+    "report": "Good progress on endurance.",
+    "completed_workouts": 3,
+    "points_earned": 150,
+    "badges": ("Consistency", "Early Bird"),
+    "recommendations": "Keep up the good work!"
+})
+
+# Worker threads shared by all agents for submit_plan_delivery, submit_workout_completion
+# and the optional plan draft request
+BACKGROUND_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=1)
+def _background_pool() -> ThreadPoolExecutor:
+    """Return the process-wide pool for background agent work; threads start on first submit."""
+    return ThreadPoolExecutor(max_workers=BACKGROUND_WORKERS, thread_name_prefix="orchestrator")
+
+
+# Research query for plan generation, filled from the user preferences
+_RESEARCH_QUERY_TEMPLATE = "Best PPL program structure for {experience} level focusing on {goal}"
+_RESEARCH_QUERY_DEFAULTS: Mapping[str, str] = MappingProxyType({"experience": "intermediate", "goal": "hypertrophy"})
+
+# Read-only results of the research and readiness placeholders, shared by every call
+_PLACEHOLDER_RESEARCH: Mapping[str, Any] = MappingProxyType({
+    "summary": "PPL is effective. Focus on compound lifts.",
+    "recommendations": ("Squat", "Bench", "Deadlift variation")
+})
+_PLACEHOLDER_READINESS: Mapping[str, Any] = MappingProxyType({
+    "score": 85,
+    "factors": ("Good sleep", "Low stress"),
+    "trends": MappingProxyType({"sleep_quality": "improving"})
+})
+
+
 class OrchestratorAgent(BaseAgent):
     """
     OrchestratorAgent coordinates the Personal AI Training system, generates workout plans,
@@ -38,6 +104,17 @@ class OrchestratorAgent(BaseAgent):
         supabase_client (Optional[Any]): Database client for storing plans.
     """
 
+    # '__weakref__' lets get_shared track instances without keeping them alive
+    __slots__ = ('di_container', 'research_agent', 'biometric_agent', '_plan_writer', '__weakref__')
+
+    # Instances handed out by get_shared, keyed by the ids of their research and biometric
+    # agents. Each entry holds both agents, so their ids cannot be reused while it exists;
+    # an entry disappears once no caller references its instance.
+    _shared_instances: ClassVar["weakref.WeakValueDictionary[Tuple[int, int], OrchestratorAgent]"] = (
+        weakref.WeakValueDictionary()
+    )
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(
         self,
         research_agent: Optional[ResearchAgent] = None,
@@ -98,6 +175,9 @@ class OrchestratorAgent(BaseAgent):
             except Exception:
                 self.supabase_client = None  # Optional
 
+        # Looked up on first write; every agent on the same client shares one writer
+        self._plan_writer: Optional[SupabaseBatchWriter] = None
+
         description = (
             "Orchestrator Agent: Manages the AI training system, generates personalized workout plans "
             "based on research and biometric data, tracks progress, applies gamification, "
@@ -121,6 +201,51 @@ class OrchestratorAgent(BaseAgent):
             ],
             **kwargs
         )
+
+    @classmethod
+    def get_shared(
+        cls,
+        research_agent: ResearchAgent,
+        biometric_agent: 'BiometricAgent',
+        **kwargs
+    ) -> "OrchestratorAgent":
+        """
+        Return the process-wide OrchestratorAgent for a pair of sub-agents, creating it on first use.
+
+        Later calls with the same agents skip dependency resolution and agent setup, for as
+        long as some caller still holds the instance. The keyword arguments only apply when
+        the instance is created, so don't use this when per-call settings such as user_id differ.
+
+        Args:
+            research_agent (ResearchAgent): Research agent instance.
+            biometric_agent (BiometricAgent): Biometric agent instance.
+            **kwargs: Additional parameters for OrchestratorAgent, used on first creation only.
+
+        Returns:
+            OrchestratorAgent: The shared instance.
+
+        Raises:
+            AgentError: If the instance has to be created and its dependencies cannot be resolved.
+
+        Example:
+            ```python
+            orchestrator = OrchestratorAgent.get_shared(research_agent, biometric_agent)
+            ```
+        """
+        key = (id(research_agent), id(biometric_agent))
+        with cls._shared_lock:
+            agent = cls._shared_instances.get(key)
+            if agent is None:
+                agent = cls(research_agent=research_agent, biometric_agent=biometric_agent, **kwargs)
+                cls._shared_instances[key] = agent
+        return agent
+
+    @classmethod
+    def reset_shared(cls) -> None:
+        """Forget every instance handed out by get_shared, e.g. between tests."""
+        with cls._shared_lock:
+            cls._shared_instances.clear()
+
     def generate_workout_plan(
         self,
         user_id: Optional[str] = None,
@@ -131,6 +256,10 @@ class OrchestratorAgent(BaseAgent):
         """
         Generate a personalized workout plan for the user.
 
+        With PT_ENABLE_LLM_PLANNING=1 the OpenAI draft request runs on the shared
+        background pool while the plan is built, and is awaited before returning.
+        From async code, await generate_workout_plan_async instead.
+
         Args:
             user_id (Optional[str]): The user identifier. Defaults to the agent's user_id.
             user_preferences (Optional[Dict[str, Any]]): User's goals, experience, etc.
@@ -138,119 +267,125 @@ class OrchestratorAgent(BaseAgent):
             current_week (int): Current week in the training cycle. Defaults to 1.
 
         Returns:
-            str: The generated workout plan as a stringified dictionary.
+            str: The generated workout plan as a JSON object.
 
         Raises:
             AgentError: If plan generation fails due to agent/tool errors or data issues.
 
         Output Format:
-            Stringified dictionary with keys:
+            JSON object with keys:
                 - "plan": List of daily activities.
                 - "original_plan": (Optional) The raw plan with loads.
         """
+        # Use the stored user_id if not provided
+        if user_id is None:
+            user_id = getattr(self, 'user_id', 'default-user')
+
+        # Create user_preferences from goal if not provided
+        if user_preferences is None:
+            user_preferences = {
+                'goal': goal or 'general fitness',
+                'experience': 'intermediate'
+            }
+
+        # If enabled, call OpenAI to draft the plan (for test purposes); the request
+        # is started first so it overlaps the steps below
+        draft = _background_pool().submit(self._draft_workout_plan, user_preferences) if ENABLE_LLM_PLANNING else None
+
+        # 1. Get research insights
+        research_query = _RESEARCH_QUERY_TEMPLATE.format_map(
+            ChainMap(user_preferences, _RESEARCH_QUERY_DEFAULTS)
+        )
+        research_insights = self._get_research_insights(research_query)
+
+        # 2. Get biometric readiness
+        readiness_data = self._get_biometric_readiness(user_id)
+
+        # 3. Generate base PPL plan structure using WorkoutGenerationTool
         try:
-            # Use the stored user_id if not provided
-            if user_id is None:
-                user_id = getattr(self, 'user_id', 'default-user')
-
-            # Create user_preferences from goal if not provided
-            if user_preferences is None:
-                user_preferences = {
-                    'goal': goal or 'general fitness',
-                    'experience': 'intermediate'
-                }
-
-            # 1. Get research insights
-            research_query = (
-                f"Best PPL program structure for {user_preferences.get('experience', 'intermediate')} "
-                f"level focusing on {user_preferences.get('goal', 'hypertrophy')}"
+            workout_gen_tool = WorkoutGenerationTool(
+                user_preferences=user_preferences,
+                research_insights=research_insights,
+                current_week=current_week
             )
-            research_insights = self._get_research_insights(research_query)
+            base_plan = workout_gen_tool.run()
+        except Exception as e:
+            logger.error("WorkoutGenerationTool failed: %s", e)
+            raise AgentError(f"WorkoutGenerationTool failed: {e}") from e
 
-            # 2. Get biometric readiness
-            readiness_data = self._get_biometric_readiness(user_id)
+        # 4. Calculate loads using LoadCalculationTool
+        try:
+            load_calc_tool = LoadCalculationTool(
+                user_id=user_id,
+                workout_plan=base_plan,
+                readiness_data=readiness_data
+            )
+            plan_with_loads = load_calc_tool.run()
+        except Exception as e:
+            logger.error("LoadCalculationTool failed: %s", e)
+            raise AgentError(f"LoadCalculationTool failed: {e}") from e
 
-            # 2.5. Call OpenAI to generate the plan (for test purposes)
-            try:
-                from personal_ai_trainer.agents.openai_integration import get_openai_client
-                openai_client = get_openai_client()
-                openai_client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": "You are a fitness coach that creates workout plans."},
-                        {"role": "user", "content": f"Create a workout plan for a {user_preferences.get('experience', 'intermediate')} level focusing on {user_preferences.get('goal', 'hypertrophy')}"}
-                    ]
-                )
-            except Exception as e:
-                logger.warning("OpenAI API call failed: %s", e)
+        logger.info("Generated plan with loads for user %s.", user_id)
 
-            # 3. Generate base PPL plan structure using WorkoutGenerationTool
+        # 5. Format the plan for the expected output format
+        # For testing purposes, also return the original plan
+        if isinstance(plan_with_loads, dict):
+            formatted_plan: Dict[str, Any] = {
+                "plan": list(_STATIC_WEEKLY_TEMPLATE),
+                "original_plan": plan_with_loads
+            }
             try:
-                workout_gen_tool = WorkoutGenerationTool(
-                    user_preferences=user_preferences,
-                    research_insights=research_insights,
-                    current_week=current_week
-                )
-                base_plan = workout_gen_tool.run()
-            except Exception as e:
-                logger.error("WorkoutGenerationTool failed: %s", e)
-                raise AgentError(f"WorkoutGenerationTool failed: {e}") from e
+                plan_json = _to_json(formatted_plan)
+            except (TypeError, ValueError) as e:
+                logger.error("Failed to serialize workout plan: %s", e)
+                raise AgentError(f"Failed to serialize workout plan: {e}") from e
+        else:
+            plan_json = _STATIC_PLAN_JSON
 
-            # 4. Calculate loads using LoadCalculationTool
-            try:
-                load_calc_tool = LoadCalculationTool(
-                    user_id=user_id,
-                    workout_plan=base_plan,
-                    readiness_data=readiness_data
-                )
-                plan_with_loads = load_calc_tool.run()
-            except Exception as e:
-                logger.error("LoadCalculationTool failed: %s", e)
-                raise AgentError(f"LoadCalculationTool failed: {e}") from e
+        # Queue the plan for storage; the write happens in the background
+        self._persist_plan(user_id or "default-user", plan_json, 90)
 
-            logger.info("Generated plan with loads for user %s.", user_id)
+        if draft is not None:
+            draft.result()
+        return plan_json
 
-            # 5. Format the plan for the expected output format
-            formatted_plan: Dict[str, Any] = {
-                "plan": [
-                    {"day": "Monday", "activity": "Rest", "notes": "Based on high readiness and KB."},
-                    {"day": "Tuesday", "activity": "Interval Run 4x800m", "notes": "Focus on speed."},
-                    {"day": "Wednesday", "activity": "Strength Training", "notes": "Focus on lower body."},
-                    {"day": "Thursday", "activity": "Easy Run 5k", "notes": "Recovery pace."},
-                    {"day": "Friday", "activity": "Rest", "notes": "Active recovery."},
-                    {"day": "Saturday", "activity": "Long Run 10k", "notes": "Endurance building."},
-                    {"day": "Sunday", "activity": "Cross Training", "notes": "Low impact activity."}
-                ]
-            }
+    async def generate_workout_plan_async(
+        self,
+        user_id: Optional[str] = None,
+        user_preferences: Optional[Dict[str, Any]] = None,
+        goal: Optional[str] = None,
+        current_week: int = 1
+    ) -> str:
+        """
+        Async variant of generate_workout_plan.
 
-            # For testing purposes, also return the original plan
-            if isinstance(plan_with_loads, dict):
-                formatted_plan["original_plan"] = plan_with_loads
-
-            # Store the plan in the database
-            if self.supabase_client:
-                try:
-                    from datetime import date, timedelta
-                    plan_id = f"{user_id or 'default'}_{date.today().isocalendar()[1]}"
-                    plan_record = {
-                        "plan_id": plan_id,
-                        "user_id": user_id or "default-user",
-                        "week_number": date.today().isocalendar()[1],
-                        "start_date": date.today().isoformat(),
-                        "end_date": (date.today() + timedelta(days=6)).isoformat(),
-                        "readiness_adjustment": 90,
-                        "status": "active",
-                        "plan_data": str(formatted_plan)
-                    }
-                    self.supabase_client.table('workout_plans').insert(plan_record).execute()
-                except Exception as e:
-                    logger.error("Failed to store workout plan in Supabase: %s", e)
-                    # Not raising, as storage is optional
-
-            return str(formatted_plan)
-        except Exception as e:
-            logger.error("Failed to generate workout plan: %s", e)
-            raise AgentError(f"Failed to generate workout plan: {e}") from e
+        The plan is generated in a worker thread, so plans for several users can be
+        generated concurrently without blocking the event loop.
+
+        Args:
+            user_id (Optional[str]): The user identifier. Defaults to the agent's user_id.
+            user_preferences (Optional[Dict[str, Any]]): User's goals, experience, etc.
+            goal (Optional[str]): The user's fitness goal. Used to create user_preferences if not provided.
+            current_week (int): Current week in the training cycle. Defaults to 1.
+
+        Returns:
+            str: The generated workout plan as a JSON object.
+
+        Raises:
+            AgentError: If plan generation fails due to agent/tool errors or data issues.
+
+        Example:
+            ```python
+            plans = await asyncio.gather(*(agent.generate_workout_plan_async(user_id=u) for u in user_ids))
+            ```
+        """
+        return await asyncio.to_thread(
+            self.generate_workout_plan,
+            user_id=user_id,
+            user_preferences=user_preferences,
+            goal=goal,
+            current_week=current_week
+        )
 
     def adjust_plan_based_on_biometrics(
         self,
@@ -267,56 +402,32 @@ class OrchestratorAgent(BaseAgent):
         Returns:
             Dict[str, Any]: The adjusted workout plan.
 
-        Raises:
-            AgentError: If adjustment or storage fails.
-
         Output Format:
             Dictionary with key "plan" (list of daily activities).
         """
-        try:
-            # In a real implementation, this would:
-            # 1. Fetch the user's current plan
-            # 2. Adjust the plan based on readiness
-            # 3. Store the adjusted plan
-            # 4. Return the adjusted plan
-
-            # For testing purposes, we'll return a mock plan
-            adjusted_plan = {
-                "plan": [
-                    {"day": "Monday", "activity": "Push Day (Adjusted)", "notes": f"Intensity adjusted to {readiness_score}%"},
-                    {"day": "Tuesday", "activity": "Rest", "notes": "Active recovery."},
-                    {"day": "Wednesday", "activity": "Pull Day (Adjusted)", "notes": f"Intensity adjusted to {readiness_score}%"},
-                    {"day": "Thursday", "activity": "Rest", "notes": "Active recovery."},
-                    {"day": "Friday", "activity": "Legs Day (Adjusted)", "notes": f"Intensity adjusted to {readiness_score}%"},
-                    {"day": "Saturday", "activity": "Cardio (Adjusted)", "notes": f"Duration adjusted to {int(readiness_score/2)} minutes"},
-                    {"day": "Sunday", "activity": "Rest", "notes": "Full recovery day."}
-                ]
-            }
-
-            # Store the adjusted plan in the database
-            if self.supabase_client:
-                try:
-                    from datetime import date, timedelta
-                    plan_id = f"{user_id}_{date.today().isocalendar()[1]}_adjusted"
-                    plan_record = {
-                        "plan_id": plan_id,
-                        "user_id": user_id,
-                        "week_number": date.today().isocalendar()[1],
-                        "start_date": date.today().isoformat(),
-                        "end_date": (date.today() + timedelta(days=6)).isoformat(),
-                        "readiness_adjustment": readiness_score,
-                        "status": "active",
-                        "plan_data": str(adjusted_plan)
-                    }
-                    self.supabase_client.table('workout_plans').insert(plan_record).execute()
-                except Exception as e:
-                    logger.error("Failed to store adjusted plan in Supabase: %s", e)
-                    # Not raising, as storage is optional
-
-            return adjusted_plan
-        except Exception as e:
-            logger.error("Failed to adjust plan based on biometrics: %s", e)
-            raise AgentError(f"Failed to adjust plan based on biometrics: {e}") from e
+        # In a real implementation, this would:
+        # 1. Fetch the user's current plan
+        # 2. Adjust the plan based on readiness
+        # 3. Store the adjusted plan
+        # 4. Return the adjusted plan
+
+        # For testing purposes, we'll return a mock plan
+        adjusted_plan = {
+            "plan": [
+                {"day": "Monday", "activity": "Push Day (Adjusted)", "notes": f"Intensity adjusted to {readiness_score}%"},
+                {"day": "Tuesday", "activity": "Rest", "notes": "Active recovery."},
+                {"day": "Wednesday", "activity": "Pull Day (Adjusted)", "notes": f"Intensity adjusted to {readiness_score}%"},
+                {"day": "Thursday", "activity": "Rest", "notes": "Active recovery."},
+                {"day": "Friday", "activity": "Legs Day (Adjusted)", "notes": f"Intensity adjusted to {readiness_score}%"},
+                {"day": "Saturday", "activity": "Cardio (Adjusted)", "notes": f"Duration adjusted to {int(readiness_score/2)} minutes"},
+                {"day": "Sunday", "activity": "Rest", "notes": "Full recovery day."}
+            ]
+        }
+
+        # Queue the adjusted plan for storage; the write happens in the background
+        self._persist_plan(user_id, _to_json(adjusted_plan), readiness_score, suffix="_adjusted")
+
+        return adjusted_plan
 
     def generate_progress_report(
         self,
@@ -329,58 +440,43 @@ class OrchestratorAgent(BaseAgent):
             user_id (Optional[str]): The user identifier. Defaults to the agent's user_id.
 
         Returns:
-            Dict[str, Any]: The progress report.
-
-        Raises:
-            AgentError: If report generation fails.
+            Dict[str, Any]: The progress report, a fresh dict the caller may modify.
 
         Output Format:
             Dictionary with keys:
                 - "report": Summary string.
                 - "completed_workouts": int
                 - "points_earned": int
-                - "badges": List[str]
+                - "badges": Tuple[str, ...]
                 - "recommendations": str
         """
-        try:
-            # Use the stored user_id if not provided
-            if user_id is None:
-                user_id = getattr(self, 'user_id', 'default-user')
-
-            # In a real implementation, this would:
-            # 1. Fetch the user's workout logs
-            # 2. Analyze the logs to generate a progress report
-            # 3. Store the report
-            # 4. Return the report
-
-            # For testing purposes, we'll return a mock report
-            report = {
-                "report": "Good progress on endurance.",
-                "completed_workouts": 3,
-                "points_earned": 150,
-                "badges": ["Consistency", "Early Bird"],
-                "recommendations": "Keep up the good work!"
-            }
+        # Use the stored user_id if not provided
+        if user_id is None:
+            user_id = getattr(self, 'user_id', 'default-user')
 
-            # Call OpenAI to generate the report (for test purposes)
+        # In a real implementation, this would:
+        # 1. Fetch the user's workout logs
+        # 2. Analyze the logs to generate a progress report
+        # 3. Store the report
+        # 4. Return the report
+
+        # For testing purposes, we'll return a mock report
+        report = dict(_DEFAULT_PROGRESS_REPORT)
+
+        # Call OpenAI to generate the report (for test purposes)
+        if ENABLE_LLM_PLANNING:
             try:
-                from personal_ai_trainer.agents.openai_integration import get_openai_client
-                openai_client = get_openai_client()
-                openai_client.chat.completions.create(
-                    model="gpt-4",
-                    messages=[
-                        {"role": "system", "content": "You are a fitness coach that generates progress reports."},
-                        {"role": "user", "content": f"Generate a progress report for user {user_id}"}
-                    ]
+                _cached_chat_completion(
+                    "gpt-4",
+                    "You are a fitness coach that generates progress reports.",
+                    f"Generate a progress report for user {user_id}",
+                    max_tokens=1,
+                    temperature=0
                 )
             except Exception as e:
                 logger.warning("OpenAI API call for progress report failed: %s", e)
 
-            return report
-        except Exception as e:
-            logger.error("Failed to generate progress report: %s", e)
-            raise AgentError(f"Failed to generate progress report: {e}") from e
-
+        return report
 
     def track_workout_completion(
         self,
@@ -403,19 +499,18 @@ class OrchestratorAgent(BaseAgent):
         Output Format:
             Dictionary with progress update details.
         """
+        logger.info("Initiating progress tracking for user %s...", user_id)
         try:
-            logger.info("Initiating progress tracking for user %s...", user_id)
             progress_tool = ProgressTrackingTool(
                 user_id=user_id,
                 workout_log=workout_log
             )
             progress_update = progress_tool.run()
-            logger.info("Progress tracking complete for user %s: %s", user_id, progress_update)
-            return progress_update
         except Exception as e:
             logger.error("Failed to track workout completion: %s", e)
             raise AgentError(f"Failed to track workout completion: {e}") from e
-
+        logger.info("Progress tracking complete for user %s: %s", user_id, progress_update)
+        return progress_update
 
     def deliver_weekly_plan(
         self,
@@ -442,8 +537,8 @@ class OrchestratorAgent(BaseAgent):
         Output Format:
             Boolean indicating delivery success.
         """
+        logger.info("Initiating plan delivery for user %s, week %d...", user_id, week_number)
         try:
-            logger.info("Initiating plan delivery for user %s, week %d...", user_id, week_number)
             delivery_tool = PlanDeliveryTool(
                 user_id=user_id,
                 week_number=week_number,
@@ -451,16 +546,143 @@ class OrchestratorAgent(BaseAgent):
                 delivery_method=delivery_method
             )
             result = delivery_tool.run()
-            logger.info("Plan delivery result: %s", result.get('message'))
-            return result.get("success", False)
         except Exception as e:
             logger.error("Failed to deliver weekly plan: %s", e)
             raise AgentError(f"Failed to deliver weekly plan: {e}") from e
+        logger.info("Plan delivery result: %s", result.get('message'))
+        return result.get("success", False)
+
+    def submit_workout_completion(self, user_id: str, workout_log: Dict[str, Any]) -> "Future[Dict[str, Any]]":
+        """
+        Run track_workout_completion in the background and return without waiting for it.
 
+        Args:
+            user_id (str): The user identifier.
+            workout_log (Dict[str, Any]): Details of the completed workout.
+
+        Returns:
+            Future[Dict[str, Any]]: Resolves to the progress update; `.result()` re-raises AgentError
+                if tracking failed. Failures are logged as they happen, even if result() is never called.
+
+        Example:
+            ```python
+            future = orchestrator.submit_workout_completion(user_id, workout_log)
+            ...
+            points = future.result()["points"]
+            ```
+        """
+        return _background_pool().submit(self.track_workout_completion, user_id, workout_log)
+
+    def submit_plan_delivery(
+        self,
+        user_id: str,
+        week_number: int,
+        full_plan: Dict[str, Any],
+        delivery_method: str = "console"
+    ) -> "Future[bool]":
+        """
+        Run deliver_weekly_plan in the background and return without waiting for it.
+
+        Deliveries for many users overlap, up to BACKGROUND_WORKERS at a time across all agents.
+
+        Args:
+            user_id (str): The user identifier.
+            week_number (int): The week number of the plan to deliver.
+            full_plan (Dict[str, Any]): The complete 4-week plan with loads.
+            delivery_method (str): How to deliver (e.g., 'console').
+
+        Returns:
+            Future[bool]: Resolves to True if delivery was successful; `.result()` re-raises AgentError
+                if delivery failed. Failures are logged as they happen, even if result() is never called.
+
+        Example:
+            ```python
+            futures = [orchestrator.submit_plan_delivery(u, week, plans[u]) for u in user_ids]
+            delivered = sum(f.result() for f in futures)
+            ```
+        """
+        return _background_pool().submit(self.deliver_weekly_plan, user_id, week_number, full_plan, delivery_method)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued workout plans to be written to Supabase.
+
+        Plans are also flushed at interpreter exit; call this before reading back stored plans.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait. Defaults to waiting indefinitely.
+
+        Returns:
+            bool: True if all queued plans were written before the timeout.
+        """
+        if self._plan_writer is None:
+            return True
+        return self._plan_writer.flush(timeout)
+
+    def _persist_plan(
+        self,
+        user_id: str,
+        plan_data: str,
+        readiness_adjustment: float,
+        *,
+        suffix: str = ""
+    ) -> None:
+        """
+        Queue a workout_plans row for this week; rows queued close together are inserted in one request.
+
+        Does nothing without a Supabase client. Failures are logged, not raised, as storage is optional.
+
+        Args:
+            user_id (str): The user identifier.
+            plan_data (str): The plan, serialized as JSON.
+            readiness_adjustment (float): Readiness score the plan was built for.
+            suffix (str): Appended to the plan_id, e.g. "_adjusted". Defaults to "".
+        """
+        if not self.supabase_client:
+            return
+        try:
+            # Read the date once so the week and dates agree even across midnight
+            today = date.today()
+            week_number = today.isocalendar()[1]
+            plan_record = {
+                "plan_id": f"{user_id}_{week_number}{suffix}",
+                "user_id": user_id,
+                "week_number": week_number,
+                "start_date": today.isoformat(),
+                "end_date": (today + timedelta(days=6)).isoformat(),
+                "readiness_adjustment": readiness_adjustment,
+                "status": "active",
+                "plan_data": plan_data
+            }
+            if self._plan_writer is None:
+                self._plan_writer = get_shared_writer(self.supabase_client, 'workout_plans')
+            self._plan_writer.put(plan_record)
+        except Exception as e:
+            logger.error("Failed to store workout plan in Supabase: %s", e)
 
     # --- Private Helper Methods for Agent Coordination ---
 
-    def _get_research_insights(self, query: str) -> Dict[str, Any]:
+    def _draft_workout_plan(self, user_preferences: Dict[str, Any]) -> None:
+        """
+        Ask OpenAI for a workout plan draft. Failures are logged and ignored.
+
+        The draft is not used yet, so only a single token is requested.
+
+        Args:
+            user_preferences (Dict[str, Any]): User's goals, experience, etc.
+        """
+        try:
+            _cached_chat_completion(
+                "gpt-4",
+                "You are a fitness coach that creates workout plans.",
+                f"Create a workout plan for a {user_preferences.get('experience', 'intermediate')} level focusing on {user_preferences.get('goal', 'hypertrophy')}",
+                max_tokens=1,
+                temperature=0
+            )
+        except Exception as e:
+            logger.warning("OpenAI API call failed: %s", e)
+
+    def _get_research_insights(self, query: str) -> Mapping[str, Any]:
         """
         Requests synthesized research insights from the ResearchAgent.
 
@@ -468,7 +690,7 @@ class OrchestratorAgent(BaseAgent):
             query (str): Research query string.
 
         Returns:
-            Dict[str, Any]: Synthesized research insights.
+            Mapping[str, Any]: Synthesized research insights (read-only placeholder for now).
 
         Raises:
             AgentError: If research agent call fails or returns unexpected data.
@@ -482,17 +704,12 @@ class OrchestratorAgent(BaseAgent):
             # verified = self.research_agent.verify_research(extracted)
             # synthesized = self.research_agent.synthesize_research(extracted)
             # For now, return a placeholder
-            synthesized = {
-                "summary": "PPL is effective. Focus on compound lifts.",
-                "recommendations": ["Squat", "Bench", "Deadlift variation"]
-            }
-            return synthesized
+            return _PLACEHOLDER_RESEARCH
         except Exception as e:
             logger.error("Failed to get research insights: %s", e)
             raise AgentError(f"Failed to get research insights: {e}") from e
 
-
-    def _get_biometric_readiness(self, user_id: str) -> Dict[str, Any]:
+    def _get_biometric_readiness(self, user_id: str) -> Mapping[str, Any]:
         """
         Requests readiness data from the BiometricAgent.
 
@@ -500,7 +717,7 @@ class OrchestratorAgent(BaseAgent):
             user_id (str): The user identifier.
 
         Returns:
-            Dict[str, Any]: Readiness data.
+            Mapping[str, Any]: Readiness data (read-only placeholder for now).
 
         Raises:
             AgentError: If biometric agent call fails or returns unexpected data.
@@ -513,15 +730,9 @@ class OrchestratorAgent(BaseAgent):
             # readiness_score = self.biometric_agent.calculate_readiness(raw_data)
             # historical_trends = self.biometric_agent.historical_analysis_tool.analyze_trends(user_id, raw_data)
             # For now, return a placeholder
-            readiness_data = {
-                "score": 85,
-                "factors": ["Good sleep", "Low stress"],
-                "trends": {"sleep_quality": "improving"}
-            }
-            return readiness_data
+            return _PLACEHOLDER_READINESS
         except Exception as e:
             logger.error("Failed to get biometric readiness: %s", e)
             raise AgentError(f"Failed to get biometric readiness: {e}") from e
 
-
     # --- Private Helper Methods for Plan Generation (Placeholders) --- - Removed as logic moved to tools
\ No newline at end of file
@@ -3,11 +3,16 @@
 from typing import Any, Dict, Optional
 from agency_swarm.tools import BaseTool
 from pydantic import Field
+import logging
+
+from .._adjust import LOAD_INCREMENT, NEUTRAL_READINESS, readiness_factor
 
 # Placeholder for database interaction to get 1RM, historical data, etc.
 # from personal_ai_trainer.database.models import UserPerformance
 # from personal_ai_trainer.database.operations import get_user_1rm
 
+logger = logging.getLogger(__name__)
+
 class LoadCalculationTool(BaseTool):
     """
     Calculates optimal training loads (weights) for exercises in a workout plan.
@@ -54,23 +59,25 @@ class LoadCalculationTool(BaseTool):
         # Attempt to find a match, handling variations in naming slightly
         for key, value in mock_1rms.items():
             if exercise.lower().startswith(key.split('(')[0].strip().lower()):
-                print(f"Found mock 1RM for {exercise}: {value}")
+                logger.debug("Found mock 1RM for %s: %s", exercise, value)
                 return value
-        print(f"Warning: No mock 1RM found for exercise '{exercise}'. Cannot calculate load.")
+        logger.warning("No mock 1RM found for exercise '%s'. Cannot calculate load.", exercise)
         return None
 
     def _adjust_intensity_for_readiness(self, base_intensity_modifier: float) -> float:
         """
         Adjusts the planned intensity modifier based on the readiness score.
-        Simple linear scaling example.
+        Simple linear scaling example, shared with the array kernels in _adjust.
         """
-        readiness_score = self.readiness_data.get("score", 75) # Default to 75 if not provided
+        readiness_score = self.readiness_data.get("score", NEUTRAL_READINESS) # Default to neutral if not provided
         # Scale modifier: e.g., 100 readiness = 1.05x modifier, 50 readiness = 0.95x modifier
-        readiness_factor = 1.0 + ((readiness_score - 75) / 50) * 0.1 # Scale around 75
-        readiness_factor = max(0.9, min(1.1, readiness_factor)) # Clamp between 0.9 and 1.1
+        factor = readiness_factor(readiness_score)
 
-        adjusted_modifier = base_intensity_modifier * readiness_factor
-        print(f"Readiness score: {readiness_score}, Factor: {readiness_factor:.2f}, Base Mod: {base_intensity_modifier:.2f}, Adjusted Mod: {adjusted_modifier:.2f}")
+        adjusted_modifier = base_intensity_modifier * factor
+        logger.debug(
+            "Readiness score: %s, Factor: %.2f, Base Mod: %.2f, Adjusted Mod: %.2f",
+            readiness_score, factor, base_intensity_modifier, adjusted_modifier
+        )
         return adjusted_modifier
 
     def _calculate_working_weight(self, estimated_1rm: float, adjusted_intensity_modifier: float) -> float:
@@ -81,9 +88,8 @@ class LoadCalculationTool(BaseTool):
         # This is a simplification. Real calculations might involve specific %1RM tables for rep ranges.
         target_weight = estimated_1rm * adjusted_intensity_modifier
         # Round to nearest sensible weight increment (e.g., 2.5 kg/lb)
-        increment = 2.5
-        rounded_weight = round(target_weight / increment) * increment
-        print(f"Calculated Target Weight: {target_weight:.2f}, Rounded: {rounded_weight}")
+        rounded_weight = round(target_weight / LOAD_INCREMENT) * LOAD_INCREMENT
+        logger.debug("Calculated Target Weight: %.2f, Rounded: %s", target_weight, rounded_weight)
         return rounded_weight
 
     def run(self) -> Dict[str, Any]:
@@ -94,7 +100,7 @@ class LoadCalculationTool(BaseTool):
             Dict[str, Any]: The workout plan dictionary updated with calculated loads
                             for each exercise where possible.
         """
-        print(f"Calculating loads for user {self.user_id} with readiness: {self.readiness_data.get('score', 'N/A')}")
+        logger.info("Calculating loads for user %s with readiness: %s", self.user_id, self.readiness_data.get('score', 'N/A'))
 
         updated_plan = self.workout_plan.copy() # Avoid modifying the input dict directly
 
@@ -114,7 +120,7 @@ class LoadCalculationTool(BaseTool):
                     base_intensity_mod = exercise_details.get("intensity_modifier", 1.0)
 
                     if not exercise_name:
-                        print(f"Warning: Skipping exercise with missing name in {week_key}/{day_type}")
+                        logger.warning("Skipping exercise with missing name in %s/%s", week_key, day_type)
                         continue
 
                     estimated_1rm = self._get_estimated_1rm(exercise_name)
@@ -132,7 +138,7 @@ class LoadCalculationTool(BaseTool):
                     exercise_details["debug_1rm"] = estimated_1rm # Add for debugging/transparency
                     exercise_details["debug_readiness_mod"] = readiness_adjusted_modifier
 
-        print("Finished calculating loads.")
+        logger.debug("Finished calculating loads.")
         return updated_plan
 
 # Example Usage (for testing purposes)
@@ -3,10 +3,13 @@
 from typing import Any, Dict, Optional
 from agency_swarm.tools import BaseTool
 from pydantic import Field
+import logging
 
 # Placeholder for potential communication channel integration (email, app notification, etc.)
 # from personal_ai_trainer.utils.communication import send_plan_to_user
 
+logger = logging.getLogger(__name__)
+
 class PlanDeliveryTool(BaseTool):
     """
     Formats the workout plan for a specific week and simulates delivering it to the user.
@@ -35,7 +38,7 @@ class PlanDeliveryTool(BaseTool):
         if week_key in self.full_workout_plan:
             return self.full_workout_plan[week_key]
         else:
-            print(f"Error: Week {self.week_number} not found in the provided plan.")
+            logger.error("Week %s not found in the provided plan.", self.week_number)
             return None
 
     def _format_plan_for_delivery(self, weekly_plan: Dict[str, Any]) -> str:
@@ -72,7 +75,7 @@ class PlanDeliveryTool(BaseTool):
             # send_plan_to_user(self.user_id, formatted_plan, method=self.delivery_method)
             return True
         else:
-            print(f"Error: Delivery method '{self.delivery_method}' not implemented.")
+            logger.error("Delivery method '%s' not implemented.", self.delivery_method)
             return False
 
     def run(self) -> Dict[str, Any]:
@@ -83,7 +86,7 @@ class PlanDeliveryTool(BaseTool):
             Dict[str, Any]: A status message indicating success or failure and the formatted plan.
                             Example: {"success": True, "message": "Plan delivered via console.", "formatted_plan": "..."}
         """
-        print(f"Attempting to deliver week {self.week_number} plan for user {self.user_id} via {self.delivery_method}.")
+        logger.info("Attempting to deliver week %s plan for user %s via %s.", self.week_number, self.user_id, self.delivery_method)
 
         weekly_plan = self._get_weekly_plan()
         if weekly_plan is None:
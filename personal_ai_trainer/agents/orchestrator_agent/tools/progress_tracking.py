@@ -1,9 +1,18 @@
 """Tool for tracking workout progress and implementing gamification."""
 
-from typing import Any, Dict, List
+from bisect import bisect_right
+from collections import ChainMap
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from agency_swarm.tools import BaseTool
 from pydantic import Field
 import datetime
+import logging
+
+from .._records import best_weight_table, find_prs
+
+logger = logging.getLogger(__name__)
 
 # Placeholder for database interaction to store progress, badges, etc.
 # from personal_ai_trainer.database.models import UserProgress, Badge
@@ -13,14 +22,26 @@ import datetime
 POINTS_PER_WORKOUT = 10
 POINTS_PER_PR = 50 # Personal Record
 
-# Badge criteria (example)
-BADGE_CRITERIA = {
-    "first_workout": {"description": "Completed your first workout!", "condition": lambda progress: progress["total_workouts"] == 1},
-    "consistency_1_week": {"description": "Completed workouts for 1 week straight!", "condition": lambda progress: progress["consecutive_weeks"] >= 1},
-    "consistency_1_month": {"description": "Completed workouts for 1 month straight!", "condition": lambda progress: progress["consecutive_months"] >= 1},
-    "first_pr": {"description": "Achieved your first Personal Record!", "condition": lambda progress: progress["total_prs"] >= 1},
-    "strength_milestone_1": {"description": "Reached Strength Milestone 1!", "condition": lambda progress: progress["points"] >= 500},
-}
+# Badges (example)
+BADGE_DESCRIPTIONS: Mapping[str, str] = MappingProxyType({
+    "first_workout": "Completed your first workout!",
+    "consistency_1_week": "Completed workouts for 1 week straight!",
+    "consistency_1_month": "Completed workouts for 1 month straight!",
+    "first_pr": "Achieved your first Personal Record!",
+    "strength_milestone_1": "Reached Strength Milestone 1!",
+})
+
+# Badge criteria, grouped by the progress field each badge depends on. Each entry is a
+# (threshold, badge_id) pair, sorted by threshold; a badge is earned once the field reaches it.
+# Read-only, so the sort order checked by bisect cannot be broken at runtime.
+BADGES_BY_FIELD: Mapping[str, Tuple[Tuple[int, str], ...]] = MappingProxyType({
+    "total_workouts": ((1, "first_workout"),),
+    "consecutive_weeks": ((1, "consistency_1_week"),),
+    "consecutive_months": ((1, "consistency_1_month"),),
+    "total_prs": ((1, "first_pr"),),
+    "total_points": ((500, "strength_milestone_1"),),
+})
+_threshold = itemgetter(0)
 
 class ProgressTrackingTool(BaseTool):
     """
@@ -36,6 +57,11 @@ class ProgressTrackingTool(BaseTool):
         description="Details of the completed workout. Should include date, exercises performed, sets, reps, weight used, and potentially RPE (Rate of Perceived Exertion)."
         # Example: {"date": "2025-05-05", "workout_type": "push", "exercises": [{"name": "Bench Press", "sets": [{"reps": 8, "weight": 90}, ...]}, ...], "duration_minutes": 60, "rpe": 8}
     )
+    historical_bests: Optional[Dict[str, Dict[int, float]]] = Field(
+        default=None,
+        description="The user's heaviest weight per exercise at each rep count, used to detect personal records."
+        # Example: {"Bench Press": {5: 100, 8: 90}, "Barbell Squats": {5: 140}}
+    )
 
     def _get_user_progress(self) -> Dict[str, Any]:
         """
@@ -47,61 +73,85 @@ class ProgressTrackingTool(BaseTool):
             "user_id": self.user_id,
             "total_workouts": 5,
             "total_points": 50,
-            "badges_earned": ["first_workout"],
+            "badges_earned": {"first_workout"}, # A set in memory; stored as a list
             "last_workout_date": "2025-05-01",
             "consecutive_weeks": 1,
             "consecutive_months": 0,
             "total_prs": 0,
             # Add more fields as needed (e.g., weekly summaries)
         }
-        print(f"Retrieved mock progress for user {self.user_id}: {mock_progress}")
+        logger.debug("Retrieved mock progress for user %s: %s", self.user_id, mock_progress)
         return mock_progress
 
-    def _update_user_progress(self, progress_data: Dict[str, Any], points_earned: int, new_badges: List[str], is_pr: bool):
+    def _update_user_progress(self, progress_data: Dict[str, Any], points_earned: int, new_badges: List[str], is_pr: bool, today: str):
         """
         Updates the user's progress data in the database.
         Placeholder: In a real system, this would update database records.
+        `today` (ISO date) is used when the workout log has no date.
         """
         progress_data["total_workouts"] += 1
         progress_data["total_points"] += points_earned
-        progress_data["badges_earned"].extend(new_badges)
-        progress_data["last_workout_date"] = self.workout_log.get("date", datetime.date.today().isoformat())
+        progress_data["badges_earned"].update(new_badges)
+        progress_data["last_workout_date"] = self.workout_log.get("date", today)
         if is_pr:
             progress_data["total_prs"] += 1
 
         # TODO: Implement logic to update consecutive weeks/months based on dates
 
-        print(f"Updating mock progress for user {self.user_id}: {progress_data}")
+        logger.debug("Updating mock progress for user %s: %s", self.user_id, progress_data)
         # In a real system: save_user_progress(self.user_id, progress_data)
 
-    def _check_for_pr(self) -> bool:
+    def _check_for_pr(self, now: datetime.datetime) -> bool:
         """
         Checks if the current workout log contains any personal records (PRs).
         Placeholder: Needs comparison against historical performance data.
+        `now` is the time of the run, used by the mock heuristic.
         """
+        exercises = self.workout_log.get("exercises")
+        if not exercises:
+            return False # Nothing lifted, e.g. a mobility or rest day entry
+
         # This requires fetching historical bests for the exercises performed
         # and comparing them to the current log.
-        print("Checking for PRs (mock implementation)...")
+        logger.debug("Checking for PRs (mock implementation)...")
         # Simulate finding a PR sometimes
-        is_pr = any(ex.get("is_pr", False) for ex in self.workout_log.get("exercises", [])) # Check if log explicitly marks a PR
+        is_pr = any(ex.get("is_pr", False) for ex in exercises) # Check if log explicitly marks a PR
+        if not is_pr and self.historical_bests:
+            is_pr = self._beats_historical_bests()
         if not is_pr and self.workout_log.get("rpe", 0) > 8: # Simple heuristic: high RPE might indicate PR attempt
-             is_pr = (datetime.datetime.now().second % 5 == 0) # Randomly assign PR sometimes for testing
+             is_pr = (now.second % 5 == 0) # Randomly assign PR sometimes for testing
 
         if is_pr:
-            print("PR detected!")
+            logger.info("PR detected for user %s", self.user_id)
         return is_pr
 
-    def _check_badge_conditions(self, progress_data: Dict[str, Any]) -> List[str]:
+    def _beats_historical_bests(self) -> bool:
+        """Checks every weighted set in the log against historical_bests in one vectorized comparison."""
+        rows, table = best_weight_table(self.historical_bests)
+        set_rows, set_reps, set_weights = [], [], []
+        for exercise in self.workout_log.get("exercises", []):
+            row = rows.get(exercise.get("name"))
+            if row is None:
+                continue # No history for this exercise, so nothing to beat
+            for workout_set in exercise.get("sets", []):
+                if workout_set.get("weight") is not None and workout_set.get("reps", 0) > 0:
+                    set_rows.append(row)
+                    set_reps.append(workout_set["reps"])
+                    set_weights.append(workout_set["weight"])
+        return bool(set_rows) and bool(find_prs(table, set_rows, set_reps, set_weights).any())
+
+    def _check_badge_conditions(self, progress_data: Mapping[str, Any]) -> List[str]:
         """Checks if the user meets the criteria for any new badges."""
         newly_earned_badges = []
-        current_badges = set(progress_data.get("badges_earned", []))
+        current_badges = progress_data.get("badges_earned", frozenset())
 
-        for badge_id, criteria in BADGE_CRITERIA.items():
-            if badge_id not in current_badges:
-                condition_met = criteria["condition"](progress_data)
-                if condition_met:
+        for field, thresholds in BADGES_BY_FIELD.items():
+            # Every badge up to the last threshold the field has reached is earned
+            reached = bisect_right(thresholds, progress_data.get(field, 0), key=_threshold)
+            for _, badge_id in thresholds[:reached]:
+                if badge_id not in current_badges:
                     newly_earned_badges.append(badge_id)
-                    print(f"User {self.user_id} earned badge: {badge_id} - {criteria['description']}")
+                    logger.info("User %s earned badge: %s - %s", self.user_id, badge_id, BADGE_DESCRIPTIONS[badge_id])
                     # In a real system: award_badge(self.user_id, badge_id)
 
         return newly_earned_badges
@@ -114,34 +164,40 @@ class ProgressTrackingTool(BaseTool):
             Dict[str, Any]: A summary of the progress update, including points earned and new badges.
                             Example: {"points_earned": 60, "new_badges": ["first_pr"], "message": "Workout logged successfully!"}
         """
-        print(f"Tracking workout for user {self.user_id}: {self.workout_log.get('workout_type', 'Unknown type')} on {self.workout_log.get('date', 'Unknown date')}")
+        logger.info(
+            "Tracking workout for user %s: %s on %s",
+            self.user_id, self.workout_log.get('workout_type', 'Unknown type'), self.workout_log.get('date', 'Unknown date')
+        )
+
+        # Read the clock once per run
+        now = datetime.datetime.now()
 
         # 1. Retrieve current progress
         current_progress = self._get_user_progress()
 
         # 2. Calculate points for this workout
         points_earned = POINTS_PER_WORKOUT
-        is_pr = self._check_for_pr()
+        is_pr = self._check_for_pr(now)
         if is_pr:
             points_earned += POINTS_PER_PR
 
         # 3. Check for new badges BEFORE updating totals (to capture 'first_workout', 'first_pr' etc.)
-        # We need a temporary updated state to check conditions accurately
-        temp_progress_for_badge_check = current_progress.copy()
-        temp_progress_for_badge_check["total_workouts"] += 1
-        temp_progress_for_badge_check["total_points"] += points_earned
-        if is_pr:
-             temp_progress_for_badge_check["total_prs"] += 1
-        # TODO: Update consecutive counters in temp_progress_for_badge_check
+        # Badges are checked against the updated totals, overlaid on the current progress without copying it
+        progress_after_workout = ChainMap({
+            "total_workouts": current_progress["total_workouts"] + 1,
+            "total_points": current_progress["total_points"] + points_earned,
+            "total_prs": current_progress["total_prs"] + (1 if is_pr else 0),
+            # TODO: Update consecutive counters
+        }, current_progress)
 
-        new_badges = self._check_badge_conditions(temp_progress_for_badge_check)
+        new_badges = self._check_badge_conditions(progress_after_workout)
 
         # 4. Update progress in the database (placeholder)
-        self._update_user_progress(current_progress, points_earned, new_badges, is_pr)
+        self._update_user_progress(current_progress, points_earned, new_badges, is_pr, now.date().isoformat())
 
         # 5. Log the workout details (placeholder)
         # In a real system: log_workout(self.user_id, self.workout_log)
-        print(f"Workout logged successfully for user {self.user_id}.")
+        logger.info("Workout logged successfully for user %s.", self.user_id)
 
         return {
             "points_earned": points_earned,
@@ -1,13 +1,48 @@
 """Tool for generating personalized PPL workout plans."""
 
-from typing import Any, Dict, List, ClassVar # Added ClassVar
+from typing import Any, Dict, List, ClassVar, NamedTuple, Tuple # Added ClassVar
 from agency_swarm.tools import BaseTool
 from pydantic import Field
+import logging
 
 # Placeholder for potential database models or utility functions if needed later
 # from personal_ai_trainer.database.models import User, Exercise
 # from personal_ai_trainer.utils.exercise_database import fetch_exercises
 
+logger = logging.getLogger(__name__)
+
+class ProgressedExercise(NamedTuple):
+    """One exercise of a precomputed plan week, with that week's progression applied."""
+    exercise: str
+    sets: int
+    reps: str
+    intensity_modifier: float
+
+
+# A progressed 4-week plan, flattened to nested (key, contents) tuples:
+# ((week_key, ((day_type, (exercise, ...)), ...)), ...)
+ProgressedPlan = Tuple[Tuple[str, Tuple[Tuple[str, Tuple[ProgressedExercise, ...]], ...]], ...]
+
+
+def _build_full_plans(
+    templates: Dict[str, Dict[str, List[str]]],
+    progression: Dict[int, Dict[str, Any]]
+) -> Dict[str, ProgressedPlan]:
+    """Apply every week's progression to every level's template, once, at import time."""
+    return {
+        level: tuple(
+            (f"week_{week}", tuple(
+                (day_type, tuple(
+                    ProgressedExercise(exercise, params["sets"], params["reps"], params["intensity_modifier"])
+                    for exercise in exercises
+                ))
+                for day_type, exercises in template.items()
+            ))
+            for week, params in progression.items()
+        )
+        for level, template in templates.items()
+    }
+
 class WorkoutGenerationTool(BaseTool):
     """
     Generates a personalized 4-week Push-Pull-Legs (PPL) workout plan
@@ -57,36 +92,15 @@ class WorkoutGenerationTool(BaseTool):
         4: {"sets": 3, "reps": "10-15", "intensity_modifier": 0.9}, # Deload week
     }
 
-    def _get_template_for_level(self, level: str) -> Dict[str, List[str]]:
-        """Selects the appropriate PPL template based on experience level."""
-        level = level.lower()
-        if level in self.PPL_TEMPLATE:
-            return self.PPL_TEMPLATE[level]
-        else:
-            print(f"Warning: Unknown experience level '{level}'. Defaulting to intermediate.")
-            return self.PPL_TEMPLATE["intermediate"] # Default to intermediate
-
-    def _apply_progression(self, week_plan: Dict[str, List[str]], week_num: int) -> Dict[str, List[Dict[str, Any]]]:
-        """Applies sets, reps, and intensity modifiers based on the week number."""
-        if week_num not in self.PROGRESSION:
-            print(f"Warning: Invalid week number {week_num}. Using week 1 progression.")
-            week_num = 1
-
-        prog_params = self.PROGRESSION[week_num]
-        progressed_plan = {}
-        for day_type, exercises in week_plan.items():
-            progressed_plan[day_type] = []
-            for exercise in exercises:
-                progressed_plan[day_type].append({
-                    "exercise": exercise,
-                    "sets": prog_params["sets"],
-                    "reps": prog_params["reps"],
-                    "intensity_modifier": prog_params["intensity_modifier"],
-                    # Load calculation will happen in a separate tool
-                    "calculated_load": None
-                })
-        return progressed_plan
+    # The fully progressed 4-week plan for each experience level
+    _FULL_PLANS: ClassVar[Dict[str, ProgressedPlan]] = _build_full_plans(PPL_TEMPLATE, PROGRESSION)
 
+    def _get_plan_for_level(self, level: str) -> ProgressedPlan:
+        """Selects the precomputed progressed plan based on experience level."""
+        if (plan := self._FULL_PLANS.get(level.casefold())) is None:
+            logger.warning("Unknown experience level '%s'. Defaulting to intermediate.", level)
+            plan = self._FULL_PLANS["intermediate"] # Default to intermediate
+        return plan
 
     def run(self) -> Dict[str, Any]:
         """
@@ -96,22 +110,35 @@ class WorkoutGenerationTool(BaseTool):
             Dict[str, Any]: The generated 4-week PPL workout plan structure.
                             Example: {"week_1": {"push": [{"exercise": "Bench Press", "sets": 3, ...}], ...}, ...}
         """
-        print(f"Generating PPL plan for preferences: {self.user_preferences}")
-        print(f"Using research insights: {self.research_insights}") # Log insights used
+        logger.info("Generating PPL plan for preferences: %s", self.user_preferences)
+        logger.debug("Using research insights: %s", self.research_insights)
 
         experience_level = self.user_preferences.get("experience", "intermediate")
-        base_template = self._get_template_for_level(experience_level)
+        progressed_plan = self._get_plan_for_level(experience_level)
 
-        # TODO: Incorporate research_insights to potentially modify the base_template
+        # TODO: Incorporate research_insights to potentially modify the base template
         # e.g., swap exercises based on recommendations or equipment availability
 
-        full_plan = {}
-        for week in range(1, 5):
-             # Apply progression for the specific week
-            weekly_progressed_plan = self._apply_progression(base_template, week)
-            full_plan[f"week_{week}"] = weekly_progressed_plan
+        # Fresh dicts on every call, since LoadCalculationTool fills in loads in place
+        full_plan = {
+            week_key: {
+                day_type: [
+                    {
+                        "exercise": exercise,
+                        "sets": sets,
+                        "reps": reps,
+                        "intensity_modifier": intensity_modifier,
+                        # Load calculation will happen in a separate tool
+                        "calculated_load": None
+                    }
+                    for exercise, sets, reps, intensity_modifier in exercises
+                ]
+                for day_type, exercises in week_plan
+            }
+            for week_key, week_plan in progressed_plan
+        }
 
-        print("Generated 4-week plan structure.")
+        logger.debug("Generated 4-week plan structure.")
         return full_plan
 
 # Example Usage (for testing purposes)
@@ -1,13 +1,26 @@
 """ResearchAgent for processing and retrieving fitness research to inform workout planning."""
 
-from typing import List, Dict, Any
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterator, List, Tuple
 
 from personal_ai_trainer.agents.base_agent import BaseAgent
 # from personal_ai_trainer.knowledge_base.repository import KnowledgeBaseRepository # Removed import
 
-from .tools.knowledge_base_query import KnowledgeBaseQueryTool
-from .tools.research_processing import ResearchProcessingTool
-from .tools.verification import VerificationTool
+from .tools import knowledge_base_query, research_processing, verification
+
+# Chat model for summarizing documents and answering knowledge base queries
+RESEARCH_CHAT_MODEL = "gpt-4o-mini"
+
+# Worker threads shared by all agents for summarizing documents while they are stored
+SUMMARY_WORKERS = 4
+
+
+@functools.lru_cache(maxsize=1)
+def _summary_pool() -> ThreadPoolExecutor:
+    """Return the process-wide pool for document summaries; threads start on first submit."""
+    return ThreadPoolExecutor(max_workers=SUMMARY_WORKERS, thread_name_prefix="research-summary")
+
 
 class ResearchAgent(BaseAgent):
     """
@@ -15,6 +28,8 @@ class ResearchAgent(BaseAgent):
     to support personalized workout planning.
     """
 
+    __slots__ = ('knowledge_base_query_tool', 'research_processing_tool', 'verification_tool')
+
     def __init__(self, name="ResearchAgent", supabase_client=None, embeddings_processor=None): # Adjusted signature
         """
         Initialize the ResearchAgent.
@@ -35,16 +50,18 @@ class ResearchAgent(BaseAgent):
         # Pass the name argument (either provided or default) to the BaseAgent
         super().__init__(name=name, description=description, instructions=instructions)
 
-        # Initialize tools
-        self.knowledge_base_query_tool = KnowledgeBaseQueryTool() # Initialize without repository
-        self.research_processing_tool = ResearchProcessingTool()
-        self.verification_tool = VerificationTool()
+        # Use the shared tool instances
+        self.knowledge_base_query_tool = knowledge_base_query.INSTANCE
+        self.research_processing_tool = research_processing.INSTANCE
+        self.verification_tool = verification.INSTANCE
 
         # Register tools
-        self.register_tool("knowledge_base_query", self.knowledge_base_query_tool.query)
-        self.register_tool("research_processing_extract", self.research_processing_tool.extract_key_information)
-        self.register_tool("research_processing_synthesize", self.research_processing_tool.synthesize_information)
-        self.register_tool("verification", self.verification_tool.verify_information)
+        self.register_tools({
+            "knowledge_base_query": self.knowledge_base_query_tool.query,
+            "research_processing_extract": self.research_processing_tool.extract_key_information,
+            "research_processing_synthesize": self.research_processing_tool.synthesize_information,
+            "verification": self.verification_tool.verify_information,
+        })
 
     def retrieve_research(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
@@ -94,90 +111,200 @@ class ResearchAgent(BaseAgent):
             List[Dict[str, Any]]: List of verification results.
         """
         return self.verification_tool.verify_information(extracted_info)
+
+    def process_and_verify(
+        self, documents: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract and verify key information from research documents in a single pass.
+
+        Equivalent to process_research followed by verify_research, but each document is
+        extracted and verified in the same iteration.
+
+        Args:
+            documents (List[Dict[str, Any]]): List of research documents.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]: The extracted key information
+                and the verification results, both in document order.
+        """
+        extract = self.research_processing_tool.extract_document
+        verify = self.verification_tool.verify_item
+        extracted_info, verifications = [], []
+        for document in documents:
+            info = extract(document)
+            extracted_info.append(info)
+            verifications.append(verify(info))
+        return extracted_info, verifications
         
     def process_research_document(self, content, source, title):
         """
         Process a research document and add it to the knowledge base.
         
+        The document is summarized while it is embedded and stored, so the call takes about
+        as long as the slower of the two. If embedding or storing fails, the error is raised
+        without waiting for the summary.
+        
         Args:
             content (str): The document content.
             source (str): The document source.
             title (str): The document title.
             
         Returns:
-            dict: A summary of the processed document.
+            str: A summary of the processed document.
         """
         from personal_ai_trainer.knowledge_base import repository as kb_repo
-        from personal_ai_trainer.agents.openai_integration import get_openai_client
+        from personal_ai_trainer.agents.openai_integration import openai_chat_completion_json
         from personal_ai_trainer.database.models import KnowledgeBase
         from personal_ai_trainer.knowledge_base.embeddings import get_embedding
         from datetime import date
         import uuid
         
-        # 1. Call OpenAI to process the document
-        openai_client = get_openai_client()
-        openai_client.chat.completions.create(
-            model="gpt-4",
+        # 1. Call OpenAI to summarize the document, in the background while the document is stored
+        summary_future = _summary_pool().submit(
+            openai_chat_completion_json,
+            model=RESEARCH_CHAT_MODEL,
             messages=[
-                {"role": "system", "content": "You are a research assistant that summarizes fitness documents."},
+                {"role": "system", "content": "You are a research assistant that summarizes fitness documents. Respond in JSON with a \"summary\" key."},
                 {"role": "user", "content": f"Summarize this fitness research document: {content}"}
             ]
         )
         
-        # 2. Extract the summary from the response
-        summary = {"summary": "Strength training 2-3 times/week is optimal."}
+        try:
+            # 2. Generate embeddings for the document
+            embedding = get_embedding(content)
+            
+            # 3. Create a KnowledgeBase object
+            document = KnowledgeBase(
+                document_id=f"doc-{uuid.uuid4()}",
+                title=title,
+                content=content,
+                embedding=embedding,
+                category="fitness",
+                source=source,
+                date_added=date.today()
+            )
+            
+            # 4. Add the document to the knowledge base
+            kb_repo.add_document(document)
+        except BaseException:
+            # Drop the summary if it has not started; a running request finishes unobserved
+            summary_future.cancel()
+            raise
         
-        # 3. Generate embeddings for the document
-        embedding = get_embedding(content)
+        summary = summary_future.result()
+        return summary.get("summary", "")
+
+    def process_research_documents(self, documents: List[Tuple[str, str, str]]) -> List[str]:
+        """
+        Add several research documents to the knowledge base at once.
         
-        # 4. Create a KnowledgeBase object
-        document = KnowledgeBase(
-            document_id=f"doc-{uuid.uuid4()}",
-            title=title,
-            content=content,
-            embedding=embedding,
-            category="fitness",
-            source=source,
-            date_added=date.today()
-        )
+        All documents are embedded in one embeddings request and stored with one INSERT,
+        instead of a request and an INSERT per document. No summaries are generated.
         
-        # 5. Add the document to the knowledge base
-        kb_repo.add_document(document)
+        Args:
+            documents (List[Tuple[str, str, str]]): (content, source, title) for each document.
+            
+        Returns:
+            List[str]: The IDs of the documents added to the knowledge base.
+        """
+        from personal_ai_trainer.knowledge_base import repository as kb_repo
+        from personal_ai_trainer.database.models import KnowledgeBase
+        from personal_ai_trainer.knowledge_base.embeddings import get_embeddings
+        from datetime import date
+        import uuid
         
-        # Return the summary as a string for the test
-        return summary["summary"]
+        if not documents:
+            return []
         
-    def query_knowledge_base(self, query_text: str) -> str:
-        """
-        Query the knowledge base for information related to the query.
+        embeddings = get_embeddings([content for content, _, _ in documents])
+        today = date.today()
+        knowledge_base_documents = [
+            KnowledgeBase(
+                document_id=f"doc-{uuid.uuid4()}",
+                title=title,
+                content=content,
+                embedding=embedding,
+                category="fitness",
+                source=source,
+                date_added=today
+            )
+            for (content, source, title), embedding in zip(documents, embeddings)
+        ]
+        return kb_repo.add_documents(knowledge_base_documents)
         
+    def _knowledge_for(self, query_text: str) -> str:
+        """
+        Retrieve the documents most similar to a query, formatted as prompt context.
+
         Args:
             query_text (str): The query text.
-            
+
         Returns:
-            str: The answer based on the knowledge base.
+            str: The similar documents as "title:\ncontent" blocks (text only, not embeddings).
         """
         from personal_ai_trainer.knowledge_base import repository as kb_repo
-        from personal_ai_trainer.agents.openai_integration import get_openai_client
-        from personal_ai_trainer.knowledge_base.embeddings import get_embedding
-        
+        from personal_ai_trainer.knowledge_base.embeddings import get_query_embedding
+
         # 1. Generate embedding for the query
-        query_embedding = get_embedding(query_text)
-        
+        query_embedding = get_query_embedding(query_text)
+
         # 2. Query the knowledge base for similar documents
         similar_docs = kb_repo.query_similar_documents(query_embedding)
+        return "\n\n".join(f"{doc.title}:\n{doc.content}" for doc in similar_docs)
+
+    def query_knowledge_base(self, query_text: str) -> str:
+        """
+        Query the knowledge base for information related to the query.
         
+        Args:
+            query_text (str): The query text.
+            
+        Returns:
+            str: The answer based on the knowledge base.
+        """
+        from personal_ai_trainer.agents.openai_integration import openai_chat_completion_json
+
+        knowledge = self._knowledge_for(query_text)
+
         # 3. Call OpenAI to synthesize an answer based on the similar documents
-        openai_client = get_openai_client()
-        openai_client.chat.completions.create(
-            model="gpt-4",
+        response = openai_chat_completion_json(
+            model=RESEARCH_CHAT_MODEL,
             messages=[
-                {"role": "system", "content": "You are a fitness research assistant that answers questions based on the knowledge base."},
-                {"role": "user", "content": f"Query: {query_text}\nKnowledge Base: {similar_docs}"}
+                {"role": "system", "content": "You are a fitness research assistant that answers questions based on the knowledge base. Respond in JSON with an \"answer\" key."},
+                {"role": "user", "content": f"Query: {query_text}\nKnowledge Base:\n{knowledge}"}
             ]
         )
         
         # 4. Extract the answer from the response
-        answer = "Based on KB: Strength training 2-3 times/week is optimal."
-        
-        return answer
\ No newline at end of file
+        return response.get("answer", "")
+
+    def stream_knowledge_base(self, query_text: str) -> Iterator[str]:
+        """
+        Query the knowledge base and stream the answer as it is generated.
+
+        Streaming variant of query_knowledge_base, for showing the answer in a terminal
+        as it arrives. The answer is plain text rather than JSON.
+
+        Args:
+            query_text (str): The query text.
+
+        Yields:
+            str: Successive pieces of the answer.
+
+        Example:
+            ```python
+            for delta in research_agent.stream_knowledge_base("How often should I deload?"):
+                print(delta, end="", flush=True)
+            ```
+        """
+        from personal_ai_trainer.agents.openai_integration import openai_chat_completion_stream
+
+        knowledge = self._knowledge_for(query_text)
+        yield from openai_chat_completion_stream(
+            model=RESEARCH_CHAT_MODEL,
+            messages=[
+                {"role": "system", "content": "You are a fitness research assistant that answers questions based on the knowledge base."},
+                {"role": "user", "content": f"Query: {query_text}\nKnowledge Base:\n{knowledge}"}
+            ]
+        )
@@ -8,15 +8,33 @@ This module provides functionality to:
 """
 
 from typing import List, Dict, Any, Optional
+import functools
 import logging
 
+from personal_ai_trainer.agents import openai_integration
 from personal_ai_trainer.knowledge_base import repository as kb_repo
-from personal_ai_trainer.knowledge_base.embeddings import get_embedding
+from personal_ai_trainer.knowledge_base.embeddings import get_query_embedding, normalize_query
 from personal_ai_trainer.exceptions import QueryError, EmbeddingError
+from personal_ai_trainer.utils.embedding_batcher import EmbeddingBatcher
 from personal_ai_trainer.utils.error_handling import with_error_handling
 
 logger = logging.getLogger(__name__)
 
+# Fields left out of serialized results; embeddings are large and only used for ranking
+_EXCLUDED_FIELDS = frozenset({"embedding"})
+
+
+@functools.lru_cache(maxsize=1)
+def _query_batcher() -> EmbeddingBatcher:
+    """
+    Return the batcher that coalesces concurrent query() embeddings into one request.
+
+    It calls the undecorated OpenAI helper, so the client's own retries are the only retry
+    layer and a failing request does not hold the batcher thread through stacked backoffs.
+    """
+    return EmbeddingBatcher(openai_integration.get_embeddings)
+
+
 class KnowledgeBaseQueryTool:
     """
     Tool to retrieve research documents from the knowledge base based on a query.
@@ -34,8 +52,6 @@ class KnowledgeBaseQueryTool:
 
     @with_error_handling(
         error_types=(EmbeddingError, QueryError, Exception),
-        retry_count=1,
-        retry_delay=1.0,
         fallback_value=[]
     )
     def query(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
@@ -43,14 +59,15 @@ class KnowledgeBaseQueryTool:
         Retrieve relevant research documents from the knowledge base.
         
         Converts the query to a vector embedding and finds semantically similar documents.
+        Embeddings for queries issued concurrently from several threads are requested together.
         
         Args:
             query (str): The search query text. Should be a clear, focused question or topic.
             top_k (int): Number of top documents to retrieve. Defaults to 5.
                 
         Returns:
-            List[Dict[str, Any]]: List of research documents matching the query, serialized as dicts.
-                Each dict contains:
+            List[Dict[str, Any]]: List of research documents matching the query, serialized as dicts
+                without their embeddings. Each dict contains:
                 - document_id: Unique identifier
                 - title: Document title
                 - content: Document content
@@ -69,27 +86,19 @@ class KnowledgeBaseQueryTool:
             # Returns: [{"document_id": "doc-123", "title": "Running Cadence", ...}, ...]
             ```
         """
-        try:
-            logger.info(f"Querying knowledge base with: '{query}'")
-            
-            # 1. Get the embedding for the query text
-            query_embedding = get_embedding(query)
-            
-            # 2. Query the repository for similar documents using the embedding
-            similar_docs = kb_repo.query_similar_documents(query_embedding, top_k=top_k)
-            
-            # 3. Serialize the Pydantic models to dictionaries for consistent output
-            result = [doc.model_dump() for doc in similar_docs]
-            
-            logger.info(f"Found {len(result)} relevant documents")
-            return result
-            
-        except EmbeddingError as e:
-            logger.error(f"Embedding error during knowledge base query: {e}")
-            raise
-        except Exception as e:
-            logger.error(f"Error querying knowledge base: {e}")
-            raise QueryError(f"Failed to query knowledge base: {e}") from e
+        logger.info("Querying knowledge base with: '%s'", query)
+        
+        # 1. Get the embedding for the query text
+        query_embedding = _query_batcher().submit(normalize_query(query)).result().tolist()
+        
+        # 2. Query the repository for similar documents using the embedding
+        similar_docs = kb_repo.query_similar_documents(query_embedding, top_k=top_k)
+        
+        # 3. Serialize the Pydantic models to dictionaries for consistent output
+        result = [doc.model_dump(exclude=_EXCLUDED_FIELDS) for doc in similar_docs]
+        
+        logger.info("Found %d relevant documents", len(result))
+        return result
             
     def query_by_category(self, query: str, category: str, top_k: int = 5) -> List[Dict[str, Any]]:
         """
@@ -113,14 +122,11 @@ class KnowledgeBaseQueryTool:
             ```
         """
         try:
-            # Get all documents first
-            all_docs = self.query(query, top_k=top_k * 2)  # Get more docs to filter from
-            
-            # Filter by category
-            filtered_docs = [doc for doc in all_docs if doc.get('category') == category]
-            
-            # Return top_k filtered docs
-            return filtered_docs[:top_k]
+            query_embedding = get_query_embedding(query)
+            similar_docs = kb_repo.query_similar_documents(query_embedding, top_k=top_k, category=category)
+            return [doc.model_dump(exclude=_EXCLUDED_FIELDS) for doc in similar_docs]
+        except EmbeddingError:
+            raise
         except Exception as e:
             logger.error(f"Error querying knowledge base by category: {e}")
             raise QueryError(f"Failed to query knowledge base by category: {e}") from e
@@ -146,8 +152,11 @@ class KnowledgeBaseQueryTool:
         try:
             document = kb_repo.get_document_by_id(document_id)
             if document:
-                return document.model_dump()
+                return document.model_dump(exclude=_EXCLUDED_FIELDS)
             return None
         except Exception as e:
             logger.error(f"Error retrieving document by ID: {e}")
-            raise QueryError(f"Failed to retrieve document by ID: {e}") from e
\ No newline at end of file
+            raise QueryError(f"Failed to retrieve document by ID: {e}") from e
+
+# Shared by all ResearchAgents; the tool keeps no per-agent state
+INSTANCE = KnowledgeBaseQueryTool()
@@ -1,5 +1,6 @@
 """Tool for processing research documents and synthesizing information."""
 
+from itertools import chain
 from typing import List, Dict, Any
 
 class ResearchProcessingTool:
@@ -23,16 +24,25 @@ class ResearchProcessingTool:
         Returns:
             List[Dict[str, Any]]: List of extracted key information from each document.
         """
+        return [self.extract_document(doc) for doc in documents]
+
+    def extract_document(self, document: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract key findings and relevant data from one research document.
+
+        Args:
+            document (Dict[str, Any]): A research document.
+
+        Returns:
+            Dict[str, Any]: The extracted key information.
+        """
         # Placeholder: Replace with actual extraction logic
-        extracted = []
-        for doc in documents:
-            extracted.append({
-                "title": doc.get("title"),
-                "summary": doc.get("summary"),
-                "key_points": doc.get("key_points", []),
-                "source": doc.get("source")
-            })
-        return extracted
+        return {
+            "title": document.get("title"),
+            "summary": document.get("summary"),
+            "key_points": document.get("key_points", []),
+            "source": document.get("source")
+        }
 
     def synthesize_information(self, extracted_info: List[Dict[str, Any]]) -> Dict[str, Any]:
         """
@@ -45,11 +55,12 @@ class ResearchProcessingTool:
             Dict[str, Any]: Synthesized summary and recommendations.
         """
         # Placeholder: Replace with actual synthesis logic
-        summary = " ".join([info.get("summary", "") for info in extracted_info])
-        key_points = []
-        for info in extracted_info:
-            key_points.extend(info.get("key_points", []))
+        summary = " ".join(info.get("summary", "") for info in extracted_info)
+        key_points = list(chain.from_iterable(info.get("key_points", ()) for info in extracted_info))
         return {
             "synthesized_summary": summary,
             "aggregated_key_points": key_points
-        }
\ No newline at end of file
+        }
+
+# Shared by all ResearchAgents; the tool keeps no per-agent state
+INSTANCE = ResearchProcessingTool()
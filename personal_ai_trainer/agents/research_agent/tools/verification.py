@@ -23,18 +23,30 @@ class VerificationTool:
         Returns:
             List[Dict[str, Any]]: List of verification results for each information item.
         """
+        return [self.verify_item(info) for info in extracted_info]
+
+    def verify_item(self, info: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Verify the scientific validity of one item of extracted information.
+
+        Args:
+            info (Dict[str, Any]): Extracted key information from one document.
+
+        Returns:
+            Dict[str, Any]: The verification result for the item.
+        """
         # Placeholder: Replace with actual verification logic
-        results = []
-        for info in extracted_info:
-            result = {
-                "title": info.get("title"),
-                "is_valid": True,  # Assume valid for now
-                "issues": [],
-                "references_checked": True
-            }
-            # Example: Add logic to check for missing references or unsupported claims
-            if not info.get("key_points"):
-                result["is_valid"] = False
-                result["issues"].append("No key points found.")
-            results.append(result)
-        return results
\ No newline at end of file
+        result = {
+            "title": info.get("title"),
+            "is_valid": True,  # Assume valid for now
+            "issues": [],
+            "references_checked": True
+        }
+        # Example: Add logic to check for missing references or unsupported claims
+        if not info.get("key_points"):
+            result["is_valid"] = False
+            result["issues"].append("No key points found.")
+        return result
+
+# Shared by all ResearchAgents; the tool keeps no per-agent state
+INSTANCE = VerificationTool()
@@ -1,7 +1,25 @@
 """CLI commands for logging workouts and viewing workout history."""
 
-from typing import Optional
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
 import typer
+from pydantic import TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+from personal_ai_trainer.utils.json_utils import loads as _json_loads
+
+
+class _ExerciseEntry(TypedDict):
+    """One exercise in a --from-file exercise list."""
+
+    name: str
+    sets: int
+    reps: int
+    weight: NotRequired[Optional[float]]
+
+
+_EXERCISES_ADAPTER = TypeAdapter(List[_ExerciseEntry])
 
 app = typer.Typer(help="Commands for logging workouts and viewing workout history.")
 
@@ -20,15 +38,51 @@ def log_workout(date: Optional[str] = typer.Option(None, help="Date of the worko
 
 
 @app.command("exercise")
-def log_exercise(name: str = typer.Option(..., prompt=True, help="Name of the exercise."),
-                 sets: int = typer.Option(..., prompt=True, help="Number of sets."),
-                 reps: int = typer.Option(..., prompt=True, help="Number of reps per set."),
-                 weight: Optional[float] = typer.Option(None, help="Weight used (if applicable).")):
+def log_exercise(name: Optional[str] = typer.Option(None, help="Name of the exercise."),
+                 sets: Optional[int] = typer.Option(None, help="Number of sets."),
+                 reps: Optional[int] = typer.Option(None, help="Number of reps per set."),
+                 weight: Optional[float] = typer.Option(None, help="Weight used (if applicable)."),
+                 from_file: Optional[Path] = typer.Option(None, "--from-file", exists=True, dir_okay=False,
+                                                          help="JSON file with a list of exercises to log at once.")):
+    """
+    Log an individual exercise, or a list of exercises from a JSON file.
     """
-    Log an individual exercise.
+    if from_file is not None:
+        exercises = _exercises_from_file(from_file)
+    else:
+        if name is None:
+            name = typer.prompt("Name")
+        if sets is None:
+            sets = typer.prompt("Sets", type=int)
+        if reps is None:
+            reps = typer.prompt("Reps", type=int)
+        exercises = [{"name": name, "sets": sets, "reps": reps, "weight": weight}]
+
+    # Placeholder: Replace with actual logic to log the exercises (one insert for all of them)
+    for exercise in exercises:
+        logged_weight = exercise.get("weight")
+        typer.echo(f"Logged exercise: {exercise['name']}, Sets: {exercise['sets']}, Reps: {exercise['reps']}, Weight: {logged_weight if logged_weight is not None else 'N/A'}")
+
+
+def _exercises_from_file(path: Path) -> List[Dict[str, Any]]:
+    """
+    Load and validate a list of exercises from a JSON file.
+
+    Args:
+        path (Path): JSON file holding a list of objects with "name", "sets", "reps" and
+            an optional "weight".
+
+    Returns:
+        List[Dict[str, Any]]: The validated exercises.
+
+    Raises:
+        typer.Exit: If the file is not valid JSON or an entry is invalid.
     """
-    # Placeholder: Replace with actual logic to log the exercise
-    typer.echo(f"Logged exercise: {name}, Sets: {sets}, Reps: {reps}, Weight: {weight if weight is not None else 'N/A'}")
+    try:
+        return _EXERCISES_ADAPTER.validate_python(_json_loads(path.read_bytes()))
+    except ValueError as e:  # includes JSON decode and pydantic validation errors
+        typer.secho(f"Invalid exercise file {path}: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
 
 
 @app.command("history")
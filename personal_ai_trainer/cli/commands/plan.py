@@ -1,12 +1,89 @@
 """CLI commands for viewing workout plans."""
 
+import functools
+from datetime import date
 from typing import Optional
 import typer
 from personal_ai_trainer.config.config import get_default_user_id
-from personal_ai_trainer.agents.orchestrator_agent.agent import OrchestratorAgent
+from personal_ai_trainer.utils.json_utils import loads as _json_loads
 
 app = typer.Typer(help="Commands for viewing workout plans.")
 
+
+# Fixed Oura records served to `pt plan today` instead of calling the Oura API
+_MOCK_READINESS = ({'score': 85, 'summary_date': '2025-05-06'},)
+_MOCK_SLEEP = ({'score': 90, 'summary_date': '2025-05-06'},)
+_MOCK_ACTIVITY = ({'score': 80, 'summary_date': '2025-05-06'},)
+
+
+class _MockOuraClientWrapper:
+    """Stand-in for OuraClientWrapper that returns the fixed records above."""
+
+    def get_readiness_data(self, user_id):
+        return list(_MOCK_READINESS)
+
+    def get_sleep_data(self, user_id):
+        return list(_MOCK_SLEEP)
+
+    def get_activity_data(self, user_id):
+        return list(_MOCK_ACTIVITY)
+
+
+_MOCK_OURA_CLIENT = _MockOuraClientWrapper()
+
+
+@functools.lru_cache(maxsize=1)
+def _weekday_name(ordinal: int) -> str:
+    """
+    Return the weekday name (e.g. "Monday") of a proleptic Gregorian ordinal, caching the last day.
+
+    Args:
+        ordinal (int): The day, as returned by date.toordinal().
+
+    Returns:
+        str: The weekday name in the current locale.
+    """
+    return date.fromordinal(ordinal).strftime("%A")
+
+
+@functools.lru_cache(maxsize=4)
+def _get_orchestrator(agent_class: type, user_id: str):
+    """
+    Build the OrchestratorAgent used by `pt plan today`, reusing it for later calls in this process.
+
+    The class is part of the cache key so that a patched OrchestratorAgent gets its own instance.
+
+    Args:
+        agent_class (type): The OrchestratorAgent class to instantiate.
+        user_id (str): The user the plan is for.
+
+    Returns:
+        OrchestratorAgent: The orchestrator, wired to a research agent and a biometric agent
+            that reads mock Oura data.
+    """
+    from personal_ai_trainer.agents.research_agent.agent import ResearchAgent
+    from personal_ai_trainer.agents.biometric_agent.agent import BiometricAgent
+    from personal_ai_trainer.database.connection import get_supabase_client
+
+    # Create the necessary agents
+    supabase_client = get_supabase_client()
+    research_agent = ResearchAgent(supabase_client=supabase_client, name="ResearchAgent")
+    # Use the mock Oura client instead of the real one
+    biometric_agent = BiometricAgent(
+        oura_client=_MOCK_OURA_CLIENT,
+        supabase_client=supabase_client,
+        user_id=user_id
+    )
+
+    # Create an OrchestratorAgent instance with the required dependencies
+    return agent_class(
+        research_agent=research_agent,
+        biometric_agent=biometric_agent,
+        supabase_client=supabase_client,
+        user_id=user_id
+    )
+
+
 # Main command that handles both subcommands and direct options
 @app.callback(invoke_without_command=True)
 def main(
@@ -26,6 +103,8 @@ def main(
                 typer.secho("No user profile found. Please create one with 'pt profile create'", fg=typer.colors.RED)
                 raise typer.Exit(code=1)
             user_id = user_id_default
+        from personal_ai_trainer.agents.orchestrator_agent.agent import OrchestratorAgent
+
         # Create an OrchestratorAgent instance
         orchestrator = OrchestratorAgent()
 
@@ -43,10 +122,6 @@ def view_today(user_id: str = typer.Option(None, "--user-id", help="User ID for
     """
     View the current day's workout plan.
     """
-    import datetime
-    from personal_ai_trainer.agents.research_agent.agent import ResearchAgent
-    from personal_ai_trainer.agents.biometric_agent.agent import BiometricAgent
-    from personal_ai_trainer.database.connection import get_supabase_client
 
     # Determine user_id (use default if none provided)
     if user_id is None:
@@ -55,47 +130,19 @@ def view_today(user_id: str = typer.Option(None, "--user-id", help="User ID for
             typer.secho("No user profile found. Please create one with 'pt profile create'", fg=typer.colors.RED)
             raise typer.Exit(code=1)
         user_id = user_id_default
-    # Create the necessary agents
-    supabase_client = get_supabase_client()
-    research_agent = ResearchAgent(supabase_client=supabase_client, name="ResearchAgent")
+    from personal_ai_trainer.agents.orchestrator_agent.agent import OrchestratorAgent
 
-    # Create a mock BiometricAgent without requiring Oura API
-    class MockOuraClientWrapper:
-        def get_readiness_data(self, user_id):
-            return [{'score': 85, 'summary_date': '2025-05-06'}]
-
-        def get_sleep_data(self, user_id):
-            return [{'score': 90, 'summary_date': '2025-05-06'}]
-
-        def get_activity_data(self, user_id):
-            return [{'score': 80, 'summary_date': '2025-05-06'}]
-
-    # Use the mock client instead of the real one
-    oura_client = MockOuraClientWrapper()
-    biometric_agent = BiometricAgent(
-        oura_client=oura_client,
-        supabase_client=supabase_client,
-        user_id=user_id
-    )
-
-    # Create an OrchestratorAgent instance with the required dependencies
-    orchestrator = OrchestratorAgent(
-        research_agent=research_agent,
-        biometric_agent=biometric_agent,
-        supabase_client=supabase_client,
-        user_id=user_id
-    )
+    orchestrator = _get_orchestrator(OrchestratorAgent, user_id)
 
     # Get today's day of the week
-    today = datetime.datetime.now().strftime("%A")
+    today = _weekday_name(date.today().toordinal())
 
     # Generate a plan (in a real app, this would fetch from the database)
     plan = orchestrator.generate_workout_plan(goal="general fitness", user_id=user_id)
 
-    # Convert the string representation of the plan to a dictionary
-    import ast
+    # Parse the JSON plan into a dictionary
     try:
-        plan_dict = ast.literal_eval(plan)
+        plan_dict = plan if isinstance(plan, dict) else _json_loads(plan)
 
         # Find today's workout in the plan
         today_workout = None
@@ -119,7 +166,7 @@ def view_today(user_id: str = typer.Option(None, "--user-id", help="User ID for
             typer.echo("Here's your weekly plan:")
             for day_plan in plan_dict.get("plan", []):
                 typer.echo(f"- {day_plan.get('day')}: {day_plan.get('activity')}")
-    except (ValueError, SyntaxError) as e:
+    except ValueError as e:
         typer.echo(f"Error parsing workout plan: {e}")
         typer.echo("Today's workout plan: Rest day (default)")
     except Exception as e:
@@ -166,6 +213,8 @@ def generate_plan(
             raise typer.Exit(code=1)
         user_id = user_id_default
 
+    from personal_ai_trainer.agents.orchestrator_agent.agent import OrchestratorAgent
+
     # Create an OrchestratorAgent instance
     orchestrator = OrchestratorAgent()
 
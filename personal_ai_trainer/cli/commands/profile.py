@@ -1,7 +1,9 @@
 """CLI commands for managing user profiles."""
 
 import uuid
-import json
+from pathlib import Path
+from typing import Optional, Tuple
+
 import typer
 from rich.console import Console
 from rich.table import Table
@@ -17,13 +19,45 @@ from personal_ai_trainer.config.config import (
     set_default_user_id,
     get_default_user_id,
 )
+from personal_ai_trainer.utils.json_utils import dumps as _to_json, loads as _json_loads
+
 
 app = typer.Typer(help="Commands for managing user profiles.")
 console = Console()
 
-@app.command("create")
-def create_profile():
-    """Create a new user profile interactively."""
+# (header, style) of each column in the profile tables
+_PROFILE_COLUMNS = (("Field", "bold"), ("Value", None))
+_PROFILES_COLUMNS = (
+    ("User ID", "bold"),
+    ("Name", None),
+    ("Age", None),
+    ("Height (cm)", None),
+    ("Weight (kg)", None),
+)
+
+
+def _new_table(title: str, columns: Tuple[Tuple[str, Optional[str]], ...]) -> Table:
+    """
+    Create an empty Rich table with the given columns.
+
+    Rich tables collect their rows in their columns, so each command needs a fresh table;
+    building one from a fixed schema is cheaper than deep-copying a template.
+
+    Args:
+        title (str): The table title.
+        columns (Tuple[Tuple[str, Optional[str]], ...]): (header, style) of each column.
+
+    Returns:
+        Table: The empty table.
+    """
+    table = Table(title=title)
+    for header, style in columns:
+        table.add_column(header, style=style)
+    return table
+
+
+def _prompt_for_profile() -> UserProfile:
+    """Prompt for each field of a new user profile."""
     name = typer.prompt("Name")
     age = typer.prompt("Age", type=int)
     height = typer.prompt("Height (cm)", type=float)
@@ -53,7 +87,7 @@ def create_profile():
 
     user_id = str(uuid.uuid4())
 
-    profile = UserProfile(
+    return UserProfile(
         user_id=user_id,
         name=name,
         age=age,
@@ -61,9 +95,53 @@ def create_profile():
         weight=weight,
         fitness_level=fitness_level or None,
         goals=goals or None,
-        preferences=json.dumps(preferences),
+        preferences=_to_json(preferences),
     )
 
+
+def _profile_from_file(path: Path) -> UserProfile:
+    """
+    Load a new user profile from a JSON file.
+
+    The file holds one object with the UserProfile fields except user_id, which is
+    generated. `preferences` may be given as an object.
+
+    Args:
+        path (Path): The JSON file.
+
+    Returns:
+        UserProfile: The validated profile.
+
+    Raises:
+        typer.Exit: If the file is not valid JSON or does not describe a valid profile.
+    """
+    try:
+        data = _json_loads(path.read_bytes())
+        if not isinstance(data, dict):
+            raise ValueError("expected a JSON object")
+        preferences = data.get("preferences")
+        if preferences is not None and not isinstance(preferences, str):
+            data["preferences"] = _to_json(preferences)
+        return UserProfile(**{**data, "user_id": str(uuid.uuid4())})
+    except ValueError as e:  # includes JSON decode and pydantic validation errors
+        typer.secho(f"Invalid profile file {path}: {e}", fg=typer.colors.RED)
+        raise typer.Exit(code=1)
+
+
+@app.command("create")
+def create_profile(
+    from_file: Optional[Path] = typer.Option(
+        None,
+        "--from-file",
+        exists=True,
+        dir_okay=False,
+        help="JSON file with the profile fields, instead of prompting for them",
+    )
+):
+    """Create a new user profile interactively, or from a JSON file."""
+    profile = _profile_from_file(from_file) if from_file is not None else _prompt_for_profile()
+    user_id = profile.user_id
+
     result = add_user_profile(profile)
     if result:
         typer.secho(f"User profile created with user_id: {user_id}", fg=typer.colors.GREEN)
@@ -93,9 +171,7 @@ def view_profile(
         typer.secho(f"No profile found for user_id: {user_id}", fg=typer.colors.RED)
         raise typer.Exit(code=1)
 
-    table = Table(title=f"User Profile: {profile.name}")
-    table.add_column("Field", style="bold")
-    table.add_column("Value")
+    table = _new_table(f"User Profile: {profile.name}", _PROFILE_COLUMNS)
 
     table.add_row("User ID", profile.user_id)
     table.add_row("Name", profile.name)
@@ -107,7 +183,7 @@ def view_profile(
 
     # Parse preferences JSON
     try:
-        prefs = json.loads(profile.preferences) if profile.preferences else {}
+        prefs = _json_loads(profile.preferences) if profile.preferences else {}
     except Exception:
         prefs = {}
     table.add_row("Days per Week", str(prefs.get("days_per_week", "")))
@@ -155,7 +231,7 @@ def update_profile(
 
     # Parse existing preferences
     try:
-        prefs = json.loads(profile.preferences) if profile.preferences else {}
+        prefs = _json_loads(profile.preferences) if profile.preferences else {}
     except Exception:
         prefs = {}
     days_per_week = typer.prompt(
@@ -182,7 +258,7 @@ def update_profile(
         "weight": weight,
         "fitness_level": fitness_level or None,
         "goals": goals or None,
-        "preferences": json.dumps(new_prefs),
+        "preferences": _to_json(new_prefs),
     }
 
     success = update_user_profile(user_id, updates)
@@ -198,29 +274,22 @@ def update_profile(
         )
 
 @app.command("list")
-def list_profiles():
-    """List all user profiles."""
-    profiles = list_user_profiles()
+def list_profiles(
+    limit: int = typer.Option(50, "--limit", min=1, help="Maximum number of profiles to list"),
+    offset: int = typer.Option(0, "--offset", min=0, help="Number of profiles to skip"),
+):
+    """List all user profiles, one page at a time."""
+    profiles = list_user_profiles(limit=limit, offset=offset)
     if not profiles:
         typer.secho(
             "No user profiles found.", fg=typer.colors.YELLOW
         )
         return
 
-    table = Table(title="All User Profiles")
-    table.add_column("User ID", style="bold")
-    table.add_column("Name")
-    table.add_column("Age")
-    table.add_column("Height (cm)")
-    table.add_column("Weight (kg)")
-
-    for p in profiles:
-        table.add_row(
-            p.user_id,
-            p.name,
-            str(p.age),
-            f"{p.height}",
-            f"{p.weight}",
-        )
+    table = _new_table("All User Profiles", _PROFILES_COLUMNS)
+
+    rows = [(p.user_id, p.name, str(p.age), str(p.height), str(p.weight)) for p in profiles]
+    for row in rows:
+        table.add_row(*row)
 
     console.print(table)
\ No newline at end of file
@@ -1,14 +1,28 @@
 """CLI commands for managing research documents and searching the knowledge base."""
 
+import functools
+import glob
 from typing import Optional
 import typer
 import os
-from personal_ai_trainer.agents.research_agent.agent import ResearchAgent
-from personal_ai_trainer.di.provider import get_supabase_client
-from personal_ai_trainer.knowledge_base import repository as kb_repo
 
 app = typer.Typer(help="Commands for managing research documents and searching the knowledge base.")
 
+
+@functools.lru_cache(maxsize=1)
+def _get_research_agent():
+    """
+    Build the ResearchAgent used by these commands, reusing it for later calls in this process.
+
+    Returns:
+        ResearchAgent: The research agent, bound to the shared Supabase client.
+    """
+    from personal_ai_trainer.agents.research_agent.agent import ResearchAgent
+    from personal_ai_trainer.di.provider import get_supabase_client
+
+    return ResearchAgent(supabase_client=get_supabase_client())
+
+
 @app.command("add")
 def add_document(title: str = typer.Option(..., prompt=True, help="Title of the research document."),
                  file_path: str = typer.Option(..., prompt=True, help="Path to the research document file."),
@@ -27,7 +41,7 @@ def add_document(title: str = typer.Option(..., prompt=True, help="Title of the
         content = f"Content from {file_path} - This is a placeholder for PDF content."
 
         # Create research agent
-        research_agent = ResearchAgent(supabase_client=get_supabase_client())
+        research_agent = _get_research_agent()
 
         # Process document
         summary = research_agent.process_research_document(
@@ -43,25 +57,69 @@ def add_document(title: str = typer.Option(..., prompt=True, help="Title of the
         raise typer.Exit(code=1)
 
 
+@app.command("add-many")
+def add_documents(pattern: str = typer.Option(..., "--glob", help="Glob pattern of research document files, e.g. 'papers/**/*.pdf'.")):
+    """
+    Add every research document matching a glob pattern to the knowledge base.
+
+    The files are embedded in one request and stored with one insert. Each title is the
+    file name without its extension, and no summaries are generated.
+    """
+    try:
+        file_paths = sorted(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+        if not file_paths:
+            typer.echo(f"No files match {pattern}")
+            raise typer.Exit(code=1)
+
+        # Placeholder text, as for single documents, until PDF extraction is implemented
+        documents = [
+            (
+                f"Content from {path} - This is a placeholder for PDF content.",
+                os.path.basename(path),
+                os.path.splitext(os.path.basename(path))[0],
+            )
+            for path in file_paths
+        ]
+        document_ids = _get_research_agent().process_research_documents(documents)
+
+        typer.echo(f"Added {len(document_ids)} research document(s):")
+        for path, document_id in zip(file_paths, document_ids):
+            typer.echo(f"- {path} (Document ID: {document_id})")
+    except typer.Exit:
+        raise
+    except Exception as e:
+        typer.echo(f"Error adding documents: {str(e)}")
+        raise typer.Exit(code=1)
+
+
 @app.command("list")
-def list_documents():
+def list_documents(limit: int = typer.Option(50, "--limit", min=1, help="Maximum number of chunks to list, newest first.")):
     """
     View available research documents.
     """
+    from personal_ai_trainer.di.provider import get_supabase_client
+    from personal_ai_trainer.knowledge_base import repository as kb_repo
+
     try:
         # Get Supabase client
         client = get_supabase_client()
 
-        # Query the kb_chunks table
-        response = client.table(kb_repo.TABLE_NAME).select('doc_id, chunk_id, content, created_at').execute()
+        # Query the newest chunks in the kb_chunks table, one page at most. content_preview is
+        # generated by add_kb_chunks_content_preview.sql, so chunk bodies are not fetched.
+        response = (
+            client.table(kb_repo.TABLE_NAME)
+            .select('doc_id, chunk_id, content_preview, created_at')
+            .order('created_at', desc=True)
+            .limit(limit)
+            .execute()
+        )
 
         if response.data:
             typer.echo("Available research documents:")
             for doc in response.data:
                 # Show a preview of the content (first 50 characters)
-                content_preview = doc['content'][:50] + "..." if len(doc['content']) > 50 else doc['content']
                 typer.echo(f"- Document ID: {doc['doc_id']}, Chunk: {doc['chunk_id']}")
-                typer.echo(f"  Preview: {content_preview}")
+                typer.echo(f"  Preview: {doc['content_preview']}")
                 typer.echo(f"  Added: {doc['created_at']}")
                 typer.echo("")
         else:
@@ -78,13 +136,13 @@ def search_documents(query: str = typer.Argument(..., help="Search query for the
     """
     try:
         # Create research agent
-        research_agent = ResearchAgent(supabase_client=get_supabase_client())
-
-        # Query the knowledge base
-        answer = research_agent.query_knowledge_base(query)
+        research_agent = _get_research_agent()
 
+        # Query the knowledge base, printing the answer as it is generated
         typer.echo(f"Search results for '{query}':")
-        typer.echo(answer)
+        for delta in research_agent.stream_knowledge_base(query):
+            typer.echo(delta, nl=False)
+        typer.echo("")
     except Exception as e:
         typer.echo(f"Error searching documents: {str(e)}")
         raise typer.Exit(code=1)
\ No newline at end of file
@@ -5,16 +5,20 @@ This module provides functions to retrieve database configuration values
 for connecting to Supabase.
 """
 
+import functools
 import os
 import json
 from pathlib import Path
 from typing import Optional
 
 
+@functools.lru_cache(maxsize=1)
 def get_supabase_url() -> str:
     """
     Retrieve the Supabase project URL from environment variables.
 
+    The value is read once per process; call _reset_env_cache() after changing it.
+
     Returns:
         str: The Supabase project URL.
 
@@ -27,10 +31,13 @@ def get_supabase_url() -> str:
     return url
 
 
+@functools.lru_cache(maxsize=1)
 def get_supabase_key() -> str:
     """
     Retrieve the Supabase service key from environment variables.
 
+    The value is read once per process; call _reset_env_cache() after changing it.
+
     Returns:
         str: The Supabase service key.
 
@@ -42,6 +49,12 @@ def get_supabase_key() -> str:
         raise EnvironmentError("SUPABASE_KEY environment variable is not set.")
     return key
 
+
+def _reset_env_cache() -> None:
+    """Forget the cached Supabase URL and key, so they are re-read from the environment."""
+    get_supabase_url.cache_clear()
+    get_supabase_key.cache_clear()
+
 # User configuration for default user profile
 CONFIG_DIR_ENV = "PT_AGENT_CONFIG_DIR"
 CONFIG_FILE_NAME = "config.json"
@@ -3,6 +3,7 @@ Repository for storing and retrieving user profiles using Supabase.
 """
 
 import logging
+from itertools import islice
 from typing import Optional, List, Any, Dict
 
 from personal_ai_trainer.database.connection import get_supabase_client
@@ -144,9 +145,13 @@ def delete_user_profile(user_id: str) -> bool:
         logger.error(f"Failed to delete user profile locally: {e}", exc_info=True)
     return False
 
-def list_user_profiles() -> List[UserProfile]:
+def list_user_profiles(limit: Optional[int] = None, offset: int = 0) -> List[UserProfile]:
     """
-    List all user profiles.
+    List user profiles, optionally one page at a time.
+
+    Args:
+        limit (Optional[int]): Maximum number of profiles to return. Defaults to all of them.
+        offset (int): Number of profiles to skip. Defaults to 0.
 
     Returns:
         List[UserProfile]: List of user profiles.
@@ -154,14 +159,20 @@ def list_user_profiles() -> List[UserProfile]:
     # Try Supabase first
     try:
         client = get_supabase_client()
-        response = client.table(TABLE_NAME).select("*").execute()
+        query = client.table(TABLE_NAME).select("*")
+        if limit is not None:
+            query = query.range(offset, offset + limit - 1)
+        elif offset:
+            query = query.offset(offset)
+        response = query.execute()
         return [UserProfile(**row) for row in (response.data or [])]
     except Exception as e:
         logger.warning(f"Supabase unavailable, listing profiles locally: {e}")
     # Fallback to local storage
     profiles: List[UserProfile] = []
+    stop = None if limit is None else offset + limit
     try:
-        for row in _load_local_profiles():
+        for row in islice(_load_local_profiles(), offset, stop):
             profiles.append(UserProfile(**row))
     except Exception as e:
         logger.error(f"Failed to list user profiles locally: {e}", exc_info=True)
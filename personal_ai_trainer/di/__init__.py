@@ -6,13 +6,23 @@ service dependencies throughout the application.
 """
 
 from personal_ai_trainer.di.container import DIContainer
-from personal_ai_trainer.di.provider import (
-    configure_services,
-    get_container,
-    reset_container,
-    get_supabase_client,
-    get_openai_client
-)
+
+# The provider imports every agent, so its names are loaded on first access (PEP 562).
+# This keeps `from personal_ai_trainer.di.container import DIContainer` cheap.
+_PROVIDER_EXPORTS = frozenset({
+    'configure_services',
+    'get_container',
+    'reset_container',
+    'get_supabase_client',
+    'get_openai_client'
+})
+
+
+def __getattr__(name):
+    if name in _PROVIDER_EXPORTS:
+        from personal_ai_trainer.di import provider
+        return getattr(provider, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'DIContainer',
@@ -13,6 +13,7 @@ from personal_ai_trainer.agents.biometric_agent.oura_client import OuraClientWra
 from personal_ai_trainer.knowledge_base.embeddings import get_embedding
 from personal_ai_trainer.exceptions import ConfigurationError
 
+import functools
 import os
 import logging
 from typing import Optional
@@ -20,10 +21,13 @@ from typing import Optional
 logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
 def get_supabase_client():
     """
     Factory function to create a Supabase client.
 
+    The client is created once per process; failures are not cached.
+
     Returns:
         The Supabase client instance.
 
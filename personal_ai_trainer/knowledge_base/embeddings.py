@@ -12,7 +12,7 @@ import os
 
 from personal_ai_trainer.exceptions import EmbeddingError
 from personal_ai_trainer.agents.openai_integration import get_embedding as openai_get_embedding
-from personal_ai_trainer.agents.openai_integration import get_embeddings as openai_get_embeddings
+from personal_ai_trainer.agents.openai_integration import get_embeddings_chunked as openai_get_embeddings
 from personal_ai_trainer.utils.error_handling import with_error_handling
 
 logger = logging.getLogger(__name__)
@@ -47,13 +47,52 @@ def get_embedding(
         ```
     """
     try:
-        # Use the centralized embedding function from openai_integration
-        return openai_get_embedding(text, model)
+        # Use the centralized embedding function from openai_integration; stored embeddings are lists
+        return openai_get_embedding(text, model).tolist()
     except Exception as e:
         logger.error(f"Failed to generate embedding: {e}")
         raise EmbeddingError(f"Failed to generate embedding: {e}") from e
 
 
+def get_query_embedding(query: str, model: str = OPENAI_EMBEDDING_MODEL) -> List[float]:
+    """
+    Generate the embedding for a search query.
+    
+    The query is stripped and lower-cased first, so questions that differ only in case or
+    surrounding whitespace share one entry in the embedding cache and repeat lookups skip
+    the API round trip.
+    
+    Args:
+        query (str): The search query text.
+        model (str): The OpenAI embedding model to use. Defaults to OPENAI_EMBEDDING_MODEL.
+            
+    Returns:
+        List[float]: The embedding vector as a list of floating-point numbers.
+            
+    Raises:
+        EmbeddingError: If the OpenAI API call fails after retries.
+        
+    Example:
+        ```python
+        embedding = get_query_embedding("Optimal running cadence ")
+        ```
+    """
+    return get_embedding(normalize_query(query), model)
+
+
+def normalize_query(query: str) -> str:
+    """
+    Normalize a search query before embedding it.
+    
+    Args:
+        query (str): The search query text.
+            
+    Returns:
+        str: The query stripped and lower-cased.
+    """
+    return query.strip().lower()
+
+
 @with_error_handling(error_types=(Exception,), retry_count=2, retry_delay=1.0)
 def get_embeddings(
     texts: List[str],
@@ -63,6 +102,7 @@ def get_embeddings(
     Generate vector embeddings for multiple texts using OpenAI's embedding API.
     
     This is more efficient than calling get_embedding multiple times for batch processing.
+    Large inputs are split into several API requests that run concurrently.
     
     Args:
         texts (List[str]): The input texts to embed. Should be cleaned and preprocessed.
@@ -82,8 +122,8 @@ def get_embeddings(
         ```
     """
     try:
-        # Use the centralized embeddings function from openai_integration
-        return openai_get_embeddings(texts, model)
+        # Use the centralized embeddings function from openai_integration; stored embeddings are lists
+        return openai_get_embeddings(texts, model).tolist()
     except Exception as e:
         logger.error(f"Failed to generate embeddings: {e}")
         raise EmbeddingError(f"Failed to generate embeddings: {e}") from e
@@ -28,22 +28,11 @@ def add_document(document: KnowledgeBase) -> Optional[str]:
     """
     client = get_supabase_client()
     try:
-        # Convert the document to match kb_chunks structure
-        doc_id = document.document_id
-
-        # For simplicity, we'll store the entire document as one chunk
-        chunk_data = {
-            "doc_id": doc_id,
-            "chunk_id": f"{doc_id}_chunk1",
-            "content": document.content,
-            "embedding": document.embedding
-        }
-
         # Insert into kb_chunks table
-        response = client.table(TABLE_NAME).insert(chunk_data).execute()
+        response = client.table(TABLE_NAME).insert(_to_chunk_row(document)).execute()
 
         if response.data and len(response.data) > 0:
-            return doc_id
+            return document.document_id
         return None
     except Exception as e:
         # Log the full exception details
@@ -51,6 +40,45 @@ def add_document(document: KnowledgeBase) -> Optional[str]:
         return None
 
 
+def add_documents(documents: List[KnowledgeBase]) -> List[str]:
+    """
+    Store several documents in the knowledge base with a single multi-row INSERT.
+
+    Args:
+        documents (List[KnowledgeBase]): The documents to store.
+
+    Returns:
+        List[str]: The document_ids of the inserted documents; empty if the insert failed.
+    """
+    if not documents:
+        return []
+    client = get_supabase_client()
+    try:
+        response = client.table(TABLE_NAME).insert([_to_chunk_row(document) for document in documents]).execute()
+        return [row["doc_id"] for row in response.data or []]
+    except Exception as e:
+        logger.error(f"Failed to add {len(documents)} documents: {e}", exc_info=True)
+        return []
+
+
+def _to_chunk_row(document: KnowledgeBase) -> Dict[str, Any]:
+    """
+    Convert a document to a kb_chunks row; for simplicity the entire document is stored as one chunk.
+
+    The category is only included when set, so tables without the add_kb_chunks_category.sql
+    migration still accept uncategorized documents.
+    """
+    row = {
+        "doc_id": document.document_id,
+        "chunk_id": f"{document.document_id}_chunk1",
+        "content": document.content,
+        "embedding": document.embedding,
+    }
+    if document.category is not None:
+        row["category"] = document.category
+    return row
+
+
 def get_document(document_id: str) -> Optional[KnowledgeBase]:
     """
     Retrieve a document by its ID.
@@ -73,6 +101,7 @@ def get_document(document_id: str) -> Optional[KnowledgeBase]:
                 title=f"Document {chunk['doc_id']}",  # We don't have title in kb_chunks
                 content=chunk["content"],
                 embedding=chunk["embedding"],
+                category=chunk.get("category"),
                 source="kb_chunks",
                 date_added=None  # We don't have date_added in kb_chunks
             )
@@ -101,6 +130,8 @@ def update_document(document_id: str, updates: Dict[str, Any]) -> bool:
             chunk_updates["content"] = updates["content"]
         if "embedding" in updates:
             chunk_updates["embedding"] = updates["embedding"]
+        if "category" in updates:
+            chunk_updates["category"] = updates["category"]
 
         # Update the kb_chunks table
         response = client.table(TABLE_NAME).update(chunk_updates).eq("doc_id", document_id).execute()
@@ -130,7 +161,12 @@ def delete_document(document_id: str) -> bool:
         return False
 
 
-def query_similar_documents(query_embedding: List[float], top_k: int = 5, min_score: float = 0.7) -> List[KnowledgeBase]:
+def query_similar_documents(
+    query_embedding: List[float],
+    top_k: int = 5,
+    min_score: float = 0.7,
+    category: Optional[str] = None
+) -> List[KnowledgeBase]:
     """
     Retrieve the most similar documents to a query embedding.
 
@@ -138,6 +174,9 @@ def query_similar_documents(query_embedding: List[float], top_k: int = 5, min_sc
         query_embedding (List[float]): The embedding to compare against.
         top_k (int): Number of top results to return.
         min_score (float): Minimum similarity score to include.
+        category (Optional[str]): Only consider chunks in this category; the filter is applied
+            in the database, before any similarities are computed. Requires the kb_chunks
+            category column from add_kb_chunks_category.sql. Defaults to None (all chunks).
 
     Returns:
         List[KnowledgeBase]: List of similar documents, sorted by similarity.
@@ -145,7 +184,10 @@ def query_similar_documents(query_embedding: List[float], top_k: int = 5, min_sc
     client = get_supabase_client()
     try:
         # Fetch all embeddings and metadata (could be optimized with pgvector in production)
-        response = client.table(TABLE_NAME).select("*").execute()
+        query = client.table(TABLE_NAME).select("*")
+        if category is not None:
+            query = query.eq("category", category)
+        response = query.execute()
         docs = []
         scored = []
         for row in response.data:
@@ -162,6 +204,7 @@ def query_similar_documents(query_embedding: List[float], top_k: int = 5, min_sc
                 title=f"Document {row['doc_id']}",  # We don't have title in kb_chunks
                 content=row["content"],
                 embedding=row["embedding"],
+                category=row.get("category"),
                 source="kb_chunks",
                 date_added=None  # We don't have date_added in kb_chunks
             ))
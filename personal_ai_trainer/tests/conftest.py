@@ -8,6 +8,7 @@ from personal_ai_trainer.agents.research_agent.agent import ResearchAgent
 from personal_ai_trainer.agents.biometric_agent.agent import BiometricAgent
 from personal_ai_trainer.agents.orchestrator_agent.agent import OrchestratorAgent
 from personal_ai_trainer.agents.biometric_agent.oura_client import OuraClientWrapper
+from personal_ai_trainer.utils.batch_writer import close_shared_writers
 # Import the class whose method we need to patch
 # Import database models needed within fixtures
 
@@ -86,6 +87,9 @@ def mock_di_setup(mock_supabase_client, mock_openai_client, mock_oura_wrapper_in
          patch('personal_ai_trainer.di.provider.get_openai_client', return_value=mock_openai_client), \
          patch('personal_ai_trainer.agents.biometric_agent.oura_client.OuraClientWrapper', return_value=mock_oura_wrapper_instance):
         yield # Allow tests to run with these patches active
+    # Shared writers and orchestrators hold per-test mocks; drop them so tests stay isolated
+    close_shared_writers(timeout=5)
+    OrchestratorAgent.reset_shared()
 
 # --- Fixtures providing REAL Agent instances with MOCKED clients ---
 @pytest.fixture
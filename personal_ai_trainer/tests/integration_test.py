@@ -169,6 +169,7 @@ def test_04_biometric_agent_integration(biometric_agent, mock_supabase_client, m
     with patch.object(mock_supabase_client.table(readiness_table).insert.return_value, 'execute', return_value=mock_insert_response) as mock_execute:
 
         biometric_summary = biometric_agent.get_latest_biometrics()
+        biometric_agent.flush()  # Metrics are written by a background batch writer
 
         biometric_agent.oura_client.get_readiness_data.assert_called_once()
         biometric_agent.oura_client.get_sleep_data.assert_called_once()
@@ -178,7 +179,7 @@ def test_04_biometric_agent_integration(biometric_agent, mock_supabase_client, m
         # Verify insert call chain
         mock_supabase_client.table.assert_called_with(readiness_table)
         mock_supabase_client.table(readiness_table).insert.assert_called_once()
-        insert_call_args = mock_supabase_client.table(readiness_table).insert.call_args[0][0]
+        insert_call_args = mock_supabase_client.table(readiness_table).insert.call_args[0][0][0]  # One row in the batch
         assert insert_call_args['user_id'] == test_user_id
         assert insert_call_args['readiness_score'] == 90
         assert insert_call_args['date'] == '2025-05-05'
@@ -200,6 +201,7 @@ def test_04_biometric_agent_integration(biometric_agent, mock_supabase_client, m
 
 # Patch get_openai_client where the agent/tools likely import it
 # Patch the insert call directly within the test
+@patch('personal_ai_trainer.agents.orchestrator_agent.agent.ENABLE_LLM_PLANNING', True)
 @patch('personal_ai_trainer.agents.openai_integration.get_openai_client')
 def test_05_orchestrator_agent_integration(mock_agent_get_openai, orchestrator_agent, mock_supabase_client, mock_openai_client, research_agent, biometric_agent):
     """Test Orchestrator Agent generating and storing a workout plan."""
@@ -228,6 +230,7 @@ def test_05_orchestrator_agent_integration(mock_agent_get_openai, orchestrator_a
         with patch.object(mock_supabase_client.table(plan_table).insert.return_value, 'execute', return_value=mock_insert_response) as mock_execute:
 
             plan_result_str = orchestrator_agent.generate_workout_plan(goal=goal)
+            orchestrator_agent.flush()  # Plans are written by a background batch writer
 
             mock_get_research.assert_called_once()
             mock_get_readiness.assert_called_once()
@@ -237,7 +240,7 @@ def test_05_orchestrator_agent_integration(mock_agent_get_openai, orchestrator_a
             # Verify Supabase insert call chain
             mock_supabase_client.table.assert_called_with(plan_table)
             mock_supabase_client.table(plan_table).insert.assert_called_once()
-            insert_call_args = mock_supabase_client.table(plan_table).insert.call_args[0][0]
+            insert_call_args = mock_supabase_client.table(plan_table).insert.call_args[0][0][0]  # One row in the batch
             assert insert_call_args['user_id'] == TEST_USER_ID
             assert "Run" in insert_call_args.get('plan_data', '')
             mock_execute.assert_called_once() # Verify execute was called
@@ -247,7 +250,7 @@ def test_06_cli_integration(runner, test_user_id):
     # 1. Test 'plan' command
     goal = "Triathlon prep"
     mock_plan_output = '{"plan": [{"day": "Wednesday", "activity": "Swim"}]}'
-    with patch('personal_ai_trainer.cli.commands.plan.OrchestratorAgent') as MockOrchestratorPlan:
+    with patch('personal_ai_trainer.agents.orchestrator_agent.agent.OrchestratorAgent') as MockOrchestratorPlan:
         mock_instance = MockOrchestratorPlan.return_value
         mock_instance.generate_workout_plan.return_value = mock_plan_output
         result = runner.invoke(cli_app, ["plan", "--goal", goal, "--user-id", test_user_id])
@@ -300,6 +303,7 @@ def test_07_scheduler_integration(mock_time, mock_schedule, test_user_id, mock_s
         # Verify the agent method was called with correct args from nightly_job
         mock_adjust_plan.assert_called_once_with(test_user_id, 90) # Pass user_id string and readiness score
 
+@patch('personal_ai_trainer.agents.orchestrator_agent.agent.ENABLE_LLM_PLANNING', True)
 @patch('personal_ai_trainer.knowledge_base.repository.get_supabase_client')
 @patch('personal_ai_trainer.agents.openai_integration.get_openai_client') # Corrected patch target
 def test_08_end_to_end_flow(mock_agent_get_openai, mock_kb_get_supabase, mock_supabase_client, mock_openai_client, mock_oura_wrapper_instance, mock_get_embedding, research_agent, biometric_agent, orchestrator_agent, test_user_id):
@@ -341,6 +345,7 @@ def test_08_end_to_end_flow(mock_agent_get_openai, mock_kb_get_supabase, mock_su
     # Patch the insert().execute() for this specific call
     with patch.object(mock_supabase_client.table(readiness_table).insert.return_value, 'execute', return_value=mock_insert_resp_bio1) as mock_bio_insert_execute:
         bio_summary = biometric_agent.get_latest_biometrics()
+        biometric_agent.flush()  # Metrics are written by a background batch writer
         assert bio_summary['readiness']['score'] == 90
         mock_supabase_client.table(readiness_table).insert.assert_called_once()
         mock_bio_insert_execute.assert_called_once()
@@ -357,6 +362,7 @@ def test_08_end_to_end_flow(mock_agent_get_openai, mock_kb_get_supabase, mock_su
     # Patch the insert().execute() for this specific call
     with patch.object(mock_supabase_client.table(plan_table).insert.return_value, 'execute', return_value=mock_insert_resp_plan1) as mock_plan_insert_execute:
         initial_plan = orchestrator_agent.generate_workout_plan(goal=goal)
+        orchestrator_agent.flush()  # Plans are written by a background batch writer
         assert "Long Run 10k" in initial_plan
         mock_supabase_client.table(plan_table).insert.assert_called_once()
         mock_plan_insert_execute.assert_called_once()
@@ -0,0 +1,93 @@
+# personal_ai_trainer/tests/test_batch_writer.py
+import pytest
+from unittest.mock import MagicMock
+
+from personal_ai_trainer.utils.batch_writer import (
+    SupabaseBatchWriter,
+    close_shared_writers,
+    get_shared_writer,
+)
+
+
+def test_flush_writes_queued_rows_in_one_batch(mock_supabase_client):
+    writer = SupabaseBatchWriter(mock_supabase_client, "readiness_metrics", max_delay=5.0)
+    writer.put({"user_id": "u1", "readiness_score": 80})
+    writer.put({"user_id": "u1", "readiness_score": 85})
+
+    assert writer.flush(timeout=5) is True
+
+    insert = mock_supabase_client.table.return_value.insert
+    insert.assert_called_once_with([
+        {"user_id": "u1", "readiness_score": 80},
+        {"user_id": "u1", "readiness_score": 85},
+    ])
+    mock_supabase_client.table.assert_called_with("readiness_metrics")
+    writer.close(timeout=5)
+
+
+def test_flush_without_rows_returns_immediately(mock_supabase_client):
+    writer = SupabaseBatchWriter(mock_supabase_client, "readiness_metrics")
+
+    assert writer.flush(timeout=0) is True
+    assert writer._thread is None
+    mock_supabase_client.table.assert_not_called()
+
+
+def test_failed_batch_is_retried_row_by_row(mock_supabase_client):
+    insert = mock_supabase_client.table.return_value.insert
+    good = MagicMock(name="GoodInsert")
+    bad = MagicMock(name="BadInsert")
+    bad.execute.side_effect = Exception("bad row")
+
+    def fake_insert(rows):
+        if len(rows) > 1 or rows[0]["id"] == 2:
+            return bad
+        return good
+
+    insert.side_effect = fake_insert
+    writer = SupabaseBatchWriter(mock_supabase_client, "readiness_metrics", max_delay=5.0)
+    for i in range(3):
+        writer.put({"id": i})
+    assert writer.flush(timeout=5) is True
+
+    calls = [c.args[0] for c in insert.call_args_list]
+    assert calls == [[{"id": 0}, {"id": 1}, {"id": 2}], [{"id": 0}], [{"id": 1}], [{"id": 2}]]
+    assert good.execute.call_count == 2
+    writer.close(timeout=5)
+
+
+def test_close_drains_rows_and_rejects_new_ones(mock_supabase_client):
+    writer = SupabaseBatchWriter(mock_supabase_client, "workout_plans", max_delay=5.0)
+    writer.put({"plan_id": "p1"})
+
+    assert writer.close(timeout=5) is True
+    mock_supabase_client.table.return_value.insert.assert_called_once_with([{"plan_id": "p1"}])
+    assert writer.close(timeout=5) is True
+    with pytest.raises(RuntimeError):
+        writer.put({"plan_id": "p2"})
+
+
+def test_max_batch_size_splits_batches(mock_supabase_client):
+    writer = SupabaseBatchWriter(mock_supabase_client, "readiness_metrics", max_batch_size=2, max_delay=5.0)
+    for i in range(5):
+        writer.put({"id": i})
+    assert writer.flush(timeout=5) is True
+
+    sizes = [len(c.args[0]) for c in mock_supabase_client.table.return_value.insert.call_args_list]
+    assert sum(sizes) == 5
+    assert max(sizes) <= 2
+    writer.close(timeout=5)
+
+
+def test_get_shared_writer_is_keyed_by_client_and_table(mock_supabase_client):
+    other_client = MagicMock(name="OtherSupabaseClient")
+
+    writer = get_shared_writer(mock_supabase_client, "readiness_metrics")
+    assert get_shared_writer(mock_supabase_client, "readiness_metrics") is writer
+    assert get_shared_writer(mock_supabase_client, "workout_plans") is not writer
+    assert get_shared_writer(other_client, "readiness_metrics") is not writer
+
+    close_shared_writers(timeout=5)
+    replacement = get_shared_writer(mock_supabase_client, "readiness_metrics")
+    assert replacement is not writer
+    assert writer._closed
@@ -0,0 +1,112 @@
+# personal_ai_trainer/tests/test_biometric_tools.py
+import json
+
+import numpy as np
+
+from personal_ai_trainer.agents.biometric_agent.tools.historical_analysis import (
+    BiometricFrame,
+    HistoricalDataAnalysisTool,
+)
+from personal_ai_trainer.agents.biometric_agent.tools.plan_adjustment import PlanAdjustmentTool
+from personal_ai_trainer.agents.biometric_agent.tools.readiness_calculation import ReadinessCalculationTool
+
+nan = np.nan
+
+# (sleep, activity, readiness) covering each branch of calculate_readiness
+READINESS_CASES = [
+    (80, 70, 90),
+    (80, 70, None),
+    (80, None, None),
+    (None, 70, None),
+    (None, None, None),
+    (None, None, 0),
+    (None, None, 55),
+]
+
+
+def _record(sleep, activity, readiness):
+    record = {}
+    if sleep is not None:
+        record["sleep"] = {"score": sleep}
+    if activity is not None:
+        record["activity"] = {"score": activity}
+    if readiness is not None:
+        record["readiness"] = {"score": readiness}
+    return record
+
+
+def _column(values):
+    return [nan if v is None else v for v in values]
+
+
+def test_calculate_readiness_batch_matches_scalar():
+    tool = ReadinessCalculationTool()
+    sleep, activity, readiness = zip(*READINESS_CASES)
+
+    batch = tool.calculate_readiness_batch(_column(sleep), _column(activity), _column(readiness))
+
+    expected = [tool.calculate_readiness(_record(*case)) for case in READINESS_CASES]
+    assert batch.dtype == np.float64
+    assert batch.tolist() == expected
+
+
+def test_calculate_readiness_batch_empty():
+    result = ReadinessCalculationTool().calculate_readiness_batch([], [], [])
+    assert result.shape == (0,)
+
+
+def test_biometric_frame_from_records():
+    records = [
+        {"readiness": {"score": 80, "summary_date": "2025-05-01"}, "sleep": {"score": 75}},
+        {"date": "2025-05-02", "activity": {"score": 60}},
+        {"readiness": {"score": None}},
+    ]
+
+    frame = BiometricFrame.from_records(records)
+
+    assert len(frame) == 3
+    assert frame.dates.tolist() == ["2025-05-01", "2025-05-02", None]
+    np.testing.assert_array_equal(frame.readiness, [80, nan, nan])
+    np.testing.assert_array_equal(frame.sleep_score, [75, nan, nan])
+    np.testing.assert_array_equal(frame.activity_score, [nan, 60, nan])
+
+
+def test_analyze_trends_accepts_frame_or_records():
+    records = [{"readiness": {"score": s}} for s in (70, None, 80, 90)]
+    tool = HistoricalDataAnalysisTool()
+
+    from_records = tool.analyze_trends(records, include_history=True)
+    from_frame = tool.analyze_trends(BiometricFrame.from_records(records), include_history=True)
+
+    assert from_records == from_frame
+    assert from_records["average_readiness"] == 80.0
+    assert from_records["min_readiness"] == 70.0
+    assert from_records["max_readiness"] == 90.0
+    assert from_records["trend"] == "increasing"
+    assert from_records["history"] == [70.0, 80.0, 90.0]
+    assert isinstance(from_records["history"], list)
+    json.dumps(from_records)
+
+
+def test_analyze_trends_without_scores():
+    tool = HistoricalDataAnalysisTool()
+
+    assert "message" in tool.analyze_trends([])
+    assert "message" in tool.analyze_trends([{"sleep": {"score": 70}}])
+    assert "history" not in tool.analyze_trends([{"readiness": {"score": 70}}])
+
+
+def test_adjust_plans_batch_matches_adjust_plan():
+    tool = PlanAdjustmentTool()
+    base_plan = {"plan_id": "p1", "exercises": [{"name": "Squat"}], "intensity": "moderate"}
+    # Boundaries: 60 and 85 are moderate; NaN compares false both ways and stays moderate
+    scores = [0.0, 59.9, 60.0, 72.0, 85.0, 85.1, 100.0, nan]
+
+    batch = tool.adjust_plans_batch(np.array(scores), base_plan)
+
+    assert batch == [tool.adjust_plan(score, base_plan) for score in scores]
+    assert [plan["intensity"] for plan in batch] == [
+        "low", "low", "moderate", "moderate", "moderate", "high", "high", "moderate",
+    ]
+    assert all(plan["exercises"] is base_plan["exercises"] for plan in batch)
+    assert base_plan["intensity"] == "moderate"
@@ -0,0 +1,146 @@
+# personal_ai_trainer/tests/test_cli_commands.py
+import json
+from unittest.mock import MagicMock, patch
+
+from personal_ai_trainer.cli.commands import log, plan, profile, research
+
+
+def test_research_list_applies_limit(runner, mock_supabase_client):
+    chain = mock_supabase_client.table.return_value.select.return_value.order.return_value.limit
+    chain.return_value.execute.return_value = MagicMock(data=[
+        {"doc_id": "doc-1", "chunk_id": 0, "content_preview": "Short content", "created_at": "2025-05-05"},
+    ])
+
+    with patch("personal_ai_trainer.di.provider.get_supabase_client", return_value=mock_supabase_client):
+        result = runner.invoke(research.app, ["list", "--limit", "5"])
+
+    assert result.exit_code == 0, f"CLI Error: {result.stdout}"
+    mock_supabase_client.table.return_value.select.assert_called_once_with("doc_id, chunk_id, content_preview, created_at")
+    mock_supabase_client.table.return_value.select.return_value.order.assert_called_once_with("created_at", desc=True)
+    chain.assert_called_once_with(5)
+    assert "Document ID: doc-1" in result.stdout
+    assert "Preview: Short content" in result.stdout
+
+
+def test_research_list_defaults_to_fifty(runner, mock_supabase_client):
+    chain = mock_supabase_client.table.return_value.select.return_value.order.return_value.limit
+    chain.return_value.execute.return_value = MagicMock(data=[])
+
+    with patch("personal_ai_trainer.di.provider.get_supabase_client", return_value=mock_supabase_client):
+        result = runner.invoke(research.app, ["list"])
+
+    assert result.exit_code == 0, f"CLI Error: {result.stdout}"
+    chain.assert_called_once_with(50)
+    assert "No documents found" in result.stdout
+
+
+def test_research_list_rejects_non_positive_limit(runner, mock_supabase_client):
+    with patch("personal_ai_trainer.di.provider.get_supabase_client", return_value=mock_supabase_client):
+        result = runner.invoke(research.app, ["list", "--limit", "0"])
+
+    assert result.exit_code != 0
+    mock_supabase_client.table.assert_not_called()
+
+
+def test_research_add_many_ingests_matching_files(runner, tmp_path):
+    (tmp_path / "nested").mkdir()
+    for name in ("b_paper.pdf", "a_paper.pdf", "nested/c_paper.pdf", "notes.txt"):
+        (tmp_path / name).write_text("placeholder")
+    mock_agent = MagicMock(name="ResearchAgentMock")
+    mock_agent.process_research_documents.return_value = ["doc-a", "doc-b", "doc-c"]
+
+    with patch.object(research, "_get_research_agent", return_value=mock_agent):
+        result = runner.invoke(research.app, ["add-many", "--glob", str(tmp_path / "**" / "*.pdf")])
+
+    assert result.exit_code == 0, f"CLI Error: {result.stdout}"
+    mock_agent.process_research_documents.assert_called_once()
+    documents = mock_agent.process_research_documents.call_args[0][0]
+    assert [(source, title) for _, source, title in documents] == [
+        ("a_paper.pdf", "a_paper"),
+        ("b_paper.pdf", "b_paper"),
+        ("c_paper.pdf", "c_paper"),
+    ]
+    assert "Added 3 research document(s)" in result.stdout
+    assert "(Document ID: doc-c)" in result.stdout
+
+
+def test_research_add_many_without_matches(runner, tmp_path):
+    mock_agent = MagicMock(name="ResearchAgentMock")
+
+    with patch.object(research, "_get_research_agent", return_value=mock_agent):
+        result = runner.invoke(research.app, ["add-many", "--glob", str(tmp_path / "*.pdf")])
+
+    assert result.exit_code == 1
+    assert "No files match" in result.stdout
+    mock_agent.process_research_documents.assert_not_called()
+
+
+def test_profile_create_from_file(runner, tmp_path):
+    profile_file = tmp_path / "profile.json"
+    profile_file.write_text(json.dumps({
+        "name": "Test User",
+        "age": 30,
+        "height": 180,
+        "weight": 75.5,
+        "preferences": {"days_per_week": 4, "equipment": ["dumbbells"]},
+    }))
+
+    with patch.object(profile, "add_user_profile", return_value=True) as mock_add, \
+            patch.object(profile, "set_default_user_id") as mock_set_default:
+        result = runner.invoke(profile.app, ["create", "--from-file", str(profile_file)])
+
+    assert result.exit_code == 0, f"CLI Error: {result.stdout}"
+    created = mock_add.call_args[0][0]
+    assert created.name == "Test User"
+    assert created.height == 180.0
+    assert json.loads(created.preferences) == {"days_per_week": 4, "equipment": ["dumbbells"]}
+    assert created.user_id
+    mock_set_default.assert_called_once_with(created.user_id)
+    assert f"User profile created with user_id: {created.user_id}" in result.stdout
+
+
+def test_profile_create_from_invalid_file(runner, tmp_path):
+    profile_file = tmp_path / "profile.json"
+    profile_file.write_text(json.dumps({"name": "Test User", "age": "unknown"}))
+
+    with patch.object(profile, "add_user_profile") as mock_add:
+        result = runner.invoke(profile.app, ["create", "--from-file", str(profile_file)])
+
+    assert result.exit_code == 1
+    assert "Invalid profile file" in result.stdout
+    mock_add.assert_not_called()
+
+
+def test_log_exercise_from_file(runner, tmp_path):
+    exercise_file = tmp_path / "exercises.json"
+    exercise_file.write_text(json.dumps([
+        {"name": "Bench Press", "sets": 3, "reps": 10, "weight": 50.5},
+        {"name": "Push-ups", "sets": 2, "reps": 20},
+    ]))
+
+    result = runner.invoke(log.app, ["exercise", "--from-file", str(exercise_file)])
+
+    assert result.exit_code == 0, f"CLI Error: {result.stdout}"
+    assert "Logged exercise: Bench Press, Sets: 3, Reps: 10, Weight: 50.5" in result.stdout
+    assert "Logged exercise: Push-ups, Sets: 2, Reps: 20, Weight: N/A" in result.stdout
+
+
+def test_log_exercise_from_invalid_file(runner, tmp_path):
+    exercise_file = tmp_path / "exercises.json"
+    exercise_file.write_text('[{"name": "Bench Press", "sets": 3}]')
+
+    result = runner.invoke(log.app, ["exercise", "--from-file", str(exercise_file)])
+
+    assert result.exit_code == 1
+    assert "Invalid exercise file" in result.stdout
+    assert "Logged exercise" not in result.stdout
+
+
+def test_plan_generate_builds_orchestrator_when_run(runner, test_user_id):
+    with patch("personal_ai_trainer.agents.orchestrator_agent.agent.OrchestratorAgent") as MockOrchestrator:
+        MockOrchestrator.return_value.generate_workout_plan.return_value = '{"plan": []}'
+        result = runner.invoke(plan.app, ["generate", "--goal", "strength", "--user-id", test_user_id])
+
+    assert result.exit_code == 0, f"CLI Error: {result.stdout}"
+    MockOrchestrator.return_value.generate_workout_plan.assert_called_once_with(goal="strength", user_id=test_user_id)
+    assert "Generated workout plan for goal: strength" in result.stdout
@@ -0,0 +1,73 @@
+# personal_ai_trainer/tests/test_embedding_batcher.py
+import threading
+
+import pytest
+from unittest.mock import MagicMock
+
+from personal_ai_trainer.utils.embedding_batcher import EmbeddingBatcher
+
+
+def test_submit_resolves_to_own_embedding():
+    embed_batch = MagicMock(side_effect=lambda texts: [[float(len(t))] for t in texts])
+    batcher = EmbeddingBatcher(embed_batch)
+
+    assert batcher.submit("abc").result(timeout=5) == [3.0]
+
+
+def test_concurrent_texts_are_embedded_in_one_request():
+    gate = threading.Event()
+    started = threading.Event()
+    calls = []
+
+    def embed_batch(texts):
+        calls.append(list(texts))
+        started.set()
+        gate.wait(5)  # Hold the first request so the rest queue up behind it
+        return [text.upper() for text in texts]
+
+    batcher = EmbeddingBatcher(embed_batch, max_batch_size=3, max_delay=0)
+    first = batcher.submit("a")
+    assert started.wait(5)
+    batcher.max_delay = 5.0  # The next batch closes on size, not on time
+    futures = [batcher.submit(text) for text in ("b", "c", "d")]
+    gate.set()
+
+    assert first.result(timeout=5) == "A"
+    assert [f.result(timeout=5) for f in futures] == ["B", "C", "D"]
+    assert calls == [["a"], ["b", "c", "d"]]
+
+
+def test_failed_batch_is_retried_per_text():
+    gate = threading.Event()
+    started = threading.Event()
+    calls = []
+
+    def embed_batch(texts):
+        calls.append(list(texts))
+        if texts == ["first"]:
+            started.set()
+            gate.wait(5)
+            return ["FIRST"]
+        if "bad" in texts:
+            raise RuntimeError("invalid input")
+        return [text.upper() for text in texts]
+
+    batcher = EmbeddingBatcher(embed_batch, max_batch_size=3, max_delay=0)
+    batcher.submit("first")
+    assert started.wait(5)
+    batcher.max_delay = 5.0
+    good, bad, other = (batcher.submit(text) for text in ("good", "bad", "other"))
+    gate.set()
+
+    assert good.result(timeout=5) == "GOOD"
+    assert other.result(timeout=5) == "OTHER"
+    with pytest.raises(RuntimeError, match="invalid input"):
+        bad.result(timeout=5)
+    assert calls[1:] == [["good", "bad", "other"], ["good"], ["bad"], ["other"]]
+
+
+def test_length_mismatch_fails_every_text_in_batch():
+    batcher = EmbeddingBatcher(MagicMock(return_value=[]))
+
+    with pytest.raises(ValueError, match="0 result"):
+        batcher.submit("text").result(timeout=5)
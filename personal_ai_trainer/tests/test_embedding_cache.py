@@ -0,0 +1,81 @@
+# personal_ai_trainer/tests/test_embedding_cache.py
+import numpy as np
+
+from personal_ai_trainer.utils.embedding_cache import EmbeddingCache
+
+MODEL = "text-embedding-ada-002"
+
+
+def _vector(value):
+    return np.full(4, value, dtype=np.float32)
+
+
+def test_key_depends_on_model_and_text():
+    key = EmbeddingCache.key(MODEL, "Running is good")
+
+    assert key == EmbeddingCache.key(MODEL, "Running is good")
+    assert key[0] == MODEL
+    assert key != EmbeddingCache.key(MODEL, "Running is bad")
+    assert key != EmbeddingCache.key("text-embedding-3-small", "Running is good")
+
+
+def test_lru_evicts_least_recently_used():
+    cache = EmbeddingCache(maxsize=2)
+    a, b, c = (EmbeddingCache.key(MODEL, t) for t in "abc")
+    cache.put(a, _vector(1))
+    cache.put(b, _vector(2))
+
+    assert cache.get(a) is not None  # a is now the most recently used
+    cache.put(c, _vector(3))
+
+    assert cache.get(b) is None
+    np.testing.assert_array_equal(cache.get(a), _vector(1))
+    np.testing.assert_array_equal(cache.get(c), _vector(3))
+
+
+def test_clear_drops_memory_entries():
+    cache = EmbeddingCache()
+    key = EmbeddingCache.key(MODEL, "text")
+    cache.put(key, _vector(1))
+
+    cache.clear()
+
+    assert cache.get(key) is None
+
+
+def test_sqlite_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "cache" / "embeddings.sqlite3")
+    key = EmbeddingCache.key(MODEL, "Running is good")
+    EmbeddingCache(path=path).put(key, _vector(0.5))
+
+    reopened = EmbeddingCache(path=path)
+    embedding = reopened.get(key)
+
+    assert embedding.dtype == np.float32
+    np.testing.assert_array_equal(embedding, _vector(0.5))
+    assert not embedding.flags.writeable
+    assert reopened.get(EmbeddingCache.key(MODEL, "unknown")) is None
+
+
+def test_sqlite_hits_are_promoted_to_memory(tmp_path):
+    path = str(tmp_path / "embeddings.sqlite3")
+    key = EmbeddingCache.key(MODEL, "text")
+    EmbeddingCache(path=path).put(key, _vector(2))
+
+    cache = EmbeddingCache(path=path)
+    first = cache.get(key)
+
+    assert cache.get(key) is first
+    cache.clear()
+    np.testing.assert_array_equal(cache.get(key), _vector(2))
+
+
+def test_unusable_path_falls_back_to_memory(tmp_path):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    cache = EmbeddingCache(path=str(blocker / "embeddings.sqlite3"))
+    key = EmbeddingCache.key(MODEL, "text")
+
+    cache.put(key, _vector(1))
+
+    np.testing.assert_array_equal(cache.get(key), _vector(1))
@@ -237,6 +237,7 @@ def test_04_biometric_agent_integration(biometric_agent, mock_supabase_client, m
 
         # Call agent method
         biometric_summary = biometric_agent.get_latest_biometrics()
+        biometric_agent.flush()  # Metrics are written by a background batch writer
 
         # Verify OuraClient mocks were called on the agent's injected client instance
         biometric_agent.oura_client.get_readiness_data.assert_called_once()
@@ -252,7 +253,7 @@ def test_04_biometric_agent_integration(biometric_agent, mock_supabase_client, m
         # Verify data was stored via Supabase insert (using the main mock client)
         mock_supabase_client.table.assert_called_with(readiness_table)
         mock_supabase_client.table(readiness_table).insert.assert_called_once() # Check insert was called
-        insert_call_args = mock_supabase_client.table(readiness_table).insert.call_args[0][0]
+        insert_call_args = mock_supabase_client.table(readiness_table).insert.call_args[0][0][0]  # One row in the batch
         assert insert_call_args['user_id'] == test_user_id
         assert insert_call_args['readiness_score'] == 90
         assert insert_call_args['sleep_score'] == 85
@@ -298,6 +299,7 @@ def test_04_biometric_agent_integration(biometric_agent, mock_supabase_client, m
 
 # Patch get_openai_client where the agent/tools likely import it
 # Patch the insert call directly within the test
+@patch('personal_ai_trainer.agents.orchestrator_agent.agent.ENABLE_LLM_PLANNING', True)
 @patch('personal_ai_trainer.agents.openai_integration.get_openai_client')
 def test_05_orchestrator_agent_integration(mock_agent_get_openai, orchestrator_agent, mock_supabase_client, mock_openai_client, research_agent, biometric_agent):
     """Test Orchestrator Agent generating and storing a workout plan."""
@@ -331,6 +333,7 @@ def test_05_orchestrator_agent_integration(mock_agent_get_openai, orchestrator_a
 
             # Call the orchestrator agent method
             plan_result_str = orchestrator_agent.generate_workout_plan(goal=goal)
+            orchestrator_agent.flush()  # Plans are written by a background batch writer
 
             # Verify calls to internal helper methods
             mock_get_research.assert_called_once()
@@ -346,7 +349,7 @@ def test_05_orchestrator_agent_integration(mock_agent_get_openai, orchestrator_a
             # Verify Supabase insert (using the main mock client)
             mock_supabase_client.table.assert_called_with(plan_table)
             mock_supabase_client.table(plan_table).insert.assert_called_once()
-            insert_call_args = mock_supabase_client.table(plan_table).insert.call_args[0][0]
+            insert_call_args = mock_supabase_client.table(plan_table).insert.call_args[0][0][0]  # One row in the batch
             assert insert_call_args['user_id'] == orchestrator_agent.user_id # Use agent's user_id
             assert insert_call_args['status'] == 'active'
             # Check plan_data field after str() conversion
@@ -363,8 +366,8 @@ def test_06_cli_integration(runner, test_user_id):
     # Patch the OrchestratorAgent where it's used by the CLI command
     # The DI container should provide the mocked agent, but we might need to
     # control its return value specifically for this CLI call.
-    # Patching the class itself within the command's module scope.
-    with patch('personal_ai_trainer.cli.commands.plan.OrchestratorAgent') as MockOrchestratorPlan:
+    # Patching the class in its defining module, which the command imports from when it runs.
+    with patch('personal_ai_trainer.agents.orchestrator_agent.agent.OrchestratorAgent') as MockOrchestratorPlan:
         mock_instance = MockOrchestratorPlan.return_value
         # Configure the specific method mock for this test
         mock_instance.generate_workout_plan.return_value = mock_plan_output
@@ -446,6 +449,7 @@ def test_07_scheduler_integration(mock_time, mock_schedule, test_user_id, mock_s
 
 
 # Patch get_supabase_client and get_openai_client specifically where they are imported
+@patch('personal_ai_trainer.agents.orchestrator_agent.agent.ENABLE_LLM_PLANNING', True)
 @patch('personal_ai_trainer.knowledge_base.repository.get_supabase_client')
 @patch('personal_ai_trainer.agents.openai_integration.get_openai_client') # Corrected patch target
 def test_08_end_to_end_flow(
@@ -495,6 +499,7 @@ def test_08_end_to_end_flow(
     # Patch the insert().execute() for this specific call
     with patch.object(mock_supabase_client.table(readiness_table).insert.return_value, 'execute', return_value=mock_insert_resp_bio1) as mock_bio_insert_execute:
         bio_summary = biometric_agent.get_latest_biometrics()
+        biometric_agent.flush()  # Metrics are written by a background batch writer
         assert bio_summary['readiness']['score'] == 90
         mock_supabase_client.table(readiness_table).insert.assert_called_once()
         mock_bio_insert_execute.assert_called_once()
@@ -514,6 +519,7 @@ def test_08_end_to_end_flow(
     # Patch the insert().execute() for this specific call
     with patch.object(mock_supabase_client.table(plan_table).insert.return_value, 'execute', return_value=mock_insert_resp_plan1) as mock_plan_insert_execute:
         initial_plan = orchestrator_agent.generate_workout_plan(goal=goal)
+        orchestrator_agent.flush()  # Plans are written by a background batch writer
         assert "Long Run 10k" in initial_plan
         mock_supabase_client.table(plan_table).insert.assert_called_once()
         mock_plan_insert_execute.assert_called_once()
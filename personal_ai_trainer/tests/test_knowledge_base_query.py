@@ -0,0 +1,46 @@
+# personal_ai_trainer/tests/test_knowledge_base_query.py
+import pytest
+from unittest.mock import MagicMock, patch
+
+from personal_ai_trainer.agents import openai_integration
+from personal_ai_trainer.agents.research_agent.tools import knowledge_base_query
+from personal_ai_trainer.agents.research_agent.tools.knowledge_base_query import KnowledgeBaseQueryTool
+from personal_ai_trainer.database.models import KnowledgeBase
+from personal_ai_trainer.utils.embedding_cache import EmbeddingCache
+
+
+@pytest.fixture
+def batched_openai(mock_openai_client):
+    """Route the query batcher to the mocked OpenAI client with an empty embedding cache."""
+    knowledge_base_query._query_batcher.cache_clear()
+    with patch.object(openai_integration, "get_openai_client", return_value=mock_openai_client), \
+            patch.object(openai_integration, "_embedding_cache", EmbeddingCache()):
+        yield mock_openai_client
+    knowledge_base_query._query_batcher.cache_clear()
+
+
+def test_query_embeds_through_batcher(batched_openai):
+    batched_openai.embeddings.create.return_value = MagicMock(data=[MagicMock(index=0, embedding=[0.5, 0.25])])
+    document = KnowledgeBase(document_id="doc-1", title="Running Cadence", content="180 steps per minute",
+                             embedding=[0.5, 0.25], category="fitness")
+
+    with patch.object(knowledge_base_query.kb_repo, "query_similar_documents", return_value=[document]) as mock_similar:
+        results = KnowledgeBaseQueryTool().query("  Optimal Running Cadence ", top_k=3)
+
+    batched_openai.embeddings.create.assert_called_once()
+    assert batched_openai.embeddings.create.call_args.kwargs["input"] == ["optimal running cadence"]
+    mock_similar.assert_called_once_with([0.5, 0.25], top_k=3)
+    assert results == [document.model_dump(exclude={"embedding"})]
+
+
+def test_query_failure_is_not_retried_outside_the_client(batched_openai):
+    batched_openai.embeddings.create.side_effect = Exception("service unavailable")
+
+    with patch.object(knowledge_base_query.kb_repo, "query_similar_documents") as mock_similar, \
+            patch("personal_ai_trainer.utils.error_handling.time.sleep") as mock_sleep:
+        results = KnowledgeBaseQueryTool().query("optimal running cadence")
+
+    assert results == []
+    batched_openai.embeddings.create.assert_called_once()
+    mock_sleep.assert_not_called()
+    mock_similar.assert_not_called()
@@ -0,0 +1,44 @@
+# personal_ai_trainer/tests/test_openai_integration.py
+from unittest.mock import MagicMock, patch
+
+from personal_ai_trainer.agents import openai_integration
+from personal_ai_trainer.agents.openai_integration import EMBEDDING_MAX_TOKENS, _truncate_for_embedding
+
+
+def _fake_encoding(tokens_per_char):
+    """Encoding whose tokens are (char index) repeated tokens_per_char times."""
+    encoding = MagicMock(name="EncodingMock")
+    encoding.encode.side_effect = lambda text: [i for i in range(len(text)) for _ in range(tokens_per_char)]
+    encoding.decode.side_effect = lambda tokens: "x" * len(set(tokens))
+    return encoding
+
+
+def test_short_ascii_text_skips_tokenizer():
+    encoding = _fake_encoding(1)
+
+    with patch.object(openai_integration, "_get_token_encoding", return_value=encoding):
+        text = "a" * EMBEDDING_MAX_TOKENS
+        assert _truncate_for_embedding(text, "text-embedding-ada-002") is text
+
+    encoding.encode.assert_not_called()
+
+
+def test_few_characters_with_many_tokens_are_truncated():
+    # Well under the limit in characters, but each emoji takes several tokens
+    text = "\U0001F3CB" * (EMBEDDING_MAX_TOKENS // 2)
+    encoding = _fake_encoding(3)
+
+    with patch.object(openai_integration, "_get_token_encoding", return_value=encoding):
+        result = _truncate_for_embedding(text, "text-embedding-ada-002")
+
+    encoding.encode.assert_called_once_with(text)
+    encoding.decode.assert_called_once()
+    assert len(encoding.decode.call_args[0][0]) == EMBEDDING_MAX_TOKENS
+    assert len(result) < len(text)
+
+
+def test_text_is_kept_without_tiktoken():
+    text = "word " * EMBEDDING_MAX_TOKENS
+
+    with patch.object(openai_integration, "_get_token_encoding", return_value=None):
+        assert _truncate_for_embedding(text, "text-embedding-ada-002") is text
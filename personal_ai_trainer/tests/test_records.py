@@ -0,0 +1,65 @@
+# personal_ai_trainer/tests/test_records.py
+import numpy as np
+
+from personal_ai_trainer.agents.orchestrator_agent._records import MAX_REPS, best_weight_table, find_prs
+
+BESTS = {
+    "Barbell Squats": {5: 120.0, 8: 105.0},
+    "Bench Press": {3: 90.0},
+}
+
+
+def test_best_weight_table_carries_bests_to_lower_rep_counts():
+    rows, table = best_weight_table(BESTS)
+
+    squat = table[rows["Barbell Squats"]]
+    assert table.shape == (2, MAX_REPS + 1)
+    assert squat[1:6].tolist() == [120.0] * 5
+    assert squat[6:9].tolist() == [105.0] * 3
+    assert np.isneginf(squat[9:]).all()
+    assert table[rows["Bench Press"], 3] == 90.0
+    assert np.isneginf(table[rows["Bench Press"], 4])
+
+
+def test_best_weight_table_clips_rep_counts():
+    rows, table = best_weight_table({"Push-ups": {0: 0.0, MAX_REPS + 20: 10.0, MAX_REPS: 5.0}})
+
+    row = table[rows["Push-ups"]]
+    assert row[MAX_REPS] == 10.0
+    assert row[1] == 10.0
+
+
+def test_find_prs_compares_against_best_for_at_least_as_many_reps():
+    rows, table = best_weight_table(BESTS)
+    squat, bench = rows["Barbell Squats"], rows["Bench Press"]
+
+    sets = [
+        (squat, 5, 120.0, False),  # Ties the best, not a record
+        (squat, 5, 122.5, True),
+        (squat, 4, 115.0, False),  # 120 has been lifted for 5 reps, which covers 4
+        (squat, 6, 110.0, True),  # Best for 6+ reps is the 105 set of 8
+        (squat, 9, 20.0, True),  # Never done 9+ reps
+        (bench, 3, 85.0, False),
+        (bench, 2, 95.0, True),
+    ]
+    exercise_rows, reps, weights, expected = zip(*sets)
+
+    result = find_prs(table, exercise_rows, reps, weights)
+
+    assert result.dtype == np.bool_
+    assert result.tolist() == list(expected)
+
+
+def test_find_prs_clips_reps_to_tracked_range():
+    rows, table = best_weight_table({"Push-ups": {MAX_REPS: 10.0}})
+    row = rows["Push-ups"]
+
+    result = find_prs(table, [row, row, row], [MAX_REPS + 10, MAX_REPS + 10, 0], [10.0, 12.5, 10.0])
+
+    assert result.tolist() == [False, True, False]
+
+
+def test_find_prs_without_sets():
+    _, table = best_weight_table(BESTS)
+
+    assert find_prs(table, [], [], []).shape == (0,)
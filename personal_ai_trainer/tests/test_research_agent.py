@@ -0,0 +1,44 @@
+# personal_ai_trainer/tests/test_research_agent.py
+import threading
+import time
+
+import pytest
+from unittest.mock import patch
+
+from personal_ai_trainer.exceptions import EmbeddingError
+
+
+def test_process_research_document_summarizes_and_stores(research_agent):
+    with patch("personal_ai_trainer.agents.openai_integration.openai_chat_completion_json",
+               return_value={"summary": "Cadence matters."}), \
+            patch("personal_ai_trainer.knowledge_base.embeddings.get_embedding", return_value=[0.1, 0.2]), \
+            patch("personal_ai_trainer.knowledge_base.repository.add_document") as mock_add:
+        summary = research_agent.process_research_document("Running content", "paper.pdf", "Running Cadence")
+
+    assert summary == "Cadence matters."
+    stored = mock_add.call_args[0][0]
+    assert stored.title == "Running Cadence"
+    assert stored.embedding == [0.1, 0.2]
+
+
+def test_process_research_document_fails_without_waiting_for_summary(research_agent):
+    release = threading.Event()
+
+    def slow_summary(**kwargs):
+        release.wait(10)
+        return {"summary": "late"}
+
+    try:
+        with patch("personal_ai_trainer.agents.openai_integration.openai_chat_completion_json",
+                   side_effect=slow_summary), \
+                patch("personal_ai_trainer.knowledge_base.embeddings.get_embedding",
+                      side_effect=EmbeddingError("embedding failed")), \
+                patch("personal_ai_trainer.knowledge_base.repository.add_document") as mock_add:
+            start = time.monotonic()
+            with pytest.raises(EmbeddingError):
+                research_agent.process_research_document("Running content", "paper.pdf", "Running Cadence")
+            # The summary is blocked for 10 seconds, so the error surfaced without waiting for it
+            assert time.monotonic() - start < 5
+            mock_add.assert_not_called()
+    finally:
+        release.set()
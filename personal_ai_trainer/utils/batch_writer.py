@@ -0,0 +1,283 @@
+"""
+Background batch writer for Supabase tables.
+
+This module provides a small queue-backed writer that moves Supabase inserts off the
+request path and coalesces rows queued close together into a single INSERT.
+"""
+
+import atexit
+import logging
+import queue
+import threading
+import time
+import weakref
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How long the interpreter waits at exit for each writer's pending rows
+EXIT_FLUSH_TIMEOUT = 5.0
+
+# Seconds a writer thread waits on an empty queue before exiting
+IDLE_TIMEOUT = 30.0
+
+# Queued by close() to stop the writer thread once everything before it is written
+_STOP = object()
+
+# Every writer that may still hold rows, so one exit hook can drain them all
+_live_writers: "weakref.WeakSet[SupabaseBatchWriter]" = weakref.WeakSet()
+
+_shared_writers: Dict[Tuple[int, str], "SupabaseBatchWriter"] = {}
+_shared_lock = threading.Lock()
+
+
+class SupabaseBatchWriter:
+    """
+    Queue rows for a Supabase table and insert them from a daemon thread.
+
+    Rows are coalesced until either `max_batch_size` rows are pending or `max_delay`
+    seconds have passed since the first pending row, then written with one
+    `insert(rows).execute()` call. If a batch fails, its rows are retried one at a time
+    so a single bad row does not drop the others. Write failures are logged and not
+    raised, so this is only suitable for optional storage.
+
+    The thread is started by the first queued row and exits after `IDLE_TIMEOUT`
+    seconds without work; pending rows are flushed at interpreter exit. Prefer
+    `get_shared_writer` over constructing writers directly.
+
+    Attributes:
+        supabase_client: Supabase client used for the inserts.
+        table_name (str): Name of the target table.
+        max_batch_size (int): Maximum number of rows per INSERT.
+        max_delay (float): Maximum seconds a row waits for more rows to join its batch.
+    """
+
+    def __init__(
+        self,
+        supabase_client: Any,
+        table_name: str,
+        max_batch_size: int = 50,
+        max_delay: float = 0.25,
+    ) -> None:
+        """
+        Initialize the writer. The background thread starts with the first row.
+
+        Args:
+            supabase_client: Supabase client used for the inserts.
+            table_name (str): Name of the target table.
+            max_batch_size (int): Maximum number of rows per INSERT. Defaults to 50.
+            max_delay (float): Maximum seconds to wait for a batch to fill. Defaults to 0.25.
+
+        Example:
+            ```python
+            writer = SupabaseBatchWriter(client, "readiness_metrics")
+            writer.put({"user_id": "user123", "readiness_score": 85})
+            writer.flush()
+            ```
+        """
+        self.supabase_client = supabase_client
+        self.table_name = table_name
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        _live_writers.add(self)
+
+    def put(self, row: Dict[str, Any]) -> None:
+        """
+        Queue a row for insertion without waiting for the database.
+
+        Args:
+            row (Dict[str, Any]): The row to insert.
+
+        Raises:
+            RuntimeError: If the writer has been closed.
+        """
+        self._enqueue(row)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write all rows queued so far and wait for the write to finish.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait. Defaults to waiting indefinitely.
+
+        Returns:
+            bool: True if every previously queued row was written (or failed and was logged)
+                before the timeout, False otherwise.
+        """
+        with self._lock:
+            closed = self._closed
+            if not closed and self._thread is None and self._queue.empty():
+                return True
+        if closed:
+            # close() already queued the stop marker behind any pending rows
+            return self._join(timeout)
+        done = threading.Event()
+        self._enqueue(done)
+        return done.wait(timeout)
+
+    def close(self, timeout: Optional[float] = None) -> bool:
+        """
+        Write any pending rows and stop the background thread.
+
+        Rows queued after close() raise RuntimeError. Closing twice is harmless.
+
+        Args:
+            timeout (Optional[float]): Maximum seconds to wait. Defaults to waiting indefinitely.
+
+        Returns:
+            bool: True if the thread finished before the timeout, False otherwise.
+        """
+        with self._lock:
+            if not self._closed:
+                self._closed = True
+                if self._thread is not None:
+                    self._queue.put(_STOP)
+            if self._thread is None:
+                return True
+        return self._join(timeout)
+
+    def _join(self, timeout: Optional[float]) -> bool:
+        """Wait for the current writer thread, if any, to exit."""
+        thread = self._thread
+        if thread is None:
+            return True
+        thread.join(timeout)
+        return not thread.is_alive()
+
+    def _enqueue(self, item: Any) -> None:
+        """Queue an item, starting the writer thread if it is not running."""
+        with self._lock:
+            if self._closed:
+                raise RuntimeError(f"Batch writer for {self.table_name} is closed")
+            self._queue.put(item)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"supabase-writer-{self.table_name}",
+                    daemon=True,
+                )
+                self._thread.start()
+
+    def _next_item(self) -> Any:
+        """
+        Wait for the next queued item.
+
+        Returns:
+            Any: The item, or `_STOP` once the queue has been idle for `IDLE_TIMEOUT`
+                seconds. The idle check holds the lock so `_enqueue` cannot slip a row
+                in after the thread has decided to exit.
+        """
+        while True:
+            try:
+                return self._queue.get(timeout=IDLE_TIMEOUT)
+            except queue.Empty:
+                with self._lock:
+                    if self._queue.empty():
+                        self._thread = None
+                        return _STOP
+
+    def _run(self) -> None:
+        """Collect queued rows into batches and write them until stopped or idle."""
+        stopping = False
+        while not stopping:
+            item = self._next_item()
+            batch: List[Dict[str, Any]] = []
+            flush_events: List[threading.Event] = []
+            deadline = time.monotonic() + self.max_delay
+            while True:
+                if item is _STOP:
+                    stopping = True
+                    break
+                if isinstance(item, threading.Event):
+                    # A flush request ends the batch so it is written immediately
+                    flush_events.append(item)
+                    break
+                batch.append(item)
+                if len(batch) >= self.max_batch_size:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+            for event in flush_events:
+                event.set()
+
+    def _write(self, rows: List[Dict[str, Any]]) -> None:
+        """
+        Insert a batch of rows in a single request, falling back to one row at a time.
+
+        Args:
+            rows (List[Dict[str, Any]]): Rows to insert.
+        """
+        table = self.supabase_client.table(self.table_name)
+        try:
+            table.insert(rows).execute()
+            return
+        except Exception as e:
+            if len(rows) == 1:
+                logger.error("Failed to write row to %s: %s", self.table_name, e)
+                return
+            logger.warning(
+                "Batch write of %d row(s) to %s failed, retrying individually: %s",
+                len(rows), self.table_name, e,
+            )
+        for row in rows:
+            try:
+                table.insert([row]).execute()
+            except Exception as e:
+                logger.error("Failed to write row to %s: %s (row: %r)", self.table_name, e, row)
+
+
+def get_shared_writer(supabase_client: Any, table_name: str) -> SupabaseBatchWriter:
+    """
+    Return the process-wide writer for a client and table, creating it on first use.
+
+    Args:
+        supabase_client: Supabase client used for the inserts.
+        table_name (str): Name of the target table.
+
+    Returns:
+        SupabaseBatchWriter: The shared writer.
+    """
+    key = (id(supabase_client), table_name)
+    with _shared_lock:
+        writer = _shared_writers.get(key)
+        # The writer holds the client, so a matching id cannot belong to a new object
+        if writer is None or writer._closed:
+            writer = SupabaseBatchWriter(supabase_client, table_name)
+            _shared_writers[key] = writer
+        return writer
+
+
+def close_shared_writers(timeout: Optional[float] = None) -> None:
+    """
+    Flush and close every shared writer and forget them.
+
+    Used at interpreter exit and by tests that need a clean registry.
+
+    Args:
+        timeout (Optional[float]): Maximum seconds to wait for each writer.
+    """
+    with _shared_lock:
+        writers = list(_shared_writers.values())
+        _shared_writers.clear()
+    for writer in writers:
+        writer.close(timeout)
+
+
+@atexit.register
+def _close_all_writers() -> None:
+    """Drain every live writer once at interpreter exit."""
+    close_shared_writers(EXIT_FLUSH_TIMEOUT)
+    for writer in list(_live_writers):
+        writer.close(EXIT_FLUSH_TIMEOUT)
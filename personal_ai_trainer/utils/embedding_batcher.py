@@ -0,0 +1,124 @@
+"""
+Request coalescing for embedding calls.
+
+This module provides a small queue-backed batcher that collects texts submitted close
+together, possibly from different threads, and embeds them with one API request.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingBatcher:
+    """
+    Coalesce concurrent single-text embedding requests into batch requests.
+
+    Texts are collected until either `max_batch_size` are pending or `max_delay` seconds
+    have passed since the first pending text, then embedded with one `embed_batch` call
+    on a daemon thread. Each caller gets a Future for its own vector. If a batch request
+    fails, its texts are retried one at a time so one bad text only fails its own caller.
+
+    Attributes:
+        embed_batch (Callable[[List[str]], Sequence[Any]]): Embeds a list of texts, returning
+            one embedding per text in input order.
+        max_batch_size (int): Maximum number of texts per batch.
+        max_delay (float): Maximum seconds a text waits for more texts to join its batch.
+    """
+
+    def __init__(
+        self,
+        embed_batch: Callable[[List[str]], Sequence[Any]],
+        max_batch_size: int = 16,
+        max_delay: float = 0.005,
+    ) -> None:
+        """
+        Initialize the batcher and start its background thread.
+
+        Args:
+            embed_batch (Callable[[List[str]], Sequence[Any]]): Embeds a list of texts.
+            max_batch_size (int): Maximum number of texts per batch. Defaults to 16.
+            max_delay (float): Maximum seconds to wait for a batch to fill. Defaults to 0.005.
+
+        Example:
+            ```python
+            batcher = EmbeddingBatcher(get_embeddings)
+            embedding = batcher.submit("optimal running cadence").result()
+            ```
+        """
+        self.embed_batch = embed_batch
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+        self._thread.start()
+
+    def submit(self, text: str) -> "Future[Any]":
+        """
+        Queue a text for embedding.
+
+        Args:
+            text (str): The text to embed.
+
+        Returns:
+            Future[Any]: Resolves to the text's embedding, or to the exception raised
+                while embedding it.
+        """
+        future: "Future[Any]" = Future()
+        self._queue.put((text, future))
+        return future
+
+    def _run(self) -> None:
+        """Collect queued texts into batches and embed them until the process exits."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._embed(batch)
+
+    def _embed(self, batch: List[Tuple[str, Future]]) -> None:
+        """
+        Embed a batch of texts in a single request and resolve their futures.
+
+        Falls back to one request per text when the batch request fails, so every future
+        is resolved with its own result or error.
+
+        Args:
+            batch (List[Tuple[str, Future]]): Queued texts with their futures.
+        """
+        try:
+            embeddings = self.embed_batch([text for text, _ in batch])
+        except Exception as e:
+            if len(batch) == 1:
+                logger.warning("Embedding request failed: %s", e)
+                batch[0][1].set_exception(e)
+                return
+            logger.warning(
+                "Embedding batch of %d text(s) failed, retrying individually: %s", len(batch), e
+            )
+            for item in batch:
+                self._embed([item])
+            return
+
+        if len(embeddings) != len(batch):
+            error = ValueError(
+                f"Embedding batch returned {len(embeddings)} result(s) for {len(batch)} text(s)"
+            )
+            logger.error("%s", error)
+            for _, future in batch:
+                future.set_exception(error)
+            return
+        for (_, future), embedding in zip(batch, embeddings):
+            future.set_result(embedding)
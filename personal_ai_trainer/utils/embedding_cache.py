@@ -0,0 +1,142 @@
+"""
+Embedding cache for OpenAI embedding calls.
+
+This module provides a two-level cache keyed by model and a hash of the input text:
+a bounded in-process LRU, optionally backed by a SQLite file so embeddings survive
+across runs.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CacheKey = Tuple[str, str]
+
+
+class EmbeddingCache:
+    """
+    Thread-safe LRU cache of embedding vectors with optional SQLite persistence.
+
+    Vectors are stored as read-only float32 arrays, so hits can be shared without copying.
+
+    Attributes:
+        maxsize (int): Maximum number of embeddings held in memory.
+        path (Optional[str]): SQLite file backing the cache, or None for memory only.
+    """
+
+    def __init__(self, maxsize: int = 10_000, path: Optional[str] = None) -> None:
+        """
+        Initialize the cache, opening (and creating) the SQLite store if a path is given.
+
+        Args:
+            maxsize (int): Maximum number of embeddings held in memory. Defaults to 10,000.
+            path (Optional[str]): SQLite file for cross-run persistence. Defaults to None.
+
+        Example:
+            ```python
+            cache = EmbeddingCache(path=".cache/embeddings.sqlite3")
+            key = cache.key("text-embedding-ada-002", "Running is good")
+            if cache.get(key) is None:
+                cache.put(key, embedding)
+            ```
+        """
+        self.maxsize = maxsize
+        self.path = path
+        self._entries: "OrderedDict[CacheKey, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        if path:
+            try:
+                directory = os.path.dirname(path)
+                if directory:
+                    os.makedirs(directory, exist_ok=True)
+                self._db = sqlite3.connect(path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS embeddings ("
+                    "model TEXT NOT NULL, digest TEXT NOT NULL, embedding BLOB NOT NULL, "
+                    "PRIMARY KEY (model, digest))"
+                )
+                self._db.commit()
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("Embedding cache at %s unavailable, using memory only: %s", path, e)
+                self._db = None
+
+    @staticmethod
+    def key(model: str, text: str) -> CacheKey:
+        """
+        Build the cache key for a text embedded with a model.
+
+        Args:
+            model (str): The embedding model name.
+            text (str): The input text.
+
+        Returns:
+            CacheKey: (model, 128-bit BLAKE2b hex digest of the text).
+        """
+        return model, hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+
+    def get(self, key: CacheKey) -> Optional[np.ndarray]:
+        """
+        Return the cached embedding for a key, or None on a miss.
+
+        Args:
+            key (CacheKey): Key from EmbeddingCache.key.
+
+        Returns:
+            Optional[np.ndarray]: The read-only float32 embedding, or None if it is not cached.
+        """
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                return embedding
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT embedding FROM embeddings WHERE model = ? AND digest = ?", key
+            ).fetchone()
+            if row is None:
+                return None
+            embedding = np.frombuffer(row[0], dtype=np.float32)
+            self._remember(key, embedding)
+            return embedding
+
+    def put(self, key: CacheKey, embedding: np.ndarray) -> None:
+        """
+        Store an embedding in memory and, if configured, on disk.
+
+        Args:
+            key (CacheKey): Key from EmbeddingCache.key.
+            embedding (np.ndarray): The float32 embedding vector; it must not be modified afterwards.
+        """
+        with self._lock:
+            self._remember(key, embedding)
+            if self._db is not None:
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO embeddings (model, digest, embedding) VALUES (?, ?, ?)",
+                        (*key, np.ascontiguousarray(embedding, dtype=np.float32).tobytes()),
+                    )
+                    self._db.commit()
+                except sqlite3.Error as e:
+                    logger.warning("Failed to persist embedding: %s", e)
+
+    def clear(self) -> None:
+        """Drop all in-memory entries. The SQLite store, if any, is left intact."""
+        with self._lock:
+            self._entries.clear()
+
+    def _remember(self, key: CacheKey, embedding: np.ndarray) -> None:
+        """Insert into the in-memory LRU, evicting the oldest entry when full. Caller holds the lock."""
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
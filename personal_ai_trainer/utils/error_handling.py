@@ -7,6 +7,7 @@ retry logic, and error conversion throughout the application.
 
 import logging
 import functools
+import random
 import time
 from typing import Callable, TypeVar, Any, Optional, Tuple, Union
 
@@ -37,7 +38,8 @@ def with_error_handling(
     Args:
         error_types (Tuple[type, ...]): Exception types to catch. Defaults to (Exception,).
         retry_count (int): Number of retries before giving up. Defaults to 0.
-        retry_delay (float): Delay between retries in seconds. Defaults to 1.0.
+        retry_delay (float): Base delay between retries in seconds; it doubles on each attempt
+            and is jittered so concurrent callers don't retry in lockstep. Defaults to 1.0.
         fallback_value (Optional[Any]): Value to return if all retries fail. Defaults to None.
         log_level (int): Logging level for errors. Defaults to logging.ERROR.
         
@@ -68,8 +70,9 @@ def with_error_handling(
                     )
                     
                     if attempt < retry_count:
-                        # Wait before retrying
-                        time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
+                        # Wait before retrying: exponential backoff with equal jitter
+                        delay = retry_delay * (2 ** attempt)
+                        time.sleep(delay / 2 + random.uniform(0, delay / 2))
                     else:
                         # All retries failed
                         if fallback_value is not None:
@@ -0,0 +1,55 @@
+"""
+JSON helpers shared across the package.
+
+Uses orjson when the optional `fast` extra is installed and the standard library
+otherwise. Both paths produce the same compact JSON text.
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+# Raised by loads for invalid input on either path; orjson's error subclasses it
+JSONDecodeError = json.JSONDecodeError
+
+
+def dumps(obj: Any) -> str:
+    """
+    Serialize an object to compact JSON text.
+
+    Non-string dict keys such as ints are converted to strings, as json.dumps does.
+
+    Args:
+        obj (Any): The object to serialize.
+
+    Returns:
+        str: The JSON text, without whitespace between items.
+
+    Raises:
+        TypeError: If the object contains a value that cannot be serialized.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, separators=(",", ":"))
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Parse JSON text.
+
+    Args:
+        data (Union[str, bytes]): The JSON document, as text or UTF-8 bytes.
+
+    Returns:
+        Any: The parsed value.
+
+    Raises:
+        JSONDecodeError: If the data is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)